@@ -1,7 +1,17 @@
 import logging
 from pathlib import Path
-from sqlalchemy import create_engine, text
+from typing import Optional
+
+from sqlalchemy import text
 from sqlalchemy.orm import sessionmaker, Session
+from src.app.sqlite_tuning import (
+    SqlitePragmas,
+    check_active_pragmas,
+    create_sqlite_engine,
+    load_preset_from_settings,
+    resolve_pragmas,
+    retune_engine,
+)
 from src.db_migration import (
     upgrade_database,
     IncompatibleDatabaseError,
@@ -60,7 +70,7 @@ def ensure_db_and_migrate(base: Path) -> tuple[Path, bool]:
     is_first_run = not db_path.exists()
     logger.info("Using database at: %s", db_path)
 
-    logger.info("Upgrading database schema (Alembic)...")
+    logger.info("Checking database schema...")
 
     try:
         upgrade_database(db_path)
@@ -77,11 +87,25 @@ def ensure_db_and_migrate(base: Path) -> tuple[Path, bool]:
     return db_path, is_first_run
 
 
-def create_session(db_path: Path) -> Session:
-    """Create and return a SQLAlchemy session."""
-    engine = create_engine(f"sqlite:///{db_path}")
+def create_session(db_path: Path, pragmas: Optional[SqlitePragmas] = None) -> Session:
+    """
+    Create and return a SQLAlchemy session on a tuned SQLite engine.
+
+    Without explicit pragmas the preset stored in settings is used: it is
+    read through the new session (opened with the default preset) and the
+    engine is retuned if it differs. The values SQLite actually applied are
+    logged and kept in ``session.info["sqlite_pragmas"]``.
+    """
+    configured = pragmas
+    pragmas = resolve_pragmas(db_path, pragmas)
+    engine = create_sqlite_engine(db_path, pragmas)
     SessionLocal = sessionmaker(bind=engine)
-    return SessionLocal()
+    session = SessionLocal()
+    if configured is None:
+        pragmas = resolve_pragmas(db_path, load_preset_from_settings(session))
+        retune_engine(engine, pragmas)
+    session.info["sqlite_pragmas"] = check_active_pragmas(engine, pragmas)
+    return session
 
 
 def seed_cabinet_templates_if_first_run(session: Session, base: Path) -> None:
@@ -0,0 +1,213 @@
+"""
+Connect-time SQLite tuning.
+
+The application database is opened through create_sqlite_engine(), which
+applies a set of PRAGMAs to every new DB-API connection: journal mode,
+synchronous level, memory-mapped I/O, page cache size and temp store.
+Presets are selected with the "db_performance_preset" setting and take
+effect on the next start.
+
+WAL and mmap rely on shared memory and byte-range locks that network file
+systems do not implement reliably, so for databases on a network share the
+journal falls back to TRUNCATE and mmap is disabled.
+"""
+
+import logging
+import sqlite3
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+PRESET_SETTING_KEY = "db_performance_preset"
+
+PRESET_SAFE = "Bezpieczny"
+PRESET_BALANCED = "Zrównoważony"
+PRESET_FAST = "Wydajny"
+DEFAULT_PRESET = PRESET_BALANCED
+
+
+@dataclass(frozen=True)
+class SqlitePragmas:
+    """PRAGMA values applied to every new connection."""
+
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    # Bytes of the database file mapped into memory (0 = disabled).
+    mmap_size: int = 64 * 1024 * 1024
+    # Negative values are KiB, as in SQLite's own PRAGMA cache_size.
+    cache_size: int = -16000
+    temp_store: str = "MEMORY"
+
+    def for_network_share(self) -> "SqlitePragmas":
+        """Variant that is safe on SMB/NFS shares."""
+        journal_mode = self.journal_mode
+        if journal_mode.upper() == "WAL":
+            journal_mode = "TRUNCATE"
+        return replace(self, journal_mode=journal_mode, mmap_size=0)
+
+
+PRESETS: Dict[str, SqlitePragmas] = {
+    PRESET_SAFE: SqlitePragmas(
+        journal_mode="DELETE",
+        synchronous="FULL",
+        mmap_size=0,
+        cache_size=-2000,
+        temp_store="DEFAULT",
+    ),
+    PRESET_BALANCED: SqlitePragmas(),
+    PRESET_FAST: SqlitePragmas(
+        mmap_size=256 * 1024 * 1024,
+        cache_size=-64000,
+    ),
+}
+
+# Numeric values reported by PRAGMA synchronous / temp_store.
+_SYNCHRONOUS_NAMES = {0: "OFF", 1: "NORMAL", 2: "FULL", 3: "EXTRA"}
+_TEMP_STORE_NAMES = {0: "DEFAULT", 1: "FILE", 2: "MEMORY"}
+
+
+def is_network_path(db_path: Path) -> bool:
+    """Best-effort check whether db_path lives on a network share."""
+    path = str(db_path)
+    if path.startswith(("\\\\", "//")):
+        return True
+    try:
+        resolved = str(Path(db_path).resolve())
+    except OSError:
+        return False
+    # Mapped drive letters resolve to their UNC path on Windows.
+    return resolved.startswith(("\\\\", "//"))
+
+
+def get_preset(name: Optional[str]) -> SqlitePragmas:
+    """Return the named preset, falling back to the default one."""
+    if name not in PRESETS:
+        if name:
+            logger.warning("Unknown database preset %r, using %s", name, DEFAULT_PRESET)
+        name = DEFAULT_PRESET
+    return PRESETS[name]
+
+
+def load_preset_from_settings(session: Session) -> SqlitePragmas:
+    """Read the configured preset from the settings table."""
+    from src.services.settings_service import SettingsService
+
+    try:
+        name = SettingsService(session).get_setting_value(
+            PRESET_SETTING_KEY, DEFAULT_PRESET
+        )
+    except Exception as exc:
+        logger.warning("Failed to read database preset: %s", exc)
+        name = DEFAULT_PRESET
+    finally:
+        # Return the connection to the pool before it may be retuned
+        session.rollback()
+    return get_preset(name)
+
+
+def _apply_pragmas(dbapi_connection: sqlite3.Connection, pragmas: SqlitePragmas):
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"PRAGMA journal_mode={pragmas.journal_mode}")
+        cursor.execute(f"PRAGMA synchronous={pragmas.synchronous}")
+        cursor.execute(f"PRAGMA mmap_size={int(pragmas.mmap_size)}")
+        cursor.execute(f"PRAGMA cache_size={int(pragmas.cache_size)}")
+        cursor.execute(f"PRAGMA temp_store={pragmas.temp_store}")
+    finally:
+        cursor.close()
+
+
+def resolve_pragmas(
+    db_path: Path, pragmas: Optional[SqlitePragmas] = None
+) -> SqlitePragmas:
+    """Pragmas to use for db_path, adjusted for network shares."""
+    pragmas = pragmas or PRESETS[DEFAULT_PRESET]
+    if is_network_path(db_path):
+        logger.info("Database is on a network share; disabling WAL and mmap")
+        pragmas = pragmas.for_network_share()
+    return pragmas
+
+
+# Pragmas applied to new connections of engines from create_sqlite_engine().
+_engine_pragmas: "WeakKeyDictionary[Engine, SqlitePragmas]" = WeakKeyDictionary()
+
+
+def create_sqlite_engine(db_path: Path, pragmas: SqlitePragmas) -> Engine:
+    """Create an engine for db_path whose connections get `pragmas` applied."""
+    engine = create_engine(f"sqlite:///{db_path}")
+    _engine_pragmas[engine] = pragmas
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, _connection_record):
+        _apply_pragmas(dbapi_connection, _engine_pragmas[engine])
+
+    return engine
+
+
+def retune_engine(engine: Engine, pragmas: SqlitePragmas) -> None:
+    """
+    Switch an engine from create_sqlite_engine() to other pragmas.
+
+    Pooled connections are dropped, so every connection opened afterwards
+    gets the new values. Call it while no connection is checked out.
+    """
+    if _engine_pragmas.get(engine) == pragmas:
+        return
+    _engine_pragmas[engine] = pragmas
+    engine.dispose()
+
+
+def read_active_pragmas(engine: Engine) -> Dict[str, Any]:
+    """Query the PRAGMA values actually in effect on a connection of engine."""
+    with engine.connect() as connection:
+
+        def pragma(name: str):
+            return connection.execute(text(f"PRAGMA {name}")).scalar()
+
+        return {
+            "journal_mode": str(pragma("journal_mode")).upper(),
+            "synchronous": _SYNCHRONOUS_NAMES.get(pragma("synchronous"), "?"),
+            "mmap_size": pragma("mmap_size") or 0,
+            "cache_size": pragma("cache_size"),
+            "temp_store": _TEMP_STORE_NAMES.get(pragma("temp_store"), "?"),
+        }
+
+
+def pragma_mismatches(
+    active: Dict[str, Any], expected: SqlitePragmas
+) -> Dict[str, Tuple[Any, Any]]:
+    """Requested settings SQLite did not apply, as {name: (active, requested)}."""
+    requested = {
+        "journal_mode": expected.journal_mode.upper(),
+        "synchronous": expected.synchronous.upper(),
+        "temp_store": expected.temp_store.upper(),
+    }
+    return {
+        key: (active[key], value)
+        for key, value in requested.items()
+        if active[key] != value
+    }
+
+
+def check_active_pragmas(engine: Engine, expected: SqlitePragmas) -> Dict[str, Any]:
+    """
+    Log the active PRAGMA values and warn where SQLite did not apply a request.
+
+    SQLite silently keeps the old journal mode (e.g. WAL on a read-only or
+    network file) or caps mmap_size at its compile-time limit.
+    """
+    active = read_active_pragmas(engine)
+    logger.info(
+        "SQLite settings: %s",
+        ", ".join(f"{key}={value}" for key, value in active.items()),
+    )
+    for key, (value, requested) in pragma_mismatches(active, expected).items():
+        logger.warning("SQLite %s is %s, requested %s", key, value, requested)
+    return active
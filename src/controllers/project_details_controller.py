@@ -8,12 +8,13 @@ Handles:
 - View state management
 """
 
+from dataclasses import replace
 from typing import List
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, QTimer, Signal
 from sqlalchemy.orm import Session
 
-from src.db_schema.orm_models import Project, ProjectCabinet
-from src.services.project_service import ProjectService
+from src.db_schema.orm_models import Project
+from src.services.project_service import CabinetListRow, ProjectService
 from src.domain.sorting import sort_cabinets, validate_sequence_unique
 
 
@@ -21,22 +22,66 @@ class ProjectDetailsController(QObject):
     """Controller for project details dialog - handles cabinet management."""
 
     # Signals for communication with view
-    data_loaded = Signal(list)  # List[ProjectCabinet]
+    data_loaded = Signal(list)  # List[CabinetListRow]
     data_error = Signal(str)  # Error message
-    cabinet_updated = Signal(object)  # Updated ProjectCabinet
+    cabinet_updated = Signal(object)  # Updated CabinetListRow
     validation_error = Signal(str)  # Validation error message
 
+    # Stepper edits arriving within this window are committed together.
+    COMMIT_WINDOW_MS = 400
+
     def __init__(self, session: Session, project: Project, parent=None):
         super().__init__(parent)
         self.session = session
         self.project = project
         self.project_service = ProjectService(session)
-        self.cabinets: List[ProjectCabinet] = []
+        self.cabinets: List[CabinetListRow] = []
+
+        self._unit_of_work_open = False
+        self._commit_timer = QTimer(self)
+        self._commit_timer.setSingleShot(True)
+        self._commit_timer.setInterval(self.COMMIT_WINDOW_MS)
+        self._commit_timer.timeout.connect(self.commit_pending_changes)
+        self.project_service.on_unit_of_work_interrupted(
+            self._on_unit_of_work_interrupted
+        )
+
+    def _defer_commit(self):
+        """Run the next service call inside the open unit of work."""
+        if not self._unit_of_work_open:
+            self.project_service.begin_unit_of_work()
+            self._unit_of_work_open = True
+        self._commit_timer.start()
+
+    def commit_pending_changes(self) -> bool:
+        """Commit coalesced sequence/quantity edits, if any."""
+        self._commit_timer.stop()
+        if not self._unit_of_work_open:
+            return True
+
+        self._unit_of_work_open = False
+        try:
+            self.project_service.commit_unit_of_work()
+            return True
+        except Exception as e:
+            self.data_error.emit(f"Błąd podczas zapisywania zmian: {str(e)}")
+            self.load_data()
+            return False
+
+    def _on_unit_of_work_interrupted(self):
+        """Another service committed/rolled back the session mid-window."""
+        if not self._unit_of_work_open:
+            return
+        self._commit_timer.stop()
+        self._unit_of_work_open = False
+        # Reload after the session finished ending its transaction; the
+        # coalesced edits may have been rolled back
+        QTimer.singleShot(0, self.load_data)
 
     def load_data(self):
         """Load project cabinets and emit sorted data."""
         try:
-            self.cabinets = self.project_service.list_cabinets(self.project.id)
+            self.cabinets = self.project_service.list_cabinet_rows(self.project.id)
             ordered_cabinets = sort_cabinets(self.cabinets)
             self.data_loaded.emit(ordered_cabinets)
         except Exception as e:
@@ -68,14 +113,9 @@ class ProjectDetailsController(QObject):
                 # Sequence hasn't changed, no need to update
                 return
 
-            # Validate sequence uniqueness - create temporary cabinet with proper project_id
+            # Validate sequence uniqueness against the other cabinets
             temp_cabinets = [c for c in self.cabinets if c.id != cabinet_id]
-            temp_cabinet = ProjectCabinet(
-                id=cabinet_id,
-                project_id=current_cabinet.project_id,
-                sequence_number=new_sequence,
-            )
-            temp_cabinets.append(temp_cabinet)
+            temp_cabinets.append(replace(current_cabinet, sequence_number=new_sequence))
 
             validation_errors = validate_sequence_unique(temp_cabinets)
             if validation_errors:
@@ -84,6 +124,7 @@ class ProjectDetailsController(QObject):
 
             # Update cabinet via service
             try:
+                self._defer_commit()
                 updated_cabinet = self.project_service.update_cabinet(
                     cabinet_id, sequence_number=new_sequence
                 )
@@ -93,6 +134,7 @@ class ProjectDetailsController(QObject):
                     return
 
                 # Update local cache
+                updated_cabinet = self.project_service.get_cabinet_row(cabinet_id)
                 self._replace_cabinet_in_cache(updated_cabinet)
 
                 # Re-sort and emit new order
@@ -150,6 +192,7 @@ class ProjectDetailsController(QObject):
 
             # Update cabinet via service
             try:
+                self._defer_commit()
                 updated_cabinet = self.project_service.update_cabinet(
                     cabinet_id, quantity=new_quantity
                 )
@@ -159,6 +202,7 @@ class ProjectDetailsController(QObject):
                     return
 
                 # Update local cache
+                updated_cabinet = self.project_service.get_cabinet_row(cabinet_id)
                 self._replace_cabinet_in_cache(updated_cabinet)
 
                 # Re-sort and emit new order
@@ -188,6 +232,7 @@ class ProjectDetailsController(QObject):
         logger = logging.getLogger(__name__)
         logger.debug(f"[CONTROLLER] on_cabinet_deleted: cabinet_id={cabinet_id}")
         try:
+            self.commit_pending_changes()
             success = self.project_service.delete_cabinet(cabinet_id)
             logger.debug(f"[CONTROLLER] delete_cabinet success={success}")
             if not success:
@@ -225,13 +270,14 @@ class ProjectDetailsController(QObject):
         logger = logging.getLogger(__name__)
         logger.debug(f"[CONTROLLER] on_cabinet_duplicated: cabinet_id={cabinet_id}")
         try:
+            self.commit_pending_changes()
             new_cabinet = self.project_service.duplicate_cabinet(cabinet_id)
             if not new_cabinet:
                 self.validation_error.emit("Nie udało się zduplikować szafy")
                 return
 
             # Add to local cache
-            self.cabinets.append(new_cabinet)
+            self.cabinets.append(self.project_service.get_cabinet_row(new_cabinet.id))
             logger.debug(
                 f"[CONTROLLER] cabinet duplicated: new_id={new_cabinet.id}, seq={new_cabinet.sequence_number}"
             )
@@ -248,7 +294,7 @@ class ProjectDetailsController(QObject):
             logger.exception(f"[CONTROLLER] duplicate error: {e}")
             self.validation_error.emit(error_msg)
 
-    def _replace_cabinet_in_cache(self, updated_cabinet: ProjectCabinet):
+    def _replace_cabinet_in_cache(self, updated_cabinet: CabinetListRow):
         """Replace cabinet in local cache with updated version."""
         for i, cabinet in enumerate(self.cabinets):
             if cabinet.id == updated_cabinet.id:
@@ -262,6 +308,8 @@ class ProjectDetailsController(QObject):
     def add_cabinet(self, project_id: int, **kwargs):
         """Add a cabinet to the project."""
         try:
+            self.commit_pending_changes()
+
             # Check if this is a custom cabinet with parts
             if "parts" in kwargs:
                 return self._add_custom_cabinet_with_parts(project_id, **kwargs)
@@ -283,7 +331,6 @@ class ProjectDetailsController(QObject):
             }
 
             new_cabinet = self.project_service.add_cabinet(project_id, **cabinet_data)
-            self.cabinets.append(new_cabinet)
             self.load_data()
             return new_cabinet
 
@@ -298,55 +345,52 @@ class ProjectDetailsController(QObject):
             # Create custom cabinet WITHOUT creating CabinetTemplate (type_id=NULL)
             next_sequence = self.get_next_cabinet_sequence(project_id)
 
-            cabinet_data = {
-                "sequence_number": next_sequence,
-                "type_id": None,  # Custom cabinet - no template
-                "body_color": kwargs.get("body_color", "#ffffff"),
-                "front_color": kwargs.get("front_color", "#ffffff"),
-                "handle_type": kwargs.get("handle_type", "Standardowy"),
-                "quantity": kwargs.get("quantity", 1),
-            }
+            # Cabinet and its calculated parts are written in one transaction
+            new_cabinet = self.project_service.add_custom_cabinet(
+                project_id,
+                sequence_number=next_sequence,
+                body_color=kwargs.get("body_color", "#ffffff"),
+                front_color=kwargs.get("front_color", "#ffffff"),
+                handle_type=kwargs.get("handle_type", "Standardowy"),
+                quantity=kwargs.get("quantity", 1),
+                custom_parts=kwargs.get("parts", []),
+            )
 
-            # Create the cabinet first
-            new_cabinet = self.project_service.add_cabinet(project_id, **cabinet_data)
+            self.load_data()
+            return new_cabinet
 
-            # Now add all the calculated parts to ProjectCabinetPart table (new architecture)
-            from src.db_schema.orm_models import ProjectCabinetPart
-
-            for part_data in kwargs.get("parts", []):
-                custom_part = ProjectCabinetPart(
-                    project_cabinet_id=new_cabinet.id,
-                    part_name=part_data["part_name"],
-                    height_mm=part_data["height_mm"],
-                    width_mm=part_data["width_mm"],
-                    pieces=part_data["pieces"],
-                    material=part_data.get("material"),
-                    wrapping=part_data.get("wrapping"),
-                    comments=part_data.get("comments"),
-                )
-                self.session.add(custom_part)
+        except Exception as e:
+            error_msg = f"Błąd podczas dodawania niestandardowej szafy: {str(e)}"
+            self.validation_error.emit(error_msg)
+            raise
 
-            # Commit all parts
-            self.session.commit()
+    def add_catalog_cabinets(self, specs):
+        """
+        Add several catalog cabinets (CabinetSpec list) in one transaction.
 
-            self.cabinets.append(new_cabinet)
+        Sequence numbers continue after the current last cabinet and the
+        view is refreshed once, after all cabinets are written.
+        """
+        try:
+            self.commit_pending_changes()
+            new_cabinets = self.project_service.add_cabinets(self.project.id, specs)
             self.load_data()
-            return new_cabinet
+            return new_cabinets
 
         except Exception as e:
-            self.session.rollback()
-            error_msg = f"Błąd podczas dodawania niestandardowej szafy: {str(e)}"
+            error_msg = f"Błąd podczas dodawania szaf z katalogu: {str(e)}"
             self.validation_error.emit(error_msg)
             raise
 
     def add_catalog_cabinet(self, cabinet_data):
         """Add a cabinet from catalog to the project."""
         try:
+            self.commit_pending_changes()
+
             # Handle both dictionary and object inputs
             if hasattr(cabinet_data, "__dict__"):
                 # It's an object (like ProjectCabinet), already added to database
-                # Just update local cache and reload
-                self.cabinets.append(cabinet_data)
+                # Just reload the display rows
                 self.load_data()
                 return cabinet_data
             else:
@@ -378,9 +422,6 @@ class ProjectDetailsController(QObject):
                     self.project.id, **cabinet_kwargs
                 )
 
-                # Update local cache
-                self.cabinets.append(new_cabinet)
-
                 # Reload data to refresh view
                 self.load_data()
 
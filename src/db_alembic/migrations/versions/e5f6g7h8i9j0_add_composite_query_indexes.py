@@ -0,0 +1,60 @@
+"""Add composite indexes for project and color queries
+
+Revision ID: e5f6g7h8i9j0
+Revises: d4e5f6g7h8i9
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e5f6g7h8i9j0"
+down_revision: Union[str, Sequence[str], None] = "d4e5f6g7h8i9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace single-column color indexes with covering composite ones."""
+    with op.batch_alter_table("projects", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_projects_created_at", ["created_at", "id"], unique=False
+        )
+
+    with op.batch_alter_table("cabinet_colors", schema=None) as batch_op:
+        batch_op.drop_index("ix_cabinet_colors_source")
+        batch_op.drop_index("ix_cabinet_colors_last_used_at")
+        batch_op.create_index(
+            "ix_cabinet_colors_recent",
+            [
+                "is_active",
+                sa.text("last_used_at DESC"),
+                sa.text("usage_count DESC"),
+                "name",
+            ],
+            unique=False,
+        )
+        batch_op.create_index(
+            "ix_cabinet_colors_active_source_name",
+            ["is_active", "source", "name"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    """Restore the previous color indexes."""
+    with op.batch_alter_table("cabinet_colors", schema=None) as batch_op:
+        batch_op.drop_index("ix_cabinet_colors_active_source_name")
+        batch_op.drop_index("ix_cabinet_colors_recent")
+        batch_op.create_index(
+            "ix_cabinet_colors_last_used_at", ["last_used_at"], unique=False
+        )
+        batch_op.create_index("ix_cabinet_colors_source", ["source"], unique=False)
+
+    with op.batch_alter_table("projects", schema=None) as batch_op:
+        batch_op.drop_index("ix_projects_created_at")
@@ -0,0 +1,102 @@
+"""Add project full-text search index
+
+Revision ID: f6g7h8i9j0k1
+Revises: e5f6g7h8i9j0
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+
+import logging
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f6g7h8i9j0k1"
+down_revision: Union[str, Sequence[str], None] = "e5f6g7h8i9j0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+logger = logging.getLogger(__name__)
+
+# SQL as of this revision; "ł" is folded to "l" as unicode61 keeps it apart.
+_INSERT_NEW = """
+INSERT INTO projects_fts(rowid, name, order_number, client, kitchen_type, notes)
+VALUES (
+    new.id,
+    replace(replace(coalesce(new.name, ''), 'ł', 'l'), 'Ł', 'L'),
+    replace(replace(coalesce(new.order_number, ''), 'ł', 'l'), 'Ł', 'L'),
+    replace(replace(
+        coalesce(new.client_name, '') || ' ' || coalesce(new.client_address, '')
+        || ' ' || coalesce(new.client_phone, '') || ' ' || coalesce(new.client_email, ''),
+        'ł', 'l'), 'Ł', 'L'),
+    replace(replace(coalesce(new.kitchen_type, ''), 'ł', 'l'), 'Ł', 'L'),
+    replace(replace(
+        coalesce(new.blaty_note, '') || ' ' || coalesce(new.cokoly_note, '')
+        || ' ' || coalesce(new.uwagi_note, '') || ' ' || coalesce(new.flag_notes, ''),
+        'ł', 'l'), 'Ł', 'L')
+);
+"""
+
+CREATE_STATEMENTS = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS projects_fts USING fts5("
+    "name, order_number, client, kitchen_type, notes, "
+    "tokenize = 'unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS projects_fts_ai AFTER INSERT ON projects "
+    f"BEGIN {_INSERT_NEW} END",
+    "CREATE TRIGGER IF NOT EXISTS projects_fts_ad AFTER DELETE ON projects "
+    "BEGIN DELETE FROM projects_fts WHERE rowid = old.id; END",
+    "CREATE TRIGGER IF NOT EXISTS projects_fts_au AFTER UPDATE ON projects "
+    "BEGIN DELETE FROM projects_fts WHERE rowid = old.id; "
+    f"{_INSERT_NEW} END",
+]
+
+REBUILD_STATEMENTS = [
+    "DELETE FROM projects_fts",
+    """
+INSERT INTO projects_fts(rowid, name, order_number, client, kitchen_type, notes)
+SELECT
+    p.id,
+    replace(replace(coalesce(p.name, ''), 'ł', 'l'), 'Ł', 'L'),
+    replace(replace(coalesce(p.order_number, ''), 'ł', 'l'), 'Ł', 'L'),
+    replace(replace(
+        coalesce(p.client_name, '') || ' ' || coalesce(p.client_address, '')
+        || ' ' || coalesce(p.client_phone, '') || ' ' || coalesce(p.client_email, ''),
+        'ł', 'l'), 'Ł', 'L'),
+    replace(replace(coalesce(p.kitchen_type, ''), 'ł', 'l'), 'Ł', 'L'),
+    replace(replace(
+        coalesce(p.blaty_note, '') || ' ' || coalesce(p.cokoly_note, '')
+        || ' ' || coalesce(p.uwagi_note, '') || ' ' || coalesce(p.flag_notes, ''),
+        'ł', 'l'), 'Ł', 'L')
+FROM projects AS p
+""",
+]
+
+DROP_STATEMENTS = [
+    "DROP TRIGGER IF EXISTS projects_fts_au",
+    "DROP TRIGGER IF EXISTS projects_fts_ad",
+    "DROP TRIGGER IF EXISTS projects_fts_ai",
+    "DROP TABLE IF EXISTS projects_fts",
+]
+
+
+def upgrade() -> None:
+    """Create the FTS5 table with its sync triggers and index existing projects."""
+    connection = op.get_bind()
+    try:
+        for statement in CREATE_STATEMENTS:
+            connection.exec_driver_sql(statement)
+    except Exception as exc:
+        # SQLite without FTS5: project search falls back to LIKE matching
+        logger.warning("Project full-text search unavailable: %s", exc)
+        return
+    for statement in REBUILD_STATEMENTS:
+        connection.exec_driver_sql(statement)
+
+
+def downgrade() -> None:
+    """Drop the FTS5 table and its triggers."""
+    connection = op.get_bind()
+    for statement in DROP_STATEMENTS:
+        connection.exec_driver_sql(statement)
@@ -0,0 +1,68 @@
+"""Add cached display dimensions and name to project cabinets
+
+Revision ID: g7h8i9j0k1l2
+Revises: f6g7h8i9j0k1
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "g7h8i9j0k1l2"
+down_revision: Union[str, Sequence[str], None] = "f6g7h8i9j0k1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Backfill as of this revision: largest positive part width/height, catalog
+# name from the parts' calculation context, and the number of parts.
+BACKFILL_SQL = """
+UPDATE project_cabinets SET
+    display_width_mm = (
+        SELECT max(CASE WHEN p.width_mm > 0 THEN p.width_mm END)
+        FROM project_cabinet_parts AS p
+        WHERE p.project_cabinet_id = project_cabinets.id
+    ),
+    display_height_mm = (
+        SELECT max(CASE WHEN p.height_mm > 0 THEN p.height_mm END)
+        FROM project_cabinet_parts AS p
+        WHERE p.project_cabinet_id = project_cabinets.id
+    ),
+    display_name = (
+        SELECT max(json_extract(p.calc_context_json, '$.template_name'))
+            || ' + niestandardowa'
+        FROM project_cabinet_parts AS p
+        WHERE p.project_cabinet_id = project_cabinets.id
+    ),
+    part_count = (
+        SELECT count(*)
+        FROM project_cabinet_parts AS p
+        WHERE p.project_cabinet_id = project_cabinets.id
+    )
+"""
+
+
+def upgrade() -> None:
+    """Add the display summary columns and fill them from existing parts."""
+    with op.batch_alter_table("project_cabinets", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("display_width_mm", sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column("display_height_mm", sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column("display_name", sa.String(255), nullable=True))
+        batch_op.add_column(
+            sa.Column("part_count", sa.Integer(), nullable=False, server_default="0")
+        )
+
+    op.execute(BACKFILL_SQL)
+
+
+def downgrade() -> None:
+    """Drop the display summary columns."""
+    with op.batch_alter_table("project_cabinets", schema=None) as batch_op:
+        batch_op.drop_column("part_count")
+        batch_op.drop_column("display_name")
+        batch_op.drop_column("display_height_mm")
+        batch_op.drop_column("display_width_mm")
@@ -0,0 +1,34 @@
+"""Drop the covering index of the removed color name listing
+
+Revision ID: h8i9j0k1l2m3
+Revises: g7h8i9j0k1l2
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "h8i9j0k1l2m3"
+down_revision: Union[str, Sequence[str], None] = "g7h8i9j0k1l2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Color completion searches an in-memory index; nothing reads this one."""
+    with op.batch_alter_table("cabinet_colors", schema=None) as batch_op:
+        batch_op.drop_index("ix_cabinet_colors_active_source_name")
+
+
+def downgrade() -> None:
+    """Restore the covering index."""
+    with op.batch_alter_table("cabinet_colors", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_cabinet_colors_active_source_name",
+            ["is_active", "source", "name"],
+            unique=False,
+        )
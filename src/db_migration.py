@@ -1,14 +1,16 @@
 from pathlib import Path
 import logging
-
-from alembic.config import Config
-from alembic import command
-from alembic.script import ScriptDirectory
-from alembic.runtime.migration import MigrationContext
-from sqlalchemy import create_engine, text
+import sqlite3
+import time
+from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Newest migration revision shipped with this build. Databases already at
+# this revision are opened without importing Alembic at all; a test keeps
+# it equal to the head of src/db_alembic/migrations.
+SCHEMA_HEAD_REVISION = "h8i9j0k1l2m3"
+
 
 class IncompatibleDatabaseError(Exception):
     """Raised when database schema is incompatible with current migrations."""
@@ -18,8 +20,10 @@ class IncompatibleDatabaseError(Exception):
         self.db_path = db_path
 
 
-def get_alembic_config(db_path: Path) -> Config:
+def get_alembic_config(db_path: Path):
     """Get Alembic config pointing to the given database."""
+    from alembic.config import Config
+
     ini_path = Path(__file__).resolve().parent.parent / "alembic.ini"
     config = Config(str(ini_path))
     db_url = f"sqlite:///{db_path}"
@@ -37,6 +41,10 @@ def check_database_compatibility(db_path: Path) -> tuple[bool, str]:
     if not db_path.exists():
         return True, "No database exists yet"
 
+    from alembic.runtime.migration import MigrationContext
+    from alembic.script import ScriptDirectory
+    from sqlalchemy import create_engine, text
+
     engine = None
     try:
         config = get_alembic_config(db_path)
@@ -95,17 +103,59 @@ def check_database_compatibility(db_path: Path) -> tuple[bool, str]:
             engine.dispose()
 
 
+def read_schema_revision(db_path: Path) -> Optional[str]:
+    """
+    Revision stored in alembic_version, read with plain sqlite3.
+
+    Returns None when the file, the table or a readable revision is missing.
+    """
+    if not db_path.exists():
+        return None
+    try:
+        conn = sqlite3.connect(str(db_path))
+    except sqlite3.Error:
+        return None
+    try:
+        has_table = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='alembic_version'"
+        ).fetchone()
+        if not has_table:
+            return None
+        row = conn.execute("SELECT version_num FROM alembic_version").fetchone()
+        return row[0] if row else None
+    except sqlite3.Error as e:
+        logger.debug("Could not read schema revision: %s", e)
+        return None
+    finally:
+        conn.close()
+
+
 def upgrade_database(db_path: Path) -> None:
     """
     Run Alembic migrations to bring the SQLite database at db_path up to date.
     Raises IncompatibleDatabaseError if migration cannot proceed.
+
+    When the stored revision already equals SCHEMA_HEAD_REVISION nothing
+    is imported or run.
     """
+    if read_schema_revision(db_path) == SCHEMA_HEAD_REVISION:
+        logger.debug("Database schema at %s, skipping Alembic", SCHEMA_HEAD_REVISION)
+        return
+
+    started = time.perf_counter()
+
     # Check compatibility first
     is_compatible, reason = check_database_compatibility(db_path)
     if not is_compatible:
         raise IncompatibleDatabaseError(reason, db_path)
 
+    from alembic import command
+
     config = get_alembic_config(db_path)
 
     # Apply all migrations
     command.upgrade(config, "head")
+    logger.info(
+        "Database schema upgraded to head in %.0f ms",
+        (time.perf_counter() - started) * 1000,
+    )
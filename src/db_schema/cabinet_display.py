@@ -0,0 +1,63 @@
+"""
+Display summary of project cabinets, stored on `project_cabinets`.
+
+Cards and the cabinet table show a width x height inferred from the parts
+snapshot and, for cabinets without a catalog type, a name taken from the
+calculation context of the parts. These values are computed here once, when
+the parts change, so listing a project reads plain columns instead of
+aggregating the parts of every cabinet on each render.
+
+Width/height are the largest positive part dimension: parts of one cabinet
+either share a dimension or the largest one is the cabinet's outer size.
+"""
+
+from typing import Iterable, Optional
+
+from sqlalchemy import bindparam, text
+
+DISPLAY_COLUMNS = (
+    "display_width_mm",
+    "display_height_mm",
+    "display_name",
+    "part_count",
+)
+
+_PARTS = (
+    "FROM project_cabinet_parts AS p WHERE p.project_cabinet_id = project_cabinets.id"
+)
+
+_REFRESH_SQL = f"""
+UPDATE project_cabinets SET
+    display_width_mm = (
+        SELECT max(CASE WHEN p.width_mm > 0 THEN p.width_mm END) {_PARTS}
+    ),
+    display_height_mm = (
+        SELECT max(CASE WHEN p.height_mm > 0 THEN p.height_mm END) {_PARTS}
+    ),
+    display_name = (
+        SELECT max(json_extract(p.calc_context_json, '$.template_name'))
+            || ' + niestandardowa' {_PARTS}
+    ),
+    part_count = (SELECT count(*) {_PARTS})
+"""
+
+
+def refresh_cabinet_display(
+    connection, cabinet_ids: Optional[Iterable[int]] = None
+) -> None:
+    """
+    Recompute the display columns from the parts snapshot in one UPDATE.
+
+    cabinet_ids=None refreshes every cabinet (e.g. after a migration).
+    """
+    if cabinet_ids is None:
+        connection.execute(text(_REFRESH_SQL))
+        return
+
+    ids = sorted(set(cabinet_ids))
+    if not ids:
+        return
+    statement = text(_REFRESH_SQL + " WHERE id IN :ids").bindparams(
+        bindparam("ids", expanding=True)
+    )
+    connection.execute(statement, {"ids": ids})
@@ -1,4 +1,5 @@
 from sqlalchemy import (
+    event,
     Column,
     Integer,
     String,
@@ -15,6 +16,8 @@ from sqlalchemy import (
 from sqlalchemy.orm import relationship, declarative_base
 from sqlalchemy.sql import func
 
+from src.db_schema.project_search import create_project_search
+
 Base = declarative_base()
 
 
@@ -85,8 +88,14 @@ class CabinetColor(Base):
     __table_args__ = (
         CheckConstraint("source IN ('system', 'user')", name="ck_cabinet_color_source"),
         CheckConstraint("usage_count >= 0", name="ck_cabinet_color_usage_nonneg"),
-        Index("ix_cabinet_colors_last_used_at", "last_used_at"),
-        Index("ix_cabinet_colors_source", "source"),
+        # Covering index for list_recent(): active colors by latest usage.
+        Index(
+            "ix_cabinet_colors_recent",
+            is_active,
+            last_used_at.desc(),
+            usage_count.desc(),
+            name,
+        ),
     )
 
 
@@ -131,7 +140,18 @@ class Project(Base):
         "ProjectCabinet", back_populates="project", cascade="all, delete-orphan"
     )
 
-    __table_args__ = (UniqueConstraint("order_number", name="uq_project_order"),)
+    __table_args__ = (
+        UniqueConstraint("order_number", name="uq_project_order"),
+        # list_projects() orders by creation time, newest first.
+        Index("ix_projects_created_at", "created_at", "id"),
+    )
+
+
+@event.listens_for(Project.__table__, "after_create")
+def _create_project_search(target, connection, **kw):
+    """Schemas built with create_all() get the full-text index as well."""
+    if connection.dialect.name == "sqlite":
+        create_project_search(connection)
 
 
 class CabinetTemplate(Base):
@@ -429,6 +449,13 @@ class ProjectCabinet(Base):
     handle_type = Column(String(120), nullable=False)
     quantity = Column(Integer, nullable=False, default=1)
 
+    # Summary of the parts snapshot for cards/tables, kept up to date by
+    # ProjectService (see src/db_schema/cabinet_display.py).
+    display_width_mm = Column(Integer, nullable=True)
+    display_height_mm = Column(Integer, nullable=True)
+    display_name = Column(String(255), nullable=True)
+    part_count = Column(Integer, nullable=False, default=0, server_default="0")
+
     created_at = Column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
@@ -0,0 +1,127 @@
+"""
+Full-text index of projects (SQLite FTS5).
+
+`projects_fts` holds one row per project (rowid = projects.id) with the
+searchable text split into weighted columns. Triggers on `projects` keep it
+in sync, so every write path - services, migrations, raw SQL - updates it.
+
+Text is folded for Polish: the unicode61 tokenizer lowercases and strips
+combining diacritics (ą -> a, ż -> z, ...), but "ł" is a separate letter
+rather than "l" with a diacritic, so it is replaced both in the indexed text
+and in queries.
+"""
+
+import logging
+import re
+from typing import List
+
+logger = logging.getLogger(__name__)
+
+FTS_TABLE = "projects_fts"
+
+# (FTS column, source columns of `projects`, bm25 weight)
+_COLUMNS = (
+    ("name", ("name",), 10.0),
+    ("order_number", ("order_number",), 8.0),
+    (
+        "client",
+        ("client_name", "client_address", "client_phone", "client_email"),
+        4.0,
+    ),
+    ("kitchen_type", ("kitchen_type",), 2.0),
+    ("notes", ("blaty_note", "cokoly_note", "uwagi_note", "flag_notes"), 1.0),
+)
+
+_FOLDED_LETTERS = {"ł": "l", "Ł": "L"}
+
+BM25_WEIGHTS = ", ".join(str(weight) for _, _, weight in _COLUMNS)
+
+
+def _column_sql(row: str, sources) -> str:
+    expression = " || ' ' || ".join(
+        f"coalesce({row}.{source}, '')" for source in sources
+    )
+    for letter, replacement in _FOLDED_LETTERS.items():
+        expression = f"replace({expression}, '{letter}', '{replacement}')"
+    return expression
+
+
+def _values_sql(row: str) -> str:
+    return ", ".join(
+        [f"{row}.id"] + [_column_sql(row, sources) for _, sources, _ in _COLUMNS]
+    )
+
+
+_COLUMN_NAMES = ", ".join(name for name, _, _ in _COLUMNS)
+
+
+def _insert_sql(row: str) -> str:
+    return (
+        f"INSERT INTO {FTS_TABLE}(rowid, {_COLUMN_NAMES}) VALUES ({_values_sql(row)});"
+    )
+
+
+def _create_statements() -> List[str]:
+    delete_old = f"DELETE FROM {FTS_TABLE} WHERE rowid = old.id;"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+        f"{_COLUMN_NAMES}, tokenize = 'unicode61 remove_diacritics 2')",
+        f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON projects "
+        f"BEGIN {_insert_sql('new')} END",
+        f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON projects "
+        f"BEGIN {delete_old} END",
+        f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE ON projects "
+        f"BEGIN {delete_old} {_insert_sql('new')} END",
+    ]
+
+
+CREATE_STATEMENTS = _create_statements()
+
+DROP_STATEMENTS = [
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_au",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ad",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ai",
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+]
+
+# Fills the index from existing projects (e.g. after a migration).
+REBUILD_STATEMENTS = [
+    f"DELETE FROM {FTS_TABLE}",
+    f"INSERT INTO {FTS_TABLE}(rowid, {_COLUMN_NAMES}) "
+    f"SELECT {_values_sql('p')} FROM projects AS p",
+]
+
+
+def create_project_search(connection) -> bool:
+    """
+    Create the FTS table and triggers on a DB-API/SQLAlchemy connection.
+
+    Returns False (and logs) when SQLite lacks FTS5; search then falls back
+    to plain LIKE matching.
+    """
+    try:
+        for statement in CREATE_STATEMENTS:
+            connection.exec_driver_sql(statement)
+    except Exception as exc:
+        logger.warning("Project full-text search unavailable: %s", exc)
+        return False
+    return True
+
+
+def fold_search_text(text: str) -> str:
+    """Apply the same Polish letter folding as the indexed text."""
+    for letter, replacement in _FOLDED_LETTERS.items():
+        text = text.replace(letter, replacement)
+    return text
+
+
+def build_match_query(text: str) -> str:
+    """
+    Turn free user input into an FTS5 MATCH expression.
+
+    Every word becomes a quoted prefix term ("kowal"*), so partial words
+    match as the user types and FTS syntax characters in the input are inert.
+    All terms must match.
+    """
+    words = re.findall(r"\w+", fold_search_text(text or ""))
+    return " ".join(f'"{word}"*' for word in words)
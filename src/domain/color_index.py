@@ -0,0 +1,131 @@
+"""
+Color name -> HEX index.
+
+Lookups are plain dict hits on pre-normalized keys, tried from the most to
+the least exact match:
+
+1. the name as written,
+2. casefolded with whitespace collapsed ("  dąb  SONOMA" -> "dąb sonoma"),
+3. additionally without diacritics ("Dab Sonoma" -> "dab sonoma").
+
+Runtime colors (the `cabinet_colors` table) take priority over the static
+fallback map at every level.
+"""
+
+import unicodedata
+from typing import Dict, Mapping, Optional, Set
+
+# Letters that Unicode does not decompose into base letter + diacritic.
+_FOLDED_LETTERS = str.maketrans({"ł": "l", "Ł": "L", "đ": "d", "ø": "o"})
+
+
+def normalize_color_key(name: str) -> str:
+    """Casefold and collapse whitespace (same rule as CabinetColor.normalized_name)."""
+    return " ".join((name or "").split()).casefold()
+
+
+def fold_color_key(name: str) -> str:
+    """normalize_color_key() with diacritics removed."""
+    decomposed = unicodedata.normalize(
+        "NFKD", normalize_color_key(name).translate(_FOLDED_LETTERS)
+    )
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+class _ColorLayer:
+    """One source of colors with its normalized and folded keys."""
+
+    def __init__(self):
+        self.hex_by_name: Dict[str, str] = {}
+        # key -> name; the first name registered for a key wins
+        self.by_normalized: Dict[str, str] = {}
+        self.by_folded: Dict[str, str] = {}
+        # folded keys with at least one spelling that has diacritics
+        self.accented: Set[str] = set()
+
+    def clear(self) -> None:
+        self.hex_by_name.clear()
+        self.by_normalized.clear()
+        self.by_folded.clear()
+        self.accented.clear()
+
+    def add(self, name: str, hex_code: str) -> None:
+        self.hex_by_name[name] = hex_code
+        self.by_normalized.setdefault(normalize_color_key(name), name)
+        folded = fold_color_key(name)
+        self.by_folded.setdefault(folded, name)
+        if normalize_color_key(name) != folded:
+            self.accented.add(folded)
+
+
+class ColorIndex:
+    """HEX lookup over runtime (database) colors and a static fallback map."""
+
+    def __init__(self, static_colors: Optional[Mapping[str, str]] = None):
+        self._runtime = _ColorLayer()
+        self._static = _ColorLayer()
+        for name, hex_code in (static_colors or {}).items():
+            self._static.add(name, hex_code)
+
+    def set_runtime(self, colors: Mapping[str, str]) -> None:
+        """Replace all runtime colors."""
+        self._runtime.clear()
+        for name, hex_code in colors.items():
+            if name:
+                self._runtime.add(name, hex_code)
+
+    def add_runtime(self, name: str, hex_code: str) -> None:
+        """Add or update one runtime color without rebuilding the index."""
+        if name:
+            self._runtime.add(name, hex_code)
+
+    def runtime_colors(self) -> Dict[str, str]:
+        return dict(self._runtime.hex_by_name)
+
+    def lookup(self, name: str) -> Optional[str]:
+        """HEX for a color name from runtime or static colors, else None."""
+        return self._lookup(name, (self._runtime, self._static))
+
+    def lookup_static(self, name: str) -> Optional[str]:
+        """HEX for a color name from the static fallback map only."""
+        return self._lookup(name, (self._static,))
+
+    def lookup_static_exact(self, name: str) -> Optional[str]:
+        """
+        HEX for a static color name matched as written or casefolded only.
+
+        Unaccented spellings of accented names ("Dab" next to "Dąb") are
+        treated as aliases and do not match, so callers that store colors
+        do not create diacritic-less duplicates.
+        """
+        name = (name or "").strip()
+        layer = self._static
+        match = name if name in layer.hex_by_name else None
+        if match is None:
+            match = layer.by_normalized.get(normalize_color_key(name))
+        if match is None:
+            return None
+        folded = fold_color_key(match)
+        if normalize_color_key(match) == folded and folded in layer.accented:
+            return None
+        return layer.hex_by_name[match]
+
+    @staticmethod
+    def _lookup(name: str, layers) -> Optional[str]:
+        name = (name or "").strip()
+        if not name:
+            return None
+
+        for layer in layers:
+            if name in layer.hex_by_name:
+                return layer.hex_by_name[name]
+
+        for attr, key in (
+            ("by_normalized", normalize_color_key(name)),
+            ("by_folded", fold_color_key(name)),
+        ):
+            for layer in layers:
+                match = getattr(layer, attr).get(key)
+                if match is not None:
+                    return layer.hex_by_name[match]
+        return None
@@ -0,0 +1,167 @@
+"""
+Nearest named color for a HEX sample, by perceptual distance.
+
+Colors are converted once from sRGB to CIE L*a*b* (D65). In Lab the plain
+Euclidean distance is the CIE76 color difference (ΔE*ab): about 1 is the
+smallest difference people notice, below ~3 two laminates look alike side
+by side. Being Euclidean, it can be searched with a k-d tree.
+
+The tree is stored compactly: Lab coordinates in one flat array and the
+tree itself as a permutation of point indices - the median of every range
+is the node, the halves left/right of it its subtrees.
+"""
+
+import heapq
+from array import array
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from src.domain.color_index import normalize_color_key
+
+Lab = Tuple[float, float, float]
+
+# D65 reference white
+_WHITE = (0.95047, 1.0, 1.08883)
+
+
+def _linear(channel: int) -> float:
+    value = channel / 255.0
+    if value <= 0.04045:
+        return value / 12.92
+    return ((value + 0.055) / 1.055) ** 2.4
+
+
+def _f(t: float) -> float:
+    if t > 216 / 24389:
+        return t ** (1 / 3)
+    return (24389 / 27 * t + 16) / 116
+
+
+def hex_to_lab(hex_code: str) -> Lab:
+    """Lab of a #RRGGBB / #RGB color; ValueError for other input."""
+    value = (hex_code or "").strip().lstrip("#")
+    if len(value) == 3:
+        value = "".join(ch * 2 for ch in value)
+    if len(value) != 6:
+        raise ValueError(f"Nieprawidłowy kolor HEX: {hex_code!r}")
+    r, g, b = (_linear(int(value[i : i + 2], 16)) for i in (0, 2, 4))
+
+    x = (0.4124564 * r + 0.3575761 * g + 0.1804375 * b) / _WHITE[0]
+    y = (0.2126729 * r + 0.7151522 * g + 0.0721750 * b) / _WHITE[1]
+    z = (0.0193339 * r + 0.1191920 * g + 0.9503041 * b) / _WHITE[2]
+    fx, fy, fz = _f(x), _f(y), _f(z)
+    return (116 * fy - 16, 500 * (fx - fy), 200 * (fy - fz))
+
+
+def delta_e(first: Lab, second: Lab) -> float:
+    """CIE76 color difference of two Lab colors."""
+    return sum((a - b) ** 2 for a, b in zip(first, second)) ** 0.5
+
+
+@dataclass(frozen=True, slots=True)
+class ColorMatch:
+    name: str
+    hex_code: str
+    delta_e: float
+
+
+class ColorLabIndex:
+    """k-d tree of named colors in Lab space."""
+
+    def __init__(self, colors: Optional[Mapping[str, str]] = None):
+        # normalized name -> (name, hex); the tree is rebuilt on next query
+        self._colors: Dict[str, Tuple[str, str]] = {}
+        self._names: List[str] = []
+        self._hex: List[str] = []
+        self._coords = array("d")
+        self._order = array("i")
+        self._dirty = False
+        for name, hex_code in (colors or {}).items():
+            self.add(name, hex_code)
+
+    def __len__(self) -> int:
+        return len(self._colors)
+
+    def add(self, name: str, hex_code: str) -> None:
+        """Add a color or replace the HEX of an indexed one."""
+        key = normalize_color_key(name)
+        if not key:
+            return
+        hex_to_lab(hex_code)  # reject invalid HEX before it reaches the tree
+        self._colors[key] = (name, hex_code)
+        self._dirty = True
+
+    def add_many(self, colors: Iterable[Tuple[str, str]]) -> None:
+        for name, hex_code in colors:
+            self.add(name, hex_code)
+
+    def remove(self, name: str) -> None:
+        if self._colors.pop(normalize_color_key(name), None) is not None:
+            self._dirty = True
+
+    def nearest(self, hex_code: str, k: int = 5) -> List[ColorMatch]:
+        """The k colors closest to hex_code, closest first."""
+        query = hex_to_lab(hex_code)
+        if k <= 0 or not self._colors:
+            return []
+        if self._dirty:
+            self._rebuild()
+
+        # max-heap of (-squared distance, point) holding the best k so far
+        best: List[Tuple[float, int]] = []
+        self._search(query, 0, len(self._order), 0, k, best)
+        return [
+            ColorMatch(self._names[point], self._hex[point], (-neg_d2) ** 0.5)
+            for neg_d2, point in sorted(best, reverse=True)
+        ]
+
+    def _rebuild(self) -> None:
+        self._names = []
+        self._hex = []
+        coords = []
+        for name, hex_code in self._colors.values():
+            self._names.append(name)
+            self._hex.append(hex_code)
+            coords.extend(hex_to_lab(hex_code))
+        self._coords = array("d", coords)
+        self._order = array("i", range(len(self._names)))
+        self._build(0, len(self._order), 0)
+        self._dirty = False
+
+    def _build(self, lo: int, hi: int, depth: int) -> None:
+        if hi - lo <= 1:
+            return
+        axis = depth % 3
+        coords = self._coords
+        self._order[lo:hi] = array(
+            "i", sorted(self._order[lo:hi], key=lambda p: coords[3 * p + axis])
+        )
+        mid = (lo + hi) // 2
+        self._build(lo, mid, depth + 1)
+        self._build(mid + 1, hi, depth + 1)
+
+    def _search(self, query: Lab, lo: int, hi: int, depth: int, k: int, best):
+        if lo >= hi:
+            return
+        mid = (lo + hi) // 2
+        point = self._order[mid]
+        base = 3 * point
+        coords = self._coords
+        d2 = (
+            (query[0] - coords[base]) ** 2
+            + (query[1] - coords[base + 1]) ** 2
+            + (query[2] - coords[base + 2]) ** 2
+        )
+        if len(best) < k:
+            heapq.heappush(best, (-d2, point))
+        elif d2 < -best[0][0]:
+            heapq.heapreplace(best, (-d2, point))
+
+        axis = depth % 3
+        diff = query[axis] - coords[base + axis]
+        near, far = (
+            ((lo, mid), (mid + 1, hi)) if diff < 0 else ((mid + 1, hi), (lo, mid))
+        )
+        self._search(query, near[0], near[1], depth + 1, k, best)
+        if len(best) < k or diff * diff < -best[0][0]:
+            self._search(query, far[0], far[1], depth + 1, k, best)
@@ -0,0 +1,147 @@
+"""
+Fuzzy color name search over a trigram index.
+
+Names are folded with fold_color_key() and every word is padded ("  dab ")
+before it is split into trigrams, so word starts weigh more and "Dab sonma"
+still finds "Dąb Sonoma". Each trigram maps to the names containing it;
+a query only touches the postings of its own trigrams.
+
+Results are ranked by:
+
+1. coverage - the share of the query's trigrams found in the name,
+2. usage_count, then last_used_at (frequently/recently used colors first),
+3. similarity of the whole name (shorter, closer names first),
+4. name.
+"""
+
+import heapq
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
+
+from src.domain.color_index import fold_color_key, normalize_color_key
+
+# Names covering less of the query than this are not returned.
+MIN_COVERAGE = 0.4
+
+
+def color_trigrams(name: str) -> FrozenSet[str]:
+    """Trigrams of the folded name, each word padded like "  word "."""
+    grams = set()
+    for word in fold_color_key(name).split():
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+@dataclass(slots=True)
+class _Entry:
+    name: str
+    trigrams: FrozenSet[str]
+    usage_count: int = 0
+    last_used: float = 0.0
+
+
+def _timestamp(when: Optional[datetime]) -> float:
+    if when is None:
+        return 0.0
+    # SQLite returns naive datetimes; they are stored in UTC
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return when.timestamp()
+
+
+class ColorSearchIndex:
+    """Trigram index of color names with usage statistics."""
+
+    def __init__(self):
+        # normalized name -> entry; postings hold normalized names
+        self._entries: Dict[str, _Entry] = {}
+        self._postings: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, name: str) -> bool:
+        return normalize_color_key(name) in self._entries
+
+    def add(
+        self,
+        name: str,
+        usage_count: int = 0,
+        last_used_at: Optional[datetime] = None,
+    ) -> None:
+        """Add a name or replace the name/statistics of an indexed one."""
+        key = normalize_color_key(name)
+        if not key:
+            return
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = _Entry(name, color_trigrams(name))
+            for gram in entry.trigrams:
+                self._postings.setdefault(gram, set()).add(key)
+        entry.name = name
+        entry.usage_count = usage_count or 0
+        entry.last_used = _timestamp(last_used_at)
+
+    def add_many(self, names: Iterable[str]) -> None:
+        for name in names:
+            if name not in self:
+                self.add(name)
+
+    def record_usage(
+        self, name: str, count: int = 1, when: Optional[datetime] = None
+    ) -> None:
+        """Add usage to an indexed name; unknown names are indexed first."""
+        key = normalize_color_key(name)
+        if key not in self._entries:
+            self.add(name)
+        entry = self._entries.get(key)
+        if entry is None:
+            return
+        entry.usage_count += count
+        entry.last_used = max(entry.last_used, _timestamp(when))
+
+    def remove(self, name: str) -> None:
+        key = normalize_color_key(name)
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for gram in entry.trigrams:
+            keys = self._postings.get(gram)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._postings[gram]
+
+    def search(self, query: str, limit: int = 10) -> List[str]:
+        """Top `limit` names matching the query, best first."""
+        query_grams = color_trigrams(query)
+        if not query_grams or limit <= 0:
+            return []
+
+        shared = Counter()
+        for gram in query_grams:
+            shared.update(self._postings.get(gram, ()))
+
+        total = len(query_grams)
+        minimum = total * MIN_COVERAGE
+        candidates = [(key, hits) for key, hits in shared.items() if hits >= minimum]
+
+        def rank(candidate):
+            key, hits = candidate
+            entry = self._entries[key]
+            similarity = hits / (total + len(entry.trigrams) - hits)
+            return (
+                -hits / total,
+                -entry.usage_count,
+                -entry.last_used,
+                -similarity,
+                key,
+            )
+
+        return [
+            self._entries[key].name
+            for key, _ in heapq.nsmallest(limit, candidates, key=rank)
+        ]
@@ -270,6 +270,26 @@ class CatalogBrowserWidget(QWidget):
         item = self.model.get_item(source_index)
         return item.id if item else None
 
+    def selected_item_ids(self) -> list[int]:
+        """Get IDs of all selected items, in display order."""
+        rows = sorted(
+            self.table_view.selectionModel().selectedRows(), key=lambda i: i.row()
+        )
+        ids = []
+        for index in rows:
+            item = self.model.get_item(self.proxy_model.mapToSource(index))
+            if item:
+                ids.append(item.id)
+        return ids
+
+    def set_multi_selection(self, enabled: bool):
+        """Allow selecting several rows (Ctrl/Shift+click) or a single one."""
+        self.table_view.setSelectionMode(
+            QAbstractItemView.SelectionMode.ExtendedSelection
+            if enabled
+            else QAbstractItemView.SelectionMode.SingleSelection
+        )
+
     def current_item(self) -> Optional[CatalogCabinetType]:
         """Get current selected item."""
         selection = self.table_view.selectionModel().currentIndex()
@@ -21,7 +21,7 @@ from src.gui.resources.styles import get_theme, PRIMARY
 from src.gui.cabinet_editor import CabinetEditorDialog
 from src.services.catalog_service import CatalogService
 from src.gui.resources.resources import get_icon
-from src.services.project_service import ProjectService
+from src.services.project_service import CabinetSpec, ProjectService
 from src.services.color_palette_service import ColorPaletteService
 from src.services.settings_service import SettingsService
 from src.db_schema.orm_models import Project
@@ -75,6 +75,10 @@ class CatalogWindow(QDialog):
                 self.is_dark_mode = False
 
         self._setup_ui()
+        # Several types can be added to a project at once
+        self.browser_widget.set_multi_selection(
+            initial_mode == "add" and target_project is not None
+        )
         self._setup_connections()
         self._apply_styles()
         self._update_mode_ui()
@@ -223,7 +227,7 @@ class CatalogWindow(QDialog):
         """Handle item activation (double-click)."""
         if self.current_mode == "add" and self.target_project:
             # Quick add mode
-            self._add_to_project(cabinet_type_id)
+            self._add_to_project([cabinet_type_id])
         else:
             # Manage mode - open editor
             self._edit_cabinet_type(cabinet_type_id)
@@ -234,9 +238,9 @@ class CatalogWindow(QDialog):
 
     def _on_add_clicked(self):
         """Handle add button click."""
-        cabinet_type_id = self.browser_widget.current_item_id()
-        if cabinet_type_id and self.target_project:
-            self._add_to_project(cabinet_type_id)
+        cabinet_type_ids = self.browser_widget.selected_item_ids()
+        if cabinet_type_ids and self.target_project:
+            self._add_to_project(cabinet_type_ids)
 
     def _on_new(self):
         """Handle new cabinet type."""
@@ -377,38 +381,39 @@ class CatalogWindow(QDialog):
                 self, "Błąd", f"Nie udało się otworzyć edytora: {str(e)}"
             )
 
-    def _add_to_project(self, cabinet_type_id: int):
-        """Add cabinet type to project."""
+    def _add_to_project(self, cabinet_type_ids: list[int]):
+        """Add cabinet types to project, all in one transaction."""
         if not self.project_service or not self.target_project:
             return
 
         try:
             # Get quantity and options from footer
             quantity, options = self.add_footer.values()
+            specs = [
+                CabinetSpec(
+                    type_id=cabinet_type_id,
+                    body_color=options["body_color"],
+                    front_color=options["front_color"],
+                    handle_type=options["handle_type"],
+                    quantity=quantity,
+                )
+                for cabinet_type_id in cabinet_type_ids
+            ]
 
-            # Get next sequence number
-            sequence_number = self.project_service.get_next_cabinet_sequence(
-                self.target_project.id
-            )
-
-            # Add cabinet to project
-            self.project_service.add_cabinet(
-                project_id=self.target_project.id,
-                sequence_number=sequence_number,
-                type_id=cabinet_type_id,
-                quantity=quantity,
-                body_color=options["body_color"],
-                front_color=options["front_color"],
-                handle_type=options["handle_type"],
+            # Project details controller refreshes its view once after the batch
+            add_catalog_cabinets = getattr(
+                self.project_service, "add_catalog_cabinets", None
             )
+            if add_catalog_cabinets is not None:
+                add_catalog_cabinets(specs)
+            else:
+                self.project_service.add_cabinets(self.target_project.id, specs)
 
             # Store data for signal emission after dialog closes
-            self._pending_add_data = (
-                cabinet_type_id,
-                self.target_project.id,
-                quantity,
-                options,
-            )
+            self._pending_add_data = [
+                (cabinet_type_id, self.target_project.id, quantity, options)
+                for cabinet_type_id in cabinet_type_ids
+            ]
 
             # Close the dialog first - signal will be emitted in done()
             self.accept()
@@ -422,8 +427,13 @@ class CatalogWindow(QDialog):
         """Override done to emit signal after dialog is closed."""
         # Emit pending signal if any
         if hasattr(self, "_pending_add_data") and self._pending_add_data:
-            data = self._pending_add_data
+            pending = self._pending_add_data
             self._pending_add_data = None
+
             # Use QTimer to defer signal emission to after dialog is fully closed
-            QTimer.singleShot(0, lambda: self.sig_added_to_project.emit(*data))
+            def emit_added():
+                for data in pending:
+                    self.sig_added_to_project.emit(*data)
+
+            QTimer.singleShot(0, emit_added)
         super().done(result)
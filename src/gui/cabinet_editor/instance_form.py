@@ -16,15 +16,16 @@ from PySide6.QtWidgets import (
     QFrame,
     QGroupBox,
     QPushButton,
-    QCompleter,
     QDialog,
 )
-from PySide6.QtCore import Signal, Qt
+from PySide6.QtCore import Signal
 from PySide6.QtGui import QFont
 
 from src.gui.resources.styles import get_theme, PRIMARY
+from src.domain.color_search import ColorSearchIndex
 from src.gui.constants.colors import POPULAR_COLORS
 from src.gui.dialogs.color_edit_dialog import ColorEditDialog
+from src.gui.widgets.color_completer import ColorCompleter
 from src.services.color_palette_service import ColorPaletteService
 
 
@@ -405,7 +406,7 @@ class InstanceForm(QWidget):
     def _load_color_controls(self) -> None:
         """Populate recent-first color controls and searchable completers."""
         recent_names = self._recent_names()
-        searchable_names = self._searchable_names()
+        search = self._color_search()
 
         current_body = self.body_color_combo.currentText() or "Biały"
         current_front = self.front_color_combo.currentText() or "Biały"
@@ -416,10 +417,8 @@ class InstanceForm(QWidget):
             combo.addItems(recent_names)
             combo.blockSignals(False)
 
-            completer = QCompleter(searchable_names, self)
-            completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
-            completer.setFilterMode(Qt.MatchFlag.MatchContains)
-            combo.setCompleter(completer)
+            if not isinstance(combo.completer(), ColorCompleter):
+                ColorCompleter(search, self).attach(combo)
 
         self.body_color_combo.setCurrentText(current_body)
         self.front_color_combo.setCurrentText(current_front)
@@ -435,16 +434,16 @@ class InstanceForm(QWidget):
                 pass
         return POPULAR_COLORS[:12]
 
-    def _searchable_names(self) -> list[str]:
+    def _color_search(self):
         if self.color_service:
             try:
                 self.color_service.ensure_seeded()
-                names = self.color_service.list_searchable_names()
-                if names:
-                    return names
+                return self.color_service.search_colors
             except Exception:
                 pass
-        return list(POPULAR_COLORS)
+        index = ColorSearchIndex()
+        index.add_many(POPULAR_COLORS)
+        return index.search
 
     def _open_add_color_dialog(self, target_combo: QComboBox) -> None:
         """Open dialog for adding a custom color and select it."""
@@ -34,6 +34,7 @@ from src.gui.resources.styles import get_theme
 from src.gui.resources.resources import get_icon
 from src.gui.common.layouts import ResponsiveFlowLayout
 from src.services.settings_service import SettingsService
+from src.services.project_service import CabinetSpec
 from .catalog_card import CatalogCard
 from .catalog_service import CatalogService
 from .catalog_models import CatalogItem
@@ -659,21 +660,16 @@ class CatalogDialog(QDialog):
                     else None
                 )
 
-            # Get next sequence number
-            next_sequence = self.project_service.get_next_cabinet_sequence(
-                self.project.id
-            )
-
-            # Add cabinet to project
-            cabinet = self.project_service.add_cabinet(
-                project_id=self.project.id,
-                sequence_number=next_sequence,
+            # Add cabinet to project (same batch path as the catalog window)
+            spec = CabinetSpec(
                 type_id=self._selected_item.id,
-                quantity=quantity,
                 body_color=body_color or "Biały",
                 front_color=front_color or "Biały",
                 handle_type=handle_type or "Standardowy",
+                quantity=quantity,
             )
+            added = self.project_service.add_cabinets(self.project.id, [spec])
+            cabinet = added[0] if added else None
 
             if cabinet:
                 # Emit success signal
@@ -6,7 +6,9 @@ from .colors import (
     CABINET_COLORS,
     COLOR_MAP,
     POPULAR_COLORS,
+    COLOR_INDEX,
     get_color_hex,
+    register_runtime_color,
     register_runtime_colors,
 )
 
@@ -24,7 +26,9 @@ __all__ = [
     "CABINET_COLORS",
     "COLOR_MAP",
     "POPULAR_COLORS",
+    "COLOR_INDEX",
     "get_color_hex",
+    "register_runtime_color",
     "register_runtime_colors",
     "CARD_HEIGHT",
     "CARD_WIDTH",
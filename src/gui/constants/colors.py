@@ -2,6 +2,8 @@
 Centralne miejsce dla definicji kolorow uzywanych w GUI.
 """
 
+from src.domain.color_index import ColorIndex
+
 # Mapowanie polskich nazw kolorow na kody HEX (fallback statyczny).
 CABINET_COLORS = {
     "Bialy": "#FFFFFF",
@@ -69,8 +71,9 @@ for variant, canonical in ENCODING_VARIANTS.items():
     if canonical in CABINET_COLORS:
         COLOR_MAP[variant] = CABINET_COLORS[canonical]
 
-# Runtime mapowanie z bazy (system + user).
-RUNTIME_COLOR_MAP: dict[str, str] = {}
+# Wspolny indeks nazw (runtime z bazy + statyczne mapowanie), uzywany
+# przez GUI i serwisy.
+COLOR_INDEX = ColorIndex(COLOR_MAP)
 
 # Lista kolorow do wyswietlenia w GUI, gdy brak historii.
 POPULAR_COLORS = [
@@ -104,19 +107,18 @@ def _normalize_hex(value: str) -> str:
 
 def register_runtime_colors(color_map: dict[str, str]) -> None:
     """Rejestruje mapowanie kolorów dostarczone z bazy danych."""
-    RUNTIME_COLOR_MAP.clear()
-    for name, hex_code in (color_map or {}).items():
-        if not name:
-            continue
-        RUNTIME_COLOR_MAP[name] = _normalize_hex(hex_code)
+    COLOR_INDEX.set_runtime(
+        {
+            name: _normalize_hex(hex_code)
+            for name, hex_code in (color_map or {}).items()
+            if name
+        }
+    )
 
 
-def _casefold_lookup(color_name: str, mapping: dict[str, str]) -> str | None:
-    normalized = color_name.casefold()
-    for key, value in mapping.items():
-        if key.casefold() == normalized:
-            return value
-    return None
+def register_runtime_color(name: str, hex_code: str) -> None:
+    """Dodaje lub aktualizuje pojedynczy kolor z bazy bez przebudowy indeksu."""
+    COLOR_INDEX.add_runtime(name, _normalize_hex(hex_code))
 
 
 def get_color_hex(color_name: str) -> str:
@@ -124,26 +126,14 @@ def get_color_hex(color_name: str) -> str:
     if not color_name:
         return "#FFFFFF"
 
-    name = color_name.strip()
-
-    # Runtime mapowanie z bazy ma wyzszy priorytet.
-    if name in RUNTIME_COLOR_MAP:
-        return RUNTIME_COLOR_MAP[name]
-
-    # Statyczne mapowania.
-    if name in COLOR_MAP:
-        return COLOR_MAP[name]
-
-    # Case-insensitive lookup.
-    runtime_casefold = _casefold_lookup(name, RUNTIME_COLOR_MAP)
-    if runtime_casefold:
-        return runtime_casefold
-
-    static_casefold = _casefold_lookup(name, COLOR_MAP)
-    if static_casefold:
-        return static_casefold
+    # Runtime mapowanie z bazy ma wyzszy priorytet, potem statyczne;
+    # dokladna nazwa, bez wielkosci liter, bez znakow diakrytycznych.
+    hex_code = COLOR_INDEX.lookup(color_name)
+    if hex_code:
+        return hex_code
 
     # Jeśli to juz HEX, zwroc bez zmian (z normalizacja #RGB -> #RRGGBB).
+    name = color_name.strip()
     if name.startswith("#"):
         normalized = _normalize_hex(name)
         if len(normalized) == 7:
@@ -14,6 +14,7 @@ from PySide6.QtWidgets import (
     QPushButton,
     QColorDialog,
     QFrame,
+    QLabel,
 )
 from PySide6.QtCore import Signal
 from PySide6.QtGui import QColor
@@ -34,7 +35,7 @@ class ColorEditDialog(QDialog):
 
     def _setup_ui(self):
         self.setWindowTitle("Dodaj kolor")
-        self.resize(440, 190)
+        self.resize(440, 220)
 
         layout = QVBoxLayout(self)
         form = QFormLayout()
@@ -62,6 +63,10 @@ class ColorEditDialog(QDialog):
         self.color_preview.setFixedSize(28, 28)
         form.addRow("Podgląd:", self.color_preview)
 
+        self.nearest_label = QLabel(self)
+        self.nearest_label.setWordWrap(True)
+        form.addRow("Najbliższe:", self.nearest_label)
+
         layout.addLayout(form)
 
         buttons = QDialogButtonBox(QDialogButtonBox.Save | QDialogButtonBox.Cancel)
@@ -88,11 +93,17 @@ class ColorEditDialog(QDialog):
         picker.setOption(QColorDialog.ColorDialogOption.DontUseNativeDialog, True)
         picker.setOption(QColorDialog.ColorDialogOption.ShowAlphaChannel, False)
         picker.setCurrentColor(current)
+        # Follow the picker live; the HEX field changes only on accept
+        picker.currentColorChanged.connect(
+            lambda color: self._update_nearest(color.name(QColor.NameFormat.HexRgb))
+        )
 
         if picker.exec() == QDialog.DialogCode.Accepted:
             chosen = picker.currentColor()
             if chosen.isValid():
                 self.hex_edit.setText(chosen.name(QColor.NameFormat.HexRgb).upper())
+        else:
+            self._update_nearest(self.hex_edit.text())
 
     def _update_preview_from_hex(self, raw_hex: str) -> None:
         """Refresh preview swatch from current HEX input."""
@@ -104,6 +115,7 @@ class ColorEditDialog(QDialog):
             fill_color = color.name(QColor.NameFormat.HexRgb).upper()
         else:
             border_color = "#D9534F"
+        self._update_nearest(raw_hex)
 
         self.color_preview.setStyleSheet(
             f"""
@@ -115,6 +127,17 @@ class ColorEditDialog(QDialog):
             """
         )
 
+    def _update_nearest(self, raw_hex: str) -> None:
+        """Show the named colors closest to the HEX being edited."""
+        try:
+            matches = self.color_service.nearest_colors(raw_hex, limit=3)
+        except Exception:
+            matches = []
+        self.nearest_label.setText(
+            ", ".join(f"{match.name} (ΔE {match.delta_e:.1f})" for match in matches)
+            or "—"
+        )
+
     def accept(self):
         name = self.name_edit.text().strip()
         hex_code = self.hex_edit.text().strip()
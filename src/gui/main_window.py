@@ -22,6 +22,8 @@ from PySide6.QtWidgets import (
     QToolButton,
     QButtonGroup,
     QMenu,
+    QProgressDialog,
+    QFileDialog,
 )
 from PySide6.QtCore import Qt, QModelIndex, QTimer
 from PySide6.QtGui import QAction, QKeySequence, QShortcut
@@ -29,8 +31,12 @@ from PySide6.QtGui import QAction, QKeySequence, QShortcut
 from sqlalchemy.orm import Session
 
 from src.gui.project_dialog import ProjectDialog
-from src.services.project_service import ProjectService
-from src.services.report_generator import ReportGenerator
+from src.services.project_service import (
+    PROJECT_PAGE_SIZE,
+    ProjectListRow,
+    ProjectService,
+)
+from src.services.report_service import ReportService
 from src.services.settings_service import SettingsService
 from src.services.color_palette_service import ColorPaletteService
 from src.gui.project_details.widget import ProjectDetailsWidget
@@ -40,6 +46,8 @@ from src.services.catalog_service import CatalogService
 from src.gui.resources.styles import get_theme
 from src.gui.resources.resources import get_icon
 from src.services.updater_service import UpdaterService
+from src.services.batch_report_service import BatchReportService
+from src.services.cutlist_export import CutListExporter
 
 # Import refactored components
 from .constants import CARD_WIDTH, CONTENT_MARGINS, LAYOUT_SPACING, ICON_SIZE
@@ -65,14 +73,20 @@ class MainWindow(QMainWindow):
         self._loading_overlay: Optional[LoadingOverlay] = None
         self._current_search_text = ""  # UX: Persist search text
         self._current_filter_type = ""  # UX: Persist filter type
+        # Full-text search hits as {project_id: rank}; None when not searching
+        self._search_ranks: Optional[dict] = None
 
         self.project_service = ProjectService(db_session)
         self.catalog_service = CatalogService(db_session)
-        self.report_generator = ReportGenerator(db_session=db_session)
         self.settings_service = SettingsService(db_session)
         self.color_palette_service = ColorPaletteService(db_session)
         self.updater_service = UpdaterService(parent=self)
+        self.batch_report_service: Optional[BatchReportService] = None
+        self.report_service = ReportService(db_session, parent=self)
+        self._report_progress_dialog: Optional[QProgressDialog] = None
+        self._report_action = "open"
         self.is_dark_mode = self.settings_service.get_setting_value("dark_mode", False)
+        self.settings_service.subscribe(self._on_setting_changed)
 
         try:
             self.color_palette_service.ensure_seeded()
@@ -80,6 +94,13 @@ class MainWindow(QMainWindow):
         except Exception as exc:
             logger.warning("Failed to initialize color palette cache: %s", exc)
 
+        # Color usage is queued in memory by the services; write it in
+        # batches while the app is idle instead of once per cabinet.
+        self._color_usage_timer = QTimer(self)
+        self._color_usage_timer.setInterval(5000)
+        self._color_usage_timer.timeout.connect(self.color_palette_service.flush_usage)
+        self._color_usage_timer.start()
+
         # UX: Search debounce timer for better performance
         self._search_timer = QTimer(self)
         self._search_timer.setSingleShot(True)
@@ -264,6 +285,8 @@ class MainWindow(QMainWindow):
 
         self.card_scroll.setWidget(self.card_container)
         self.stack.addWidget(self.card_scroll)
+        # Cards are created page by page as the user scrolls down
+        self.card_scroll.verticalScrollBar().valueChanged.connect(self._on_card_scroll)
 
         # Table view
         raw_model = ProjectListModel([])
@@ -321,6 +344,20 @@ class MainWindow(QMainWindow):
         self._make_action(
             fm, self.tr("Eksportuj do Word"), "Ctrl+E", self.on_export_project, "export"
         )
+        self._make_action(
+            fm,
+            self.tr("Eksportuj widoczne projekty do Word"),
+            "Ctrl+Shift+E",
+            self.on_export_visible_projects,
+            "export",
+        )
+        self._make_action(
+            fm,
+            self.tr("Eksportuj listę cięć..."),
+            None,
+            self.on_export_cut_list,
+            "export",
+        )
 
         fm.addSeparator()
         self._make_action(fm, self.tr("Zamknij"), "Alt+F4", self.close)
@@ -445,6 +482,11 @@ class MainWindow(QMainWindow):
         self.btn_table.clicked.connect(lambda: self.on_switch_view(1))
         self.btn_back.clicked.connect(self.on_back_to_list)
 
+        # Further pages fetched by the table (or card scrolling) get cards too
+        self.table.model().sourceModel().rowsInserted.connect(
+            self._on_project_rows_inserted
+        )
+
         # Table events
         sel_model = self.table.selectionModel()
         sel_model.selectionChanged.connect(self._on_table_selection_changed)
@@ -453,6 +495,12 @@ class MainWindow(QMainWindow):
         # UX: Keyboard navigation for table
         self.table.installEventFilter(self)
 
+        # Background report generation
+        self.report_service.report_progress.connect(self._on_report_progress)
+        self.report_service.report_finished.connect(self._on_report_finished)
+        self.report_service.report_cancelled.connect(self._on_report_cancelled)
+        self.report_service.report_failed.connect(self._on_report_failed)
+
     def eventFilter(self, obj, event):
         """UX: Handle keyboard events for table navigation"""
         if obj == self.table and event.type() == event.Type.KeyPress:
@@ -529,6 +577,9 @@ class MainWindow(QMainWindow):
         for project in projects:
             if self._should_show_project(project):
                 filtered_projects.append(project)
+        if self._search_ranks is not None:
+            # Best search matches first
+            filtered_projects.sort(key=lambda p: self._search_ranks[p.id])
 
         if not filtered_projects:
             self._show_empty_state(
@@ -555,6 +606,9 @@ class MainWindow(QMainWindow):
         # Clear selection if selected project is no longer visible
         self._after_cards_refreshed()
 
+        # Load further pages until the cards fill the view
+        QTimer.singleShot(0, self._fill_card_viewport)
+
     def _after_cards_refreshed(self):
         """Clear selection if the selected project isn't visible due to filtering"""
         if self._last_clicked_project:
@@ -567,18 +621,25 @@ class MainWindow(QMainWindow):
                     self._selected_card_widget = None
                 self.status.clearMessage()
 
-    def _update_counts(self):
+    def _update_counts(self) -> int:
         """Update project count display based on current filters"""
-        model = self.table.model().sourceModel()
-        projects = model._projects
-        visible_count = len([p for p in projects if self._should_show_project(p)])
-        total_count = len(projects)
+        total_count = self.project_service.count_projects()
+        if self._search_ranks is not None:
+            # All search hits are loaded at once
+            visible_count = self.table.model().sourceModel().rowCount()
+        elif self._current_filter_type:
+            visible_count = self.project_service.count_projects(
+                kitchen_type=self._current_filter_type
+            )
+        else:
+            visible_count = total_count
 
         if visible_count == total_count:
             count_text = f"{total_count} {self.tr('projektów')}"
         else:
             count_text = f"{visible_count} / {total_count} {self.tr('projektów')}"
         self.project_count_label.setText(count_text)
+        return total_count
 
     def _sync_cards_with_projects(self, projects):
         """UX: Synchronize cards with project list without unnecessary recreation"""
@@ -667,47 +728,98 @@ class MainWindow(QMainWindow):
         ):
             return False
 
-        # Text filter
-        if self._current_search_text:
-            search_text = self._current_search_text.lower()
-            return (
-                search_text in project.name.lower()
-                or (project.client_name and search_text in project.client_name.lower())
-                or search_text in project.kitchen_type.lower()
-            )
+        # Text filter (full-text matches computed once per search)
+        if self._search_ranks is not None:
+            return project.id in self._search_ranks
 
         return True
 
+    def _reload_project_pages(self) -> int:
+        """Restart the lazy project listing for the current filters."""
+        self._refresh_search_matches()
+        raw_model = self.table.model().sourceModel()
+        raw_model.set_page_source(self._fetch_project_page)
+        if not raw_model.rowCount():
+            # No rowsInserted signal for an empty first page
+            self._update_card_grid_layout()
+        return self._update_counts()
+
+    def _query_project_rows(self, after_id=None, limit=None) -> list:
+        """Project rows matching the current search and type filters"""
+        kitchen_type = self._current_filter_type or None
+        if self._search_ranks is not None:
+            # Search hits are already bounded; fetch them in rank order
+            return self.project_service.get_project_rows(
+                list(self._search_ranks), kitchen_type=kitchen_type
+            )
+        return self.project_service.list_project_rows(
+            after_id=after_id, limit=limit, kitchen_type=kitchen_type
+        )
+
+    def _fetch_project_page(self, last_row):
+        """Page source of the project list model: (rows, has_more)"""
+        if self._search_ranks is not None:
+            return self._query_project_rows(), False
+        rows = self._query_project_rows(
+            after_id=last_row.id if last_row else None, limit=PROJECT_PAGE_SIZE + 1
+        )
+        return rows[:PROJECT_PAGE_SIZE], len(rows) > PROJECT_PAGE_SIZE
+
+    def _on_project_rows_inserted(self, parent, first, last):
+        """Add cards for a newly fetched page"""
+        self._update_card_grid_layout()
+
+    def _on_card_scroll(self, value: int):
+        """Fetch the next page when the card view is scrolled near its end"""
+        scrollbar = self.card_scroll.verticalScrollBar()
+        if value >= scrollbar.maximum() - scrollbar.pageStep() // 2:
+            self._fetch_more_projects()
+
+    def _fetch_more_projects(self):
+        raw_model = self.table.model().sourceModel()
+        if raw_model.canFetchMore():
+            raw_model.fetchMore()
+
+    def _fill_card_viewport(self):
+        """Keep fetching while loaded cards do not fill the view (no scrollbar)"""
+        viewport = self.card_scroll.viewport()
+        if self.card_layout.heightForWidth(viewport.width()) <= viewport.height():
+            self._fetch_more_projects()
+
+    def _resolve_project(self, project):
+        """ORM project for a list row (dialogs and reports need the full object)"""
+        if project is None or not isinstance(project, ProjectListRow):
+            return project
+        return self.project_service.get_project(project.id)
+
+    def _refresh_search_matches(self):
+        """Run the full-text search for the current text and filter the table."""
+        if self._current_search_text.strip():
+            ids = self.project_service.search_project_ids(self._current_search_text)
+            self._search_ranks = {pid: rank for rank, pid in enumerate(ids)}
+        else:
+            self._search_ranks = None
+        self.table.model().setIdFilter(
+            None if self._search_ranks is None else set(self._search_ranks)
+        )
+
     def load_projects(self):
         """Enhanced project loading with loading state and responsive updates"""
         logger.debug("load_projects() called")
         self._show_loading(True)
 
         try:
-            projects = self.project_service.list_projects()
-            logger.debug(f"Loaded {len(projects)} projects from database")
-
-            # Update table model
-            raw_model = self.table.model().sourceModel()
-            raw_model.update_projects(projects)
-            logger.debug("Table model updated")
-
-            # Update card layout (this will handle filtering and visibility)
-            self._update_card_grid_layout()
-            logger.debug("Card grid layout updated")
-
-            # Update stats
-            self._update_counts()
-            logger.debug("Counts updated")
+            total_count = self._reload_project_pages()
+            logger.debug(f"Listing {total_count} projects")
 
             # Update status
-            if not projects:
+            if not total_count:
                 self._show_empty_state(True, False)
                 self.status.showMessage(self.tr("Brak projektów"))
             else:
                 self._show_empty_state(False)
                 self.status.showMessage(
-                    self.tr("Załadowano {0} projektów").format(len(projects))
+                    self.tr("Załadowano {0} projektów").format(total_count)
                 )
 
         except Exception as e:
@@ -803,41 +915,84 @@ class MainWindow(QMainWindow):
 
         menu.exec(self.table.mapToGlobal(position))
 
+    def _get_reports_output_dir(self) -> str:
+        """Directory for generated reports, based on default_project_path"""
+        default_path = self.settings_service.get_setting_value(
+            "default_project_path",
+            os.path.join(os.path.expanduser("~"), "Documents", "CabPlanner"),
+        )
+        return os.path.join(default_path, "reports")
+
     def _perform_report_action(self, project, action: str):
-        """UX: Enhanced report action with better user feedback"""
+        """UX: Generate report in background with progress and cancel"""
         if not project:
             self.status.showMessage(self.tr("Wybierz projekt aby wykonać akcję"))
             return
+        if self.report_service.is_running():
+            self.status.showMessage(self.tr("Raport jest już generowany"))
+            return
 
         try:
+            project = self._resolve_project(project)
             self.status.showMessage(self.tr("Generowanie raportu..."))
+            self._report_action = action
+            self.report_service.generate(project, self._get_reports_output_dir())
+        except Exception as e:
+            self._on_report_failed(e)
+            return
 
-            # Get default project path from settings
-            default_path = self.settings_service.get_setting_value(
-                "default_project_path",
-                os.path.join(os.path.expanduser("~"), "Documents", "CabPlanner"),
+        dialog = QProgressDialog(
+            self.tr("Generowanie raportu..."), self.tr("Anuluj"), 0, 100, self
+        )
+        dialog.setWindowTitle(self.tr("Eksport do Word"))
+        dialog.setWindowModality(Qt.WindowModal)
+        dialog.setMinimumDuration(500)
+        dialog.setAutoClose(False)
+        dialog.setAutoReset(False)
+        dialog.canceled.connect(self.report_service.cancel)
+        self._report_progress_dialog = dialog
+
+    def _close_report_progress_dialog(self):
+        if self._report_progress_dialog:
+            self._report_progress_dialog.canceled.disconnect(self.report_service.cancel)
+            self._report_progress_dialog.close()
+            self._report_progress_dialog = None
+
+    def _on_report_progress(self, percent: int, section: str):
+        if self._report_progress_dialog:
+            self._report_progress_dialog.setValue(percent)
+            self._report_progress_dialog.setLabelText(
+                self.tr("Generowanie raportu: {0}").format(section)
             )
-            output_dir = os.path.join(default_path, "reports")
-
-            path = self.report_generator.generate(project, output_dir=output_dir)
 
+    def _on_report_finished(self, path: str):
+        self._close_report_progress_dialog()
+        try:
             os.startfile(path)
-            # UX: Non-blocking status message instead of modal dialog
-            self.status.showMessage(
-                self.tr("Eksport zakończony: {0}").format(os.path.basename(path)),
-                3000,
-            )
-
         except Exception as e:
-            logger.error(
-                f"Error performing report action ({action}): {e}", exc_info=True
-            )
-            QMessageBox.critical(
-                self,
-                self.tr("Błąd"),
-                self.tr("Nie udało się wykonać akcji raportu: {0}").format(str(e)),
-            )
-            self.status.showMessage(self.tr("Błąd podczas generowania raportu"))
+            logger.error(f"Error opening report {path}: {e}")
+        # UX: Non-blocking status message instead of modal dialog
+        self.status.showMessage(
+            self.tr("Eksport zakończony: {0}").format(os.path.basename(path)),
+            3000,
+        )
+
+    def _on_report_cancelled(self):
+        self._close_report_progress_dialog()
+        self.status.showMessage(self.tr("Generowanie raportu anulowane"), 3000)
+
+    def _on_report_failed(self, error: Exception):
+        self._close_report_progress_dialog()
+        logger.error(
+            f"Error performing report action ({self._report_action}): {error}",
+            exc_info=error,
+        )
+        QMessageBox.critical(
+            self,
+            self.tr("Błąd"),
+            self.tr("Nie udało się wykonać akcji raportu: {0}").format(str(error)),
+        )
+        self.status.showMessage(self.tr("Błąd podczas generowania raportu"))
 
     def _delete_specific_project(self, project):
         """Delete a specific project with confirmation"""
@@ -956,6 +1111,117 @@ class MainWindow(QMainWindow):
             return
         self._perform_report_action(project, "open")
 
+    def on_export_visible_projects(self):
+        """Export all projects matching current filters, in parallel"""
+        if self.batch_report_service and self.batch_report_service.worker:
+            self.status.showMessage(self.tr("Eksport projektów już trwa"))
+            return
+
+        projects = self._get_visible_projects()
+        if not projects:
+            self.status.showMessage(self.tr("Brak projektów do eksportu"))
+            return
+
+        reply = QMessageBox.question(
+            self,
+            self.tr("Eksport projektów"),
+            self.tr("Wygenerować raporty dla {0} projektów?").format(len(projects)),
+            QMessageBox.Yes | QMessageBox.No,
+        )
+        if reply != QMessageBox.Yes:
+            return
+
+        if self.batch_report_service is None:
+            db_path = self.session.get_bind().url.database
+            self.batch_report_service = BatchReportService(db_path, parent=self)
+            self.batch_report_service.batch_progress.connect(
+                self._on_batch_report_progress
+            )
+            self.batch_report_service.batch_finished.connect(
+                self._on_batch_report_finished
+            )
+            self.batch_report_service.batch_failed.connect(self._on_batch_report_failed)
+
+        self.status.showMessage(self.tr("Generowanie raportów..."))
+        self.batch_report_service.generate(
+            [p.id for p in projects], self._get_reports_output_dir()
+        )
+
+    def _get_visible_projects(self) -> list:
+        """Projects matching current search and type filters (all pages)"""
+        return self._query_project_rows()
+
+    def on_export_cut_list(self):
+        """Export cut list of visible projects to CSV or columnar file"""
+        projects = self._get_visible_projects()
+        if not projects:
+            self.status.showMessage(self.tr("Brak projektów do eksportu"))
+            return
+
+        csv_filter = self.tr("CSV (*.csv)")
+        columnar_filter = self.tr("Plik kolumnowy Cabplanner (*.cpcl)")
+        path, selected_filter = QFileDialog.getSaveFileName(
+            self,
+            self.tr("Eksportuj listę cięć"),
+            os.path.join(self._get_reports_output_dir(), "lista_ciec.csv"),
+            f"{csv_filter};;{columnar_filter}",
+        )
+        if not path:
+            return
+
+        exporter = CutListExporter(self.project_service)
+        project_ids = [p.id for p in projects]
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            if selected_filter == columnar_filter or path.endswith(".cpcl"):
+                count = exporter.export_columnar(project_ids, path)
+            else:
+                count = exporter.export_csv(project_ids, path)
+        except Exception as e:
+            logger.error(f"Error exporting cut list: {e}", exc_info=True)
+            QMessageBox.critical(
+                self,
+                self.tr("Błąd"),
+                self.tr("Nie udało się wyeksportować listy cięć: {0}").format(str(e)),
+            )
+            return
+
+        self.status.showMessage(
+            self.tr("Wyeksportowano {0} elementów do {1}").format(
+                count, os.path.basename(path)
+            ),
+            5000,
+        )
+
+    def _on_batch_report_progress(self, done: int, total: int, result):
+        self.status.showMessage(
+            self.tr("Generowanie raportów: {0} / {1}").format(done, total)
+        )
+
+    def _on_batch_report_finished(self, results):
+        self.batch_report_service.worker = None
+        failed = [r for r in results if not r.ok]
+        self.status.showMessage(BatchReportService.summarize(results), 5000)
+        if failed:
+            details = "\n".join(f"#{r.project_id}: {r.error}" for r in failed[:10])
+            QMessageBox.warning(
+                self,
+                self.tr("Eksport projektów"),
+                self.tr("Nie udało się wygenerować części raportów:\n{0}").format(
+                    details
+                ),
+            )
+
+    def _on_batch_report_failed(self, error: Exception):
+        self.batch_report_service.worker = None
+        logger.error(f"Batch report generation failed: {error}")
+        QMessageBox.critical(
+            self,
+            self.tr("Błąd"),
+            self.tr("Nie udało się wygenerować raportów: {0}").format(str(error)),
+        )
+        self.status.showMessage(self.tr("Błąd podczas generowania raportów"))
+
     def on_edit_project(self, project):
         """Open project dialog in edit mode"""
         if not project:
@@ -988,6 +1254,7 @@ class MainWindow(QMainWindow):
             return
 
         try:
+            project = self._resolve_project(project)
             # Create project details widget (not dialog)
             details_widget = ProjectDetailsWidget(
                 session=self.session, project=project, parent=self
@@ -1037,6 +1304,7 @@ class MainWindow(QMainWindow):
             return
 
         try:
+            project = self._resolve_project(project)
             # Remove existing project details widget if any
             if self.project_details_widget:
                 self.stack.removeWidget(self.project_details_widget)
@@ -1055,7 +1323,7 @@ class MainWindow(QMainWindow):
             # Load data FIRST before creating widget
             # This prevents any flash since widget will have data when shown
             project_service = ProjectService(self.session)
-            cabinets = project_service.list_cabinets(project.id)
+            cabinets = project_service.list_cabinet_rows(project.id)
             _dbg(f"Loaded {len(cabinets)} cabinets")
 
             _dbg("Creating ProjectDetailsWidget...")
@@ -1261,16 +1529,8 @@ class MainWindow(QMainWindow):
         """UX: Enhanced text filtering with table and card sync"""
         self._current_search_text = text
 
-        # Update table filter
-        proxy: ProjectTableModel = self.table.model()
-        proxy.setFilterKeyColumn(-1)  # Search all columns
-        proxy.setFilterRegularExpression(text)
-
-        # Update card visibility
-        self._update_card_grid_layout()
-
-        # Update project count
-        self._update_counts()
+        # Re-query matching projects (table, cards and counts)
+        self._reload_project_pages()
 
     def on_filter_type(self, kitchen_type: str):
         """UX: Enhanced type filtering"""
@@ -1280,11 +1540,8 @@ class MainWindow(QMainWindow):
         proxy: ProjectTableModel = self.table.model()
         proxy.setTypeFilter(kitchen_type)
 
-        # Update card layout
-        self._update_card_grid_layout()
-
-        # Update project count
-        self._update_counts()
+        # Re-query matching projects (table, cards and counts)
+        self._reload_project_pages()
 
     def on_switch_view(self, idx: int):
         """UX: Enhanced view switching with selection preservation"""
@@ -1329,11 +1586,7 @@ class MainWindow(QMainWindow):
         try:
             dlg = SettingsDialog(self.session, parent=self)
             if dlg.exec():
-                # Refresh theme setting
-                self.is_dark_mode = self.settings_service.get_setting_value(
-                    "dark_mode", False
-                )
-                self._apply_theme()
+                # Theme changes are applied by _on_setting_changed
                 self.status.showMessage(self.tr("Ustawienia zapisane"), 3000)
         except Exception as e:
             logger.error(f"Error opening settings: {e}")
@@ -1378,6 +1631,12 @@ class MainWindow(QMainWindow):
         except Exception as e:
             logger.error(f"Error showing about dialog: {e}")
 
+    def _on_setting_changed(self, key: str, value) -> None:
+        """React to settings saved anywhere in the app (dialogs, toggles)."""
+        if key == "dark_mode" and bool(value) != self.is_dark_mode:
+            self.is_dark_mode = bool(value)
+            self._apply_theme()
+
     def _apply_theme(self):
         """Apply current theme to the window"""
         self.setStyleSheet(get_theme(self.is_dark_mode))
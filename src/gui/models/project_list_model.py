@@ -16,6 +16,9 @@ class ProjectListModel(QAbstractTableModel):
     def __init__(self, projects=None, parent=None):
         super().__init__(parent)
         self._projects = projects or []
+        # fetch_page(last_loaded_row) -> (rows, has_more); None = fixed list
+        self._fetch_page = None
+        self._has_more = False
 
     def rowCount(self, parent=QModelIndex()):
         return len(self._projects)
@@ -43,7 +46,40 @@ class ProjectListModel(QAbstractTableModel):
     def update_projects(self, projects):
         self.beginResetModel()
         self._projects = projects
+        self._fetch_page = None
+        self._has_more = False
         self.endResetModel()
 
+    def set_page_source(self, fetch_page):
+        """
+        Load projects page by page instead of all at once.
+
+        fetch_page(last_row) returns (rows, has_more) for the page following
+        last_row (None for the first page). The first page is loaded right
+        away; views request the rest through canFetchMore()/fetchMore() as
+        the user scrolls.
+        """
+        self.beginResetModel()
+        self._projects = []
+        self._fetch_page = fetch_page
+        self._has_more = True
+        self.endResetModel()
+        self.fetchMore()
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._has_more
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        last_row = self._projects[-1] if self._projects else None
+        rows, self._has_more = self._fetch_page(last_row)
+        if not rows:
+            return
+        first = len(self._projects)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._projects.extend(rows)
+        self.endInsertRows()
+
     def get_project_at_row(self, row):
         return self._projects[row] if 0 <= row < len(self._projects) else None
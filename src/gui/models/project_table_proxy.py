@@ -10,12 +10,18 @@ class ProjectTableModel(QSortFilterProxyModel):
         self.setSourceModel(source_model)
         self.setFilterCaseSensitivity(Qt.CaseInsensitive)
         self._type_filter = ""
+        self._id_filter = None
 
     def setTypeFilter(self, kt: str):
         """Called when user picks from the combo."""
         self._type_filter = kt or ""
         self.invalidateFilter()
 
+    def setIdFilter(self, project_ids):
+        """Show only projects with these IDs (e.g. search hits); None = all."""
+        self._id_filter = project_ids
+        self.invalidateFilter()
+
     def filterAcceptsRow(self, source_row, source_parent):
         src = self.sourceModel()
         # 1) Type‐filter: if set, must match exactly
@@ -24,7 +30,12 @@ class ProjectTableModel(QSortFilterProxyModel):
             if src.data(idx_type) != self._type_filter:
                 return False
 
-        # 2) Text‐filter: empty = allow all
+        # 2) Search hits computed by the project search
+        if self._id_filter is not None:
+            project = src.get_project_at_row(source_row)
+            return project is not None and project.id in self._id_filter
+
+        # 3) Text‐filter: empty = allow all
         pattern = self.filterRegularExpression().pattern().lower()
         if not pattern:
             return True
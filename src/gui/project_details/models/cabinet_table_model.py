@@ -5,15 +5,15 @@ Cabinet table model used by ProjectDetailsView.
 from typing import List
 from PySide6.QtCore import QAbstractTableModel, Signal, Qt, QModelIndex
 
-from src.db_schema.orm_models import ProjectCabinet
+from src.services.project_service import CabinetListRow
 
 
 class CabinetTableModel(QAbstractTableModel):
-    """Table model for cabinet data shown in ProjectDetailsView."""
+    """Table model for cabinet display rows shown in ProjectDetailsView."""
 
     cabinet_data_changed = Signal(int, str, object)
 
-    def __init__(self, cabinets: List[ProjectCabinet], parent=None):
+    def __init__(self, cabinets: List[CabinetListRow], parent=None):
         super().__init__(parent)
         self.cabinets = cabinets or []
         self.columns = [
@@ -52,9 +52,11 @@ class CabinetTableModel(QAbstractTableModel):
             if col == 0:
                 return cabinet.sequence_number or ""
             if col == 1:
-                return self._cabinet_name(cabinet)
+                return cabinet.name
             if col == 2:
-                return self._cabinet_dimensions(cabinet)
+                if cabinet.width_mm and cabinet.height_mm:
+                    return f"{cabinet.width_mm}x{cabinet.height_mm} mm"
+                return "brak wymiarów"
             if col == 3:
                 return cabinet.front_color or "Biały"
             if col == 4:
@@ -73,7 +75,7 @@ class CabinetTableModel(QAbstractTableModel):
             return self.columns[section]
         return None
 
-    def set_rows(self, cabinets: List[ProjectCabinet]):
+    def set_rows(self, cabinets: List[CabinetListRow]):
         self.beginResetModel()
         self.cabinets = cabinets or []
         self.endResetModel()
@@ -83,55 +85,3 @@ class CabinetTableModel(QAbstractTableModel):
         if row < 0 or row >= len(self.cabinets):
             return None
         return self.cabinets[row].id
-
-    def _cabinet_name(self, cabinet: ProjectCabinet) -> str:
-        if getattr(cabinet, "cabinet_type", None) and cabinet.cabinet_type.name:
-            return cabinet.cabinet_type.name
-
-        parts = getattr(cabinet, "parts", None) or []
-        for part in parts:
-            ctx = getattr(part, "calc_context_json", None)
-            if isinstance(ctx, dict) and ctx.get("template_name"):
-                return f"{ctx['template_name']} + niestandardowa"
-
-        return "Niestandardowy"
-
-    def _cabinet_dimensions(self, cabinet: ProjectCabinet) -> str:
-        width = height = depth = None
-        parts = getattr(cabinet, "parts", None) or []
-
-        if len(parts) == 1:
-            part = parts[0]
-            if self._is_positive_number(getattr(part, "width_mm", None)):
-                width = int(part.width_mm)
-            if self._is_positive_number(getattr(part, "height_mm", None)):
-                height = int(part.height_mm)
-        elif len(parts) >= 2:
-            widths = [
-                int(p.width_mm)
-                for p in parts
-                if self._is_positive_number(getattr(p, "width_mm", None))
-            ]
-            heights = [
-                int(p.height_mm)
-                for p in parts
-                if self._is_positive_number(getattr(p, "height_mm", None))
-            ]
-
-            if widths:
-                width = widths[0] if len(set(widths)) == 1 else max(widths)
-            if heights:
-                height = heights[0] if len(set(heights)) == 1 else max(heights)
-            # Depth is intentionally not inferred from mixed parts.
-
-        if width and height:
-            dims = f"{width}x{height}"
-            if depth:
-                dims += f"x{depth}"
-            return f"{dims} mm"
-
-        return "brak wymiarów"
-
-    @staticmethod
-    def _is_positive_number(value) -> bool:
-        return isinstance(value, (int, float)) and value > 0
@@ -19,7 +19,7 @@ from PySide6.QtWidgets import (
     QLabel,
     QPushButton,
 )
-from PySide6.QtCore import Signal, Qt, QTimer, QSettings
+from PySide6.QtCore import Signal, Qt, QSettings
 from PySide6.QtGui import QFont
 from sqlalchemy.orm import Session
 
@@ -29,6 +29,7 @@ from src.controllers.project_details_controller import ProjectDetailsController
 from src.gui.cabinet_catalog.window import CatalogWindow
 from src.services.catalog_service import CatalogService
 from src.services.color_palette_service import ColorPaletteService
+from src.services.project_service import CabinetListRow
 from src.services.settings_service import SettingsService
 from src.domain.sorting import sort_cabinets
 from .constants import (
@@ -436,7 +437,7 @@ class ProjectDetailsView(QDialog):
         """Backward-compatible no-op; children inherit parent theme."""
         return
 
-    def apply_card_order(self, ordered_cabinets: List[ProjectCabinet]) -> None:
+    def apply_card_order(self, ordered_cabinets: List[CabinetListRow]) -> None:
         """
         Apply the given cabinet order to the view.
 
@@ -469,7 +470,7 @@ class ProjectDetailsView(QDialog):
             self._show_error(f"Błąd podczas odświeżania widoku: {e}")
 
     def _can_reorder_existing_cards(
-        self, ordered_cabinets: List[ProjectCabinet]
+        self, ordered_cabinets: List[CabinetListRow]
     ) -> bool:
         """Check if we can reorder existing cards instead of rebuilding all."""
         # If more cabinets than cards, we need to create new ones - full rebuild
@@ -484,7 +485,7 @@ class ProjectDetailsView(QDialog):
         # Can reorder even if some cards were deleted (we'll remove them)
         return True
 
-    def _reorder_existing_cards(self, ordered_cabinets: List[ProjectCabinet]) -> None:
+    def _reorder_existing_cards(self, ordered_cabinets: List[CabinetListRow]) -> None:
         """Reorder existing cards and update their data."""
         self._dbg("_reorder_existing_cards: starting...")
 
@@ -527,7 +528,7 @@ class ProjectDetailsView(QDialog):
 
         self._update_view_state()
 
-    def _rebuild_all_cards(self, ordered_cabinets: List[ProjectCabinet]) -> None:
+    def _rebuild_all_cards(self, ordered_cabinets: List[CabinetListRow]) -> None:
         """Rebuild all cards from scratch."""
         if not ordered_cabinets:
             self._update_view_state()
@@ -716,7 +717,7 @@ class ProjectDetailsView(QDialog):
             # Log error but don't crash
             logger.exception("Error handling table double-click: %s", e)
 
-    def _on_cabinet_updated(self, updated_cabinet: ProjectCabinet) -> None:
+    def _on_cabinet_updated(self, updated_cabinet: CabinetListRow) -> None:
         """Handle cabinet update notification from controller."""
         # Update the specific card if it exists
         if updated_cabinet.id in self._cards_by_id:
@@ -745,12 +746,10 @@ class ProjectDetailsView(QDialog):
         from src.gui.cabinet_editor import CabinetEditorDialog
 
         try:
-            # Find the cabinet
+            # Display rows carry no relationships; load the entity to edit
             cabinet = None
-            for c in self.cabinets:
-                if c.id == cabinet_id:
-                    cabinet = c
-                    break
+            if self.controller and any(c.id == cabinet_id for c in self.cabinets):
+                cabinet = self.controller.project_service.get_cabinet(cabinet_id)
 
             if not cabinet:
                 self._show_error("Nie znaleziono szafki")
@@ -844,82 +843,21 @@ class ProjectDetailsView(QDialog):
         else:
             logger.info(f"Success (no banner manager): {message}")
 
-    def _cabinet_to_card_data(self, cabinet: ProjectCabinet) -> Dict[str, Any]:
-        """Convert ProjectCabinet to card data dict using snapshot data."""
-        # Get dimensions from parts snapshot (works for both standard and custom cabinets)
-        width = height = depth = None
-        cabinet_name = "Niestandardowy"
-
-        # Calculate dimensions from parts snapshot
-        if hasattr(cabinet, "parts") and cabinet.parts:
-            parts = cabinet.parts
-
-            if len(parts) == 1:
-                # Single part: use 2D dimensions (width and height)
-                part = parts[0]
-                if part.width_mm is not None:
-                    width = int(part.width_mm)
-                if part.height_mm is not None:
-                    height = int(part.height_mm)
-                # Don't set depth for single part
-
-            elif len(parts) >= 2:
-                # Multiple parts: analyze if we can determine 3D dimensions
-                # Check which dimensions are consistent across parts
-                widths = [int(p.width_mm) for p in parts if p.width_mm is not None]
-                heights = [int(p.height_mm) for p in parts if p.height_mm is not None]
-
-                # If widths are all the same, it's the cabinet width
-                if widths and len(set(widths)) == 1:
-                    width = widths[0]
-                elif widths:
-                    # Use the most common width or max
-                    width = max(widths)
-
-                # If heights are all the same, it's the cabinet height
-                if heights and len(set(heights)) == 1:
-                    height = heights[0]
-                elif heights:
-                    # Use the most common height or max
-                    height = max(heights)
-
-                # Depth is intentionally not inferred from mixed part widths because
-                # that heuristic is often misleading for users.
-
-            # Try to get name from calculation context (for custom cabinets)
-            if not cabinet.cabinet_type and cabinet.parts:
-                # Check if any part has calc_context_json with template_name
-                for part in cabinet.parts:
-                    if (
-                        part.calc_context_json
-                        and isinstance(part.calc_context_json, dict)
-                        and "template_name" in part.calc_context_json
-                    ):
-                        template_name = part.calc_context_json["template_name"]
-                        cabinet_name = f"{template_name} + niestandardowa"
-                        break
-
-        # Note: Do NOT set default dimensions if no parts found
-        # This allows the card to hide dimension section when there are no parts
-        # Do NOT set default depth - only display it when we can calculate it from parts
-
-        # Get cabinet name (from template if standard, from context if custom)
-        if cabinet.cabinet_type:
-            cabinet_name = cabinet.cabinet_type.name
-
+    def _cabinet_to_card_data(self, cabinet: CabinetListRow) -> Dict[str, Any]:
+        """Convert a cabinet display row to card data dict."""
+        # Dimensions stay None when the cabinet has no parts, so the card
+        # hides the dimension section. Depth is not inferred from parts.
         return {
             "id": cabinet.id,
-            "name": cabinet_name,
+            "name": cabinet.name,
             "sequence": cabinet.sequence_number or 1,
             "quantity": cabinet.quantity or 1,
             "body_color": cabinet.body_color or "Biały",
             "front_color": cabinet.front_color or "Biały",
-            "width_mm": width,
-            "height_mm": height,
-            "depth_mm": depth,
-            "kitchen_type": cabinet.cabinet_type.kitchen_type
-            if cabinet.cabinet_type
-            else "CUSTOM",
+            "width_mm": cabinet.width_mm,
+            "height_mm": cabinet.height_mm,
+            "depth_mm": None,
+            "kitchen_type": cabinet.kitchen_type,
         }
 
     def _update_header_info(self) -> None:
@@ -990,11 +928,8 @@ class ProjectDetailsView(QDialog):
                 parent=self,
             )
 
-            # Connect signal to handle cabinet addition
-            catalog_window.sig_added_to_project.connect(
-                self._on_cabinet_added_from_catalog
-            )
-
+            # Cabinets are added through controller.add_catalog_cabinets(),
+            # which refreshes the view once for the whole batch
             # Show the catalog window
             catalog_window.exec()
 
@@ -1003,20 +938,6 @@ class ProjectDetailsView(QDialog):
             # Fallback to signal for now
             self.sig_add_from_catalog.emit()
 
-    def _on_cabinet_added_from_catalog(
-        self, cabinet_type_id: int, project_id: int, quantity: int, options: dict
-    ):
-        """Handle cabinet added from catalog."""
-        try:
-            # Defer refresh to next event loop iteration to avoid blocking
-            def do_refresh():
-                if self.controller:
-                    self.controller.load_data()
-
-            QTimer.singleShot(0, do_refresh)
-        except Exception:
-            logger.exception("Error refreshing after cabinet addition from catalog")
-
     def _handle_add_custom(self):
         """Handle add custom cabinet request."""
         try:
@@ -1123,6 +1044,15 @@ class ProjectDetailsView(QDialog):
         self._data_loaded = True
         self.controller.load_data()
 
+    def hideEvent(self, event):
+        """Write pending stepper edits when the view is closed or hidden."""
+        commit_pending_changes = getattr(
+            self.controller, "commit_pending_changes", None
+        )
+        if commit_pending_changes:
+            commit_pending_changes()
+        super().hideEvent(event)
+
     def showEvent(self, event):
         """Load data when dialog is actually shown to prevent flash."""
         super().showEvent(event)
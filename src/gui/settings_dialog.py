@@ -28,6 +28,7 @@ from PySide6.QtGui import QPixmap
 
 from sqlalchemy.orm import Session
 
+from src.app.sqlite_tuning import DEFAULT_PRESET, PRESET_SETTING_KEY, PRESETS
 from src.services.settings_service import SettingsService
 from src.services.updater_service import UpdaterService
 from src.gui.update_dialog import UpdateDialog
@@ -113,6 +114,16 @@ class SettingsDialog(QDialog):
 
         db_layout.addRow("Ścieżka do bazy danych:", db_path_layout)
 
+        self.db_performance_preset = QComboBox()
+        self.db_performance_preset.addItems(list(PRESETS))
+        self.db_performance_preset.setToolTip(
+            "Bezpieczny - ustawienia domyślne SQLite, pełna synchronizacja zapisu.\n"
+            "Zrównoważony - dziennik WAL i szybszy zapis.\n"
+            "Wydajny - jak zrównoważony, z większą pamięcią podręczną.\n"
+            "Zmiana zostanie zastosowana po ponownym uruchomieniu programu."
+        )
+        db_layout.addRow("Tryb pracy bazy danych:", self.db_performance_preset)
+
         # Auto-update settings
         self.autoupdate_check = QCheckBox("Automatycznie sprawdzaj aktualizacje")
         db_layout.addRow(self.autoupdate_check)
@@ -241,6 +252,37 @@ class SettingsDialog(QDialog):
         )
         report_layout.addRow("Logo Cabplanner:", self.report_program_logo_variant)
 
+        self.report_include_sheet_summary = QCheckBox(
+            "Dodaj zapotrzebowanie na płyty (arkusze 2800 x 2070)"
+        )
+        self.report_include_sheet_summary.setToolTip(
+            "Raport zawiera wtedy liczbę arkuszy potrzebnych dla każdego "
+            "materiału i koloru, wyliczoną z rozkroju formatek."
+        )
+        report_layout.addRow("", self.report_include_sheet_summary)
+
+        self.report_sheet_nesting_deep = QCheckBox(
+            "Dokładniejszy rozkrój arkuszy (wolniej, do kilku sekund)"
+        )
+        self.report_sheet_nesting_deep.setToolTip(
+            "Rozkrój jest wtedy dodatkowo optymalizowany, co może zmniejszyć "
+            "liczbę arkuszy kosztem dłuższego generowania raportu."
+        )
+        self.report_include_sheet_summary.toggled.connect(
+            self.report_sheet_nesting_deep.setEnabled
+        )
+        report_layout.addRow("", self.report_sheet_nesting_deep)
+
+        self.report_include_edge_banding = QCheckBox(
+            "Dodaj zapotrzebowanie na okleinę (metry wg koloru)"
+        )
+        self.report_include_edge_banding.setToolTip(
+            "Raport zawiera wtedy długość okleiny dla każdego koloru, "
+            "wyliczoną z kodów oklejania formatek (D - dłuższy bok, "
+            "K - krótszy bok)."
+        )
+        report_layout.addRow("", self.report_include_edge_banding)
+
         layout.addWidget(report_group)
 
         layout.addStretch()
@@ -350,6 +392,17 @@ class SettingsDialog(QDialog):
                 )
                 self.db_path_edit.setText(default_db_path)
 
+            index = self.db_performance_preset.findText(
+                self.settings_service.get_setting_value(
+                    PRESET_SETTING_KEY, DEFAULT_PRESET
+                )
+            )
+            self.db_performance_preset.setCurrentIndex(
+                index
+                if index >= 0
+                else self.db_performance_preset.findText(DEFAULT_PRESET)
+            )
+
             # Auto-update settings
             self.autoupdate_check.setChecked(
                 self.settings_service.get_setting_value("auto_update_enabled", True)
@@ -442,6 +495,25 @@ class SettingsDialog(QDialog):
             else:
                 self.report_program_logo_variant.setCurrentIndex(0)
 
+            self.report_include_sheet_summary.setChecked(
+                self.settings_service.get_setting_value(
+                    "report_include_sheet_summary", False
+                )
+            )
+            self.report_sheet_nesting_deep.setChecked(
+                self.settings_service.get_setting_value(
+                    "report_sheet_nesting_deep", False
+                )
+            )
+            self.report_sheet_nesting_deep.setEnabled(
+                self.report_include_sheet_summary.isChecked()
+            )
+            self.report_include_edge_banding.setChecked(
+                self.settings_service.get_setting_value(
+                    "report_include_edge_banding", False
+                )
+            )
+
             # Appearance settings
             self.dark_mode_check.setChecked(
                 self.settings_service.get_setting_value("dark_mode", False)
@@ -500,6 +572,9 @@ class SettingsDialog(QDialog):
 
             # Database settings
             self.settings_service.set_setting("db_path", self.db_path_edit.text())
+            self.settings_service.set_setting(
+                PRESET_SETTING_KEY, self.db_performance_preset.currentText()
+            )
 
             # Auto-update settings
             self.settings_service.set_setting(
@@ -532,6 +607,18 @@ class SettingsDialog(QDialog):
                 "report_program_logo_variant",
                 self.report_program_logo_variant.currentText(),
             )
+            self.settings_service.set_setting(
+                "report_include_sheet_summary",
+                self.report_include_sheet_summary.isChecked(),
+            )
+            self.settings_service.set_setting(
+                "report_sheet_nesting_deep",
+                self.report_sheet_nesting_deep.isChecked(),
+            )
+            self.settings_service.set_setting(
+                "report_include_edge_banding",
+                self.report_include_edge_banding.isChecked(),
+            )
 
             # Appearance settings
             self.settings_service.set_setting(
@@ -711,6 +798,7 @@ class SettingsDialog(QDialog):
         try:
             # Set default values for core settings
             default_settings = {
+                PRESET_SETTING_KEY: DEFAULT_PRESET,
                 "auto_update_enabled": True,
                 "auto_update_frequency": "Przy uruchomieniu",
                 "create_shortcut_on_start": True,
@@ -720,6 +808,9 @@ class SettingsDialog(QDialog):
                 ),
                 "report_page_break_strictness": "Standardowa",
                 "report_program_logo_variant": "Czarno-białe",
+                "report_include_sheet_summary": False,
+                "report_sheet_nesting_deep": False,
+                "report_include_edge_banding": False,
                 "dark_mode": False,
                 "company_logo_path": "",
             }
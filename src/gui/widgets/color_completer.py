@@ -0,0 +1,49 @@
+"""
+Fuzzy completer for color name combo boxes.
+
+QCompleter can only filter its model by prefix or substring. This completer
+asks a search function (ColorPaletteService.search_colors or a local
+ColorSearchIndex) for the best matches of the typed text instead and shows
+them unfiltered, in ranking order.
+"""
+
+import logging
+from typing import Callable, List
+
+from PySide6.QtCore import QStringListModel, Qt
+from PySide6.QtWidgets import QComboBox, QCompleter
+
+logger = logging.getLogger(__name__)
+
+SearchFunction = Callable[[str, int], List[str]]
+
+
+class ColorCompleter(QCompleter):
+    """Completer showing ranked fuzzy matches of the typed color name."""
+
+    def __init__(self, search: SearchFunction, parent=None, limit: int = 15):
+        super().__init__(parent)
+        self._search = search
+        self._limit = limit
+        self._matches = QStringListModel(self)
+        self.setModel(self._matches)
+        self.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self.setCompletionMode(QCompleter.CompletionMode.UnfilteredPopupCompletion)
+
+    def attach(self, combo: QComboBox) -> None:
+        """Install on an editable combo box."""
+        combo.setCompleter(self)
+        # Runs before QLineEdit opens the popup for the same edit
+        combo.lineEdit().textEdited.connect(self.update_matches)
+
+    def update_matches(self, text: str) -> None:
+        matches: List[str] = []
+        if text.strip():
+            try:
+                matches = self._search(text, self._limit)
+            except Exception as exc:
+                logger.warning("Color search failed: %s", exc)
+        self._matches.setStringList(matches)
+
+    def matches(self) -> List[str]:
+        return self._matches.stringList()
@@ -1,3 +1,4 @@
+import multiprocessing
 import sys
 
 from src.app.logging_config import configure_logging
@@ -12,6 +13,7 @@ from src.app.theme import apply_theme
 from src.app.resources import set_app_icon
 from src.app.updates import wire_startup_update_check
 from src.app.instance_guard import enforce_single_instance
+from src.services.color_palette_service import ColorPaletteService
 
 
 def main():
@@ -27,7 +29,8 @@ def main():
     session = create_session(db_path)
     seed_cabinet_templates_if_first_run(session, base)
 
-    # Ensure session is closed on app quit
+    # Write queued color usage, then close the session on app quit
+    app.aboutToQuit.connect(ColorPaletteService(session).flush_usage)
     app.aboutToQuit.connect(session.close)
 
     services = create_services(session)  # returns {'settings': ..., 'updater': ...}
@@ -46,4 +49,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Batch report generation spawns worker processes; required for frozen builds.
+    multiprocessing.freeze_support()
     main()
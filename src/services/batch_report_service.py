@@ -0,0 +1,97 @@
+"""
+Qt-facing service for batch report generation.
+
+Runs ReportBatchRunner on a QThreadPool thread (the runner itself fans out to
+a process pool) and reports progress through signals, so the GUI event loop
+never blocks.
+"""
+
+import logging
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from src.services.report_batch import BatchReportResult, ReportBatchRunner
+
+logger = logging.getLogger(__name__)
+
+
+class BatchReportWorker(QRunnable):
+    """Worker driving a batch report run in a background thread."""
+
+    def __init__(
+        self,
+        service: "BatchReportService",
+        project_ids: Sequence[int],
+        output_dir: str,
+    ):
+        super().__init__()
+        self.service = service
+        self.project_ids = list(project_ids)
+        self.output_dir = output_dir
+        self.cancelled = False
+
+    def is_cancelled(self) -> bool:
+        """Check if the batch was cancelled."""
+        return self.cancelled
+
+    def cancel(self):
+        """Cancel projects that have not started yet."""
+        self.cancelled = True
+
+    def run(self):
+        """Render all reports without blocking UI."""
+        try:
+            results = self.service.runner.run(
+                self.project_ids,
+                self.output_dir,
+                progress_callback=self._on_progress,
+                is_cancelled=self.is_cancelled,
+            )
+            self.service.batch_finished.emit(results)
+        except Exception as e:
+            logger.exception("Batch report generation failed: %s", e)
+            self.service.batch_failed.emit(e)
+
+    def _on_progress(self, done: int, total: int, result: BatchReportResult):
+        self.service.batch_progress.emit(done, total, result)
+
+
+class BatchReportService(QObject):
+    """Service for generating reports of many projects in parallel."""
+
+    batch_progress = Signal(int, int, object)  # done, total, BatchReportResult
+    batch_finished = Signal(list)  # List[BatchReportResult]
+    batch_failed = Signal(Exception)
+
+    def __init__(self, db_path: Path, max_workers: Optional[int] = None, parent=None):
+        super().__init__(parent)
+        self.runner = ReportBatchRunner(db_path, max_workers=max_workers)
+        self.thread_pool = QThreadPool()
+        self.worker: Optional[BatchReportWorker] = None
+
+    def generate(self, project_ids: Sequence[int], output_dir: str):
+        """Start generating reports for project_ids asynchronously."""
+        logger.info(
+            "Starting batch report generation for %d projects", len(project_ids)
+        )
+        self.worker = BatchReportWorker(self, project_ids, output_dir)
+        self.thread_pool.start(self.worker)
+
+    def cancel(self):
+        """Cancel the running batch (projects already rendering will finish)."""
+        if self.worker:
+            logger.info("Cancelling batch report generation...")
+            self.worker.cancel()
+            self.worker = None
+
+    @staticmethod
+    def summarize(results: List[BatchReportResult]) -> str:
+        """Human readable summary of a finished batch."""
+        failed = [r for r in results if not r.ok]
+        if not failed:
+            return f"Wygenerowano {len(results)} raportów"
+        return (
+            f"Wygenerowano {len(results) - len(failed)} raportów, błędy: {len(failed)}"
+        )
@@ -6,19 +6,87 @@ Provides persistence and lookup for cabinet colors (system + user-defined).
 
 from __future__ import annotations
 
+import logging
 import re
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Dict, Optional
+from weakref import WeakKeyDictionary, WeakSet
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, select, update
 from sqlalchemy.orm import Session
 
 from src.db_schema.orm_models import CabinetColor
+from src.domain.color_lab import ColorLabIndex, ColorMatch
+from src.domain.color_search import ColorSearchIndex
 from src.services.color_dictionary_snapshot import SYSTEM_COLOR_SNAPSHOT
 
+logger = logging.getLogger(__name__)
+
 HEX_RE = re.compile(r"^#(?:[0-9A-Fa-f]{3}|[0-9A-Fa-f]{6})$")
 
 
+@dataclass
+class _PendingUsage:
+    """Usage of one color accumulated since the last flush."""
+
+    name: str
+    count: int
+    last_used_at: datetime
+
+
+class ColorUsageQueue:
+    """
+    In-memory color usage events of one session.
+
+    Events for the same color are merged, so a flush writes one row per
+    color regardless of how many cabinets used it.
+    """
+
+    def __init__(self):
+        self._pending: Dict[str, _PendingUsage] = {}
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def record(self, name: str, when: Optional[datetime] = None) -> None:
+        canonical = ColorPaletteService._canonical_name(name)
+        if not canonical:
+            return
+        when = when or datetime.now(timezone.utc)
+        key = ColorPaletteService._normalize_name(canonical)
+        usage = self._pending.get(key)
+        if usage is None:
+            self._pending[key] = _PendingUsage(canonical, 1, when)
+        else:
+            usage.count += 1
+            usage.last_used_at = max(usage.last_used_at, when)
+
+    def take(self) -> Dict[str, _PendingUsage]:
+        pending, self._pending = self._pending, {}
+        return pending
+
+    def restore(self, pending: Dict[str, _PendingUsage]) -> None:
+        """Put back events of a failed flush, merged with newer ones."""
+        for key, usage in pending.items():
+            newer = self._pending.get(key)
+            if newer is None:
+                self._pending[key] = usage
+            else:
+                newer.count += usage.count
+                newer.last_used_at = max(newer.last_used_at, usage.last_used_at)
+
+
+# Shared by all ColorPaletteService instances working on the same session.
+_usage_queues: "WeakKeyDictionary[Session, ColorUsageQueue]" = WeakKeyDictionary()
+# Databases (engines) whose system dictionary was checked in this process.
+_seeded_binds: WeakSet = WeakSet()
+# Fuzzy search index of active colors per database, built on first search.
+_search_indexes: "WeakKeyDictionary[object, ColorSearchIndex]" = WeakKeyDictionary()
+# Lab k-d tree of active colors per database, built on first nearest lookup.
+_lab_indexes: "WeakKeyDictionary[object, ColorLabIndex]" = WeakKeyDictionary()
+
+
 class ColorPaletteService:
     """Business logic for the cabinet color dictionary."""
 
@@ -48,22 +116,27 @@ class ColorPaletteService:
 
     @staticmethod
     def _static_hex_lookup(color_name: str) -> Optional[str]:
-        from src.gui.constants.colors import COLOR_MAP
+        """Static HEX for a name that may be stored as a new palette row."""
+        from src.gui.constants.colors import COLOR_INDEX
 
-        if color_name in COLOR_MAP:
-            return COLOR_MAP[color_name]
+        return COLOR_INDEX.lookup_static_exact(color_name)
 
-        normalized = " ".join((color_name or "").strip().split()).casefold()
-        for key, hex_code in COLOR_MAP.items():
-            if key.casefold() == normalized:
-                return hex_code
-        return None
+    @staticmethod
+    def _register_runtime_color(color: CabinetColor) -> None:
+        from src.gui.constants.colors import register_runtime_color
+
+        register_runtime_color(color.name, color.hex_code)
 
     def ensure_seeded(self) -> None:
         """
         Ensure system dictionary rows are present.
-        Idempotent and safe to call at startup.
+        Idempotent and safe to call at startup; after the first check the
+        database is not queried again in this process.
         """
+        bind = self.db.get_bind()
+        if bind in _seeded_binds:
+            return
+
         existing = set(
             self.db.scalars(
                 select(CabinetColor.normalized_name).where(
@@ -93,12 +166,16 @@ class ColorPaletteService:
         if pending:
             self.db.add_all(pending)
             self.db.commit()
+            self._index_new_colors((color.name, color.hex_code) for color in pending)
+        _seeded_binds.add(bind)
 
     def list_recent(self, limit: int = 12) -> list[str]:
         """Return recently used color names sorted by latest usage."""
         if limit <= 0:
             return []
 
+        self.flush_usage()
+
         stmt = (
             select(CabinetColor.name)
             .where(
@@ -114,14 +191,72 @@ class ColorPaletteService:
         )
         return list(self.db.scalars(stmt).all())
 
-    def list_searchable_names(self) -> list[str]:
-        """Return all active color names for completer/search."""
-        stmt = (
-            select(CabinetColor.name)
-            .where(CabinetColor.is_active.is_(True))
-            .order_by(CabinetColor.source.asc(), CabinetColor.name.asc())
-        )
-        return list(self.db.scalars(stmt).all())
+    def search_index(self) -> ColorSearchIndex:
+        """
+        Trigram index of active colors with their usage statistics.
+
+        Built from the database once per process; the write paths of this
+        service keep it current afterwards.
+        """
+        bind = self.db.get_bind()
+        index = _search_indexes.get(bind)
+        if index is None:
+            index = ColorSearchIndex()
+            rows = self.db.execute(
+                select(
+                    CabinetColor.name,
+                    CabinetColor.usage_count,
+                    CabinetColor.last_used_at,
+                ).where(CabinetColor.is_active.is_(True))
+            )
+            for name, usage_count, last_used_at in rows:
+                index.add(name, usage_count, last_used_at)
+            _search_indexes[bind] = index
+        return index
+
+    def _index_new_colors(self, colors) -> None:
+        """Add (name, hex) pairs to the indexes built so far."""
+        colors = list(colors)
+        bind = self.db.get_bind()
+        search_index = _search_indexes.get(bind)
+        if search_index is not None:
+            search_index.add_many(name for name, _ in colors)
+        lab_index = _lab_indexes.get(bind)
+        if lab_index is not None:
+            lab_index.add_many(colors)
+
+    def search_colors(self, query: str, limit: int = 10) -> list[str]:
+        """
+        Fuzzy color name search for completers.
+
+        Tolerates typos, missing diacritics and word order; frequently and
+        recently used colors rank first among equally good matches.
+        """
+        return self.search_index().search(query, limit)
+
+    def lab_index(self) -> ColorLabIndex:
+        """Lab k-d tree of active colors, built once per process."""
+        bind = self.db.get_bind()
+        index = _lab_indexes.get(bind)
+        if index is None:
+            index = ColorLabIndex()
+            index.add_many(
+                self.db.execute(
+                    select(CabinetColor.name, CabinetColor.hex_code).where(
+                        CabinetColor.is_active.is_(True)
+                    )
+                )
+            )
+            _lab_indexes[bind] = index
+        return index
+
+    def nearest_colors(self, hex_code: str, limit: int = 5) -> list[ColorMatch]:
+        """
+        Named colors closest to a HEX sample, closest first.
+
+        Distance is CIE76 ΔE in Lab space. Raises ValueError for invalid HEX.
+        """
+        return self.lab_index().nearest(self._normalize_hex(hex_code), limit)
 
     def resolve_hex(self, color_name: str) -> Optional[str]:
         """
@@ -147,7 +282,10 @@ class ColorPaletteService:
         if row:
             return row
 
-        return self._static_hex_lookup(value)
+        # Diacritic-insensitive match among runtime and static colors
+        from src.gui.constants.colors import COLOR_INDEX
+
+        return COLOR_INDEX.lookup(value)
 
     def add_user_color(self, name: str, hex_code: str) -> CabinetColor:
         """Create a user-defined color entry."""
@@ -175,6 +313,8 @@ class ColorPaletteService:
         self.db.add(color)
         self.db.commit()
         self.db.refresh(color)
+        self._register_runtime_color(color)
+        self._index_new_colors([(color.name, color.hex_code)])
         return color
 
     def mark_used(self, color_name: str) -> Optional[CabinetColor]:
@@ -209,8 +349,118 @@ class ColorPaletteService:
         color.last_used_at = datetime.now(timezone.utc)
         self.db.commit()
         self.db.refresh(color)
+        self._register_runtime_color(color)
+        self._index_new_colors([(color.name, color.hex_code)])
+        index = _search_indexes.get(self.db.get_bind())
+        if index is not None:
+            index.add(color.name, color.usage_count, color.last_used_at)
         return color
 
+    def usage_queue(self) -> ColorUsageQueue:
+        queue = _usage_queues.get(self.db)
+        if queue is None:
+            queue = _usage_queues[self.db] = ColorUsageQueue()
+        return queue
+
+    def record_usage(self, *color_names: str) -> None:
+        """Queue usage of colors; written by the next flush_usage()."""
+        queue = self.usage_queue()
+        for name in color_names:
+            queue.record(name)
+
+    def flush_usage(self) -> int:
+        """
+        Write queued usage: one executemany UPDATE plus inserts for names
+        known only from the static map. Returns the number of colors written.
+
+        The session is shared with the rest of the application, so nothing
+        is written while it holds other pending changes or a ProjectService
+        unit of work is open: the commit (or the rollback on failure) would
+        take them along. The queue is kept for a later flush.
+        """
+        queue = self.usage_queue()
+        if not len(queue) or self._has_pending_changes():
+            return 0
+
+        pending = queue.take()
+        try:
+            self.ensure_seeded()
+            known = set(
+                self.db.scalars(
+                    select(CabinetColor.normalized_name).where(
+                        CabinetColor.normalized_name.in_(list(pending))
+                    )
+                ).all()
+            )
+            added = []
+            for key, usage in pending.items():
+                if key in known:
+                    continue
+                fallback_hex = self._static_hex_lookup(usage.name)
+                if not fallback_hex:
+                    continue
+                color = CabinetColor(
+                    name=usage.name,
+                    normalized_name=key,
+                    hex_code=self._normalize_hex(fallback_hex),
+                    source="user",
+                    usage_count=0,
+                    is_active=True,
+                )
+                self.db.add(color)
+                added.append((usage.name, color.hex_code))
+                known.add(key)
+            self.db.flush()
+
+            table = CabinetColor.__table__
+            rows = [
+                {"key": key, "count": usage.count, "used_at": usage.last_used_at}
+                for key, usage in pending.items()
+                if key in known
+            ]
+            if rows:
+                self.db.execute(
+                    update(table)
+                    .where(
+                        table.c.normalized_name == bindparam("key"),
+                        table.c.is_active.is_(True),
+                    )
+                    .values(
+                        usage_count=table.c.usage_count + bindparam("count"),
+                        last_used_at=bindparam("used_at"),
+                    ),
+                    rows,
+                )
+            self.db.commit()
+        except Exception as exc:
+            self.db.rollback()
+            queue.restore(pending)
+            logger.warning("Color usage flush failed: %s", exc)
+            return 0
+
+        from src.gui.constants.colors import register_runtime_color
+
+        for name, hex_code in added:
+            register_runtime_color(name, hex_code)
+
+        self._index_new_colors(added)
+        index = _search_indexes.get(self.db.get_bind())
+        if index is not None:
+            for row in rows:
+                usage = pending[row["key"]]
+                if usage.name in index:
+                    index.record_usage(usage.name, usage.count, usage.last_used_at)
+        return len(rows)
+
+    def _has_pending_changes(self) -> bool:
+        """Whether the session holds changes this service must not commit."""
+        from src.services.project_service import ProjectService
+
+        db = self.db
+        return bool(
+            db.new or db.dirty or db.deleted or ProjectService(db).in_unit_of_work()
+        )
+
     def sync_runtime_color_map(self) -> dict[str, str]:
         """Push DB colors to runtime GUI color map used by chips/previews."""
         from src.gui.constants.colors import register_runtime_colors
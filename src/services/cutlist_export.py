@@ -0,0 +1,220 @@
+"""
+Cut-list export for saw optimizers and CNC tools.
+
+Exports the panel parts of one or many projects (accessories are not cut
+parts and are skipped) as either:
+
+* CSV - UTF-8, ``;``-separated, one header row, plain integer dimensions;
+* a compact binary columnar file (".cpcl") - rows are written in row groups;
+  integer columns are stored as little-endian int32 arrays and text columns
+  are dictionary-encoded per row group.
+
+Both writers stream: projects are aggregated one at a time, bypassing the
+session-wide aggregation cache of ProjectService, and rows are written as
+they are produced, so memory use is bounded by the largest single project
+rather than by the total number of exported rows.
+
+Binary layout::
+
+    magic       b"CPCL1\\n"
+    header      uint16 column count, then per column:
+                uint8 type (0 = int32, 1 = str), uint16 name length, name (utf-8)
+    row group   uint32 row count (> 0), then per column:
+                int32:  row count * int32
+                str:    uint32 dictionary size, per entry uint16 length + utf-8
+                        bytes, then row count * uint32 dictionary indices
+    end         uint32 0
+"""
+
+import csv
+import logging
+import struct
+import sys
+from array import array
+from itertools import repeat
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+from src.db_schema.orm_models import Project
+from src.services.project_aggregation import PART_CATEGORIES
+from src.services.project_service import ProjectService
+
+logger = logging.getLogger(__name__)
+
+CUTLIST_COLUMNS: Tuple[Tuple[str, type], ...] = (
+    ("project", str),
+    ("cabinet_seq", int),
+    ("part", str),
+    ("material", str),
+    ("color", str),
+    ("width", int),
+    ("height", int),
+    ("qty", int),
+    ("wrapping", str),
+)
+
+COLUMNAR_MAGIC = b"CPCL1\n"
+DEFAULT_ROW_GROUP_SIZE = 65536
+
+_TYPE_CODES = {int: 0, str: 1}
+_CODE_TYPES = {code: column_type for column_type, code in _TYPE_CODES.items()}
+_NEEDS_BYTESWAP = sys.byteorder != "little"
+
+
+def _to_le_bytes(data: array) -> bytes:
+    if _NEEDS_BYTESWAP:
+        data.byteswap()
+    return data.tobytes()
+
+
+def _from_le_bytes(typecode: str, raw: bytes) -> array:
+    data = array(typecode)
+    data.frombytes(raw)
+    if _NEEDS_BYTESWAP:
+        data.byteswap()
+    return data
+
+
+class CutListExportError(Exception):
+    """Exception raised when a cut list cannot be exported"""
+
+    pass
+
+
+class CutListExporter:
+    """Export aggregated project parts as flat cut-list rows."""
+
+    def __init__(self, project_service: ProjectService):
+        self.project_service = project_service
+
+    def iter_rows(self, project_ids: Iterable[int]) -> Iterator[Tuple]:
+        """Yield one row per part (see CUTLIST_COLUMNS), project by project."""
+        db = self.project_service.db
+        for project_id in project_ids:
+            order_number = (
+                db.query(Project.order_number).filter_by(id=project_id).scalar()
+            )
+            if order_number is None:
+                raise CutListExportError(f"Projekt {project_id} nie istnieje")
+
+            cabinets = self.project_service.aggregate_project_cabinets(project_id)
+            for category in PART_CATEGORIES:
+                for aggregation in cabinets:
+                    batch = aggregation.parts[category]
+                    yield from zip(
+                        repeat(order_number),
+                        batch.sequence,
+                        batch.name,
+                        batch.material,
+                        batch.color,
+                        batch.width,
+                        batch.height,
+                        batch.quantity,
+                        batch.wrapping,
+                    )
+
+    def export_csv(self, project_ids: Iterable[int], path: Path) -> int:
+        """Write a CSV cut list; returns the number of data rows."""
+        count = 0
+        with open(path, "w", newline="", encoding="utf-8") as fh:
+            writer = csv.writer(fh, delimiter=";")
+            writer.writerow([name for name, _type in CUTLIST_COLUMNS])
+            for row in self.iter_rows(project_ids):
+                writer.writerow(row)
+                count += 1
+        logger.info("Exported %d cut-list rows to %s", count, path)
+        return count
+
+    def export_columnar(
+        self,
+        project_ids: Iterable[int],
+        path: Path,
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    ) -> int:
+        """Write a binary columnar cut list; returns the number of data rows."""
+        count = 0
+        with open(path, "wb") as fh:
+            _write_columnar_header(fh)
+            group: List[Tuple] = []
+            for row in self.iter_rows(project_ids):
+                group.append(row)
+                if len(group) >= row_group_size:
+                    _write_row_group(fh, group)
+                    count += len(group)
+                    group = []
+            if group:
+                _write_row_group(fh, group)
+                count += len(group)
+            fh.write(struct.pack("<I", 0))
+        logger.info("Exported %d cut-list rows to %s", count, path)
+        return count
+
+
+def _write_columnar_header(fh: BinaryIO) -> None:
+    fh.write(COLUMNAR_MAGIC)
+    fh.write(struct.pack("<H", len(CUTLIST_COLUMNS)))
+    for name, column_type in CUTLIST_COLUMNS:
+        encoded = name.encode("utf-8")
+        fh.write(struct.pack("<BH", _TYPE_CODES[column_type], len(encoded)))
+        fh.write(encoded)
+
+
+def _write_row_group(fh: BinaryIO, rows: Sequence[Tuple]) -> None:
+    fh.write(struct.pack("<I", len(rows)))
+    for index, (_name, column_type) in enumerate(CUTLIST_COLUMNS):
+        values = [row[index] for row in rows]
+        if column_type is int:
+            fh.write(_to_le_bytes(array("i", (value or 0 for value in values))))
+            continue
+
+        dictionary: Dict[str, int] = {}
+        indices = array(
+            "I", (dictionary.setdefault(v or "", len(dictionary)) for v in values)
+        )
+        fh.write(struct.pack("<I", len(dictionary)))
+        for text in dictionary:
+            encoded = text.encode("utf-8")[:0xFFFF]
+            fh.write(struct.pack("<H", len(encoded)))
+            fh.write(encoded)
+        fh.write(_to_le_bytes(indices))
+
+
+def _read_exact(fh: BinaryIO, size: int) -> bytes:
+    data = fh.read(size)
+    if len(data) != size:
+        raise CutListExportError("Nieoczekiwany koniec pliku listy cięć")
+    return data
+
+
+def read_columnar(path: Path) -> Iterator[Dict[str, list]]:
+    """Yield row groups of a columnar cut list as {column name: values}."""
+    with open(path, "rb") as fh:
+        if fh.read(len(COLUMNAR_MAGIC)) != COLUMNAR_MAGIC:
+            raise CutListExportError("Nieprawidłowy format pliku listy cięć")
+
+        (column_count,) = struct.unpack("<H", _read_exact(fh, 2))
+        columns = []
+        for _ in range(column_count):
+            type_code, name_length = struct.unpack("<BH", _read_exact(fh, 3))
+            name = _read_exact(fh, name_length).decode("utf-8")
+            columns.append((name, _CODE_TYPES[type_code]))
+
+        while True:
+            (row_count,) = struct.unpack("<I", _read_exact(fh, 4))
+            if not row_count:
+                return
+            group: Dict[str, list] = {}
+            for name, column_type in columns:
+                if column_type is int:
+                    raw = _read_exact(fh, 4 * row_count)
+                    group[name] = _from_le_bytes("i", raw).tolist()
+                    continue
+
+                (dictionary_size,) = struct.unpack("<I", _read_exact(fh, 4))
+                dictionary = []
+                for _ in range(dictionary_size):
+                    (length,) = struct.unpack("<H", _read_exact(fh, 2))
+                    dictionary.append(_read_exact(fh, length).decode("utf-8"))
+                indices = _from_le_bytes("I", _read_exact(fh, 4 * row_count))
+                group[name] = [dictionary[i] for i in indices]
+            yield group
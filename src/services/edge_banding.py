@@ -0,0 +1,122 @@
+"""
+Edge-banding (okleina) requirement per color.
+
+Every part carries a wrapping code listing its banded edges: each "D" is one
+edge along the longer side of the part, each "K" one edge along the shorter
+side (so "DDKK" bands all four edges and "DKK" one long and both short
+edges). Lengths are computed from the part's width/height and multiplied by
+its quantity, which in aggregated batches already includes the number of
+pieces and the cabinet quantity.
+
+The calculator walks the aggregated column batches directly; codes are
+decoded once per distinct string, so projects with thousands of parts are
+summed in a few milliseconds.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.services.project_aggregation import PART_CATEGORIES, ProjectAggregation
+
+EDGE_LONG = "D"
+EDGE_SHORT = "K"
+EDGE_TYPES = (EDGE_LONG, EDGE_SHORT)
+
+# A rectangular part has at most two edges of each kind.
+_MAX_EDGES_PER_SIDE = 2
+
+
+@lru_cache(maxsize=256)
+def decode_wrapping(code: Optional[str]) -> Tuple[int, int]:
+    """
+    Decode a wrapping code into (long edges, short edges).
+
+    Letters are case-insensitive; anything other than D/K (spaces, dashes)
+    is ignored and counts are capped at two edges per side.
+    """
+    code = (code or "").upper()
+    return (
+        min(code.count(EDGE_LONG), _MAX_EDGES_PER_SIDE),
+        min(code.count(EDGE_SHORT), _MAX_EDGES_PER_SIDE),
+    )
+
+
+@dataclass
+class EdgeBandingTotal:
+    """Banded edges of one color, split by edge type."""
+
+    color: str
+    long_mm: int = 0
+    short_mm: int = 0
+    long_edges: int = 0
+    short_edges: int = 0
+
+    @property
+    def total_mm(self) -> int:
+        return self.long_mm + self.short_mm
+
+    @property
+    def total_edges(self) -> int:
+        return self.long_edges + self.short_edges
+
+    def length_mm(self, edge_type: str) -> int:
+        return self.long_mm if edge_type == EDGE_LONG else self.short_mm
+
+    def meters(self, edge_type: Optional[str] = None) -> float:
+        """Length in meters of one edge type, or of both when not given."""
+        length = self.total_mm if edge_type is None else self.length_mm(edge_type)
+        return length / 1000
+
+
+def calculate_edge_banding(
+    rows: Iterable[Tuple[Optional[str], int, int, int, Optional[str]]],
+) -> List[EdgeBandingTotal]:
+    """
+    Sum banded edge lengths per color.
+
+    Args:
+        rows: (color, width, height, quantity, wrapping) per part
+
+    Returns:
+        One EdgeBandingTotal per color with any banded edge, sorted by color
+    """
+    totals: Dict[str, EdgeBandingTotal] = {}
+    for color, width, height, quantity, wrapping in rows:
+        if not wrapping or not quantity:
+            continue
+        long_count, short_count = decode_wrapping(wrapping)
+        if not (long_count or short_count):
+            continue
+
+        width = width or 0
+        height = height or 0
+        long_side, short_side = (width, height) if width >= height else (height, width)
+        long_count *= quantity
+        short_count *= quantity
+
+        color = (color or "").strip()
+        total = totals.get(color)
+        if total is None:
+            total = totals[color] = EdgeBandingTotal(color)
+        total.long_mm += long_count * long_side
+        total.short_mm += short_count * short_side
+        total.long_edges += long_count
+        total.short_edges += short_count
+
+    return sorted(totals.values(), key=lambda total: total.color.lower())
+
+
+def calculate_aggregation_edge_banding(
+    aggregation: ProjectAggregation,
+) -> List[EdgeBandingTotal]:
+    """Edge-banding totals for all part categories of a project aggregation."""
+
+    def rows():
+        for category in PART_CATEGORIES:
+            batch = aggregation.parts[category]
+            yield from zip(
+                batch.color, batch.width, batch.height, batch.quantity, batch.wrapping
+            )
+
+    return calculate_edge_banding(rows())
@@ -0,0 +1,394 @@
+"""
+Panel nesting (sheet optimization) for cut lists.
+
+Parts of one (material, color) group are packed onto standard sheets
+(2800 x 2070 mm by default) with guillotine cuts only, so every layout can
+be produced on a panel saw. The sheet's length (x axis) is the grain
+direction:
+
+* "słoje poziomo" in a part name - the part's width runs along the grain,
+  the part is never rotated;
+* "słoje pionowo" - the part's height runs along the grain, the part is
+  always placed rotated;
+* no grain note - the engine may rotate the part freely.
+
+Two modes are available: ``fast`` runs two greedy passes (best short side
+and best long side fit) on parts sorted by area, which is quick enough for
+interactive use; ``deep`` additionally tries other sort orders, split rules
+and randomized orders until the time budget runs out, keeping the layout
+with the fewest sheets.
+"""
+
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+SHEET_WIDTH_MM = 2800
+SHEET_HEIGHT_MM = 2070
+DEFAULT_KERF_MM = 4
+DEFAULT_TRIM_MM = 10
+
+MODE_FAST = "fast"
+MODE_DEEP = "deep"
+
+GRAIN_FREE = "free"
+GRAIN_ALONG_WIDTH = "along_width"  # "słoje poziomo"
+GRAIN_ALONG_HEIGHT = "along_height"  # "słoje pionowo"
+
+
+def detect_grain(part_name: str) -> str:
+    """Read the grain direction note from a part name."""
+    name = (part_name or "").lower()
+    if "słoje poziomo" in name or "sloje poziomo" in name:
+        return GRAIN_ALONG_WIDTH
+    if "słoje pionowo" in name or "sloje pionowo" in name:
+        return GRAIN_ALONG_HEIGHT
+    return GRAIN_FREE
+
+
+@dataclass(frozen=True)
+class NestingPart:
+    """A part to nest; `quantity` pieces of `width` x `height` mm."""
+
+    name: str
+    width: int
+    height: int
+    quantity: int = 1
+    grain: str = GRAIN_FREE
+
+    def orientations(self) -> List[Tuple[int, int, bool]]:
+        """Allowed (x size, y size, rotated) placements on the sheet."""
+        if self.grain == GRAIN_ALONG_WIDTH:
+            return [(self.width, self.height, False)]
+        if self.grain == GRAIN_ALONG_HEIGHT:
+            return [(self.height, self.width, True)]
+        if self.width == self.height:
+            return [(self.width, self.height, False)]
+        return [(self.width, self.height, False), (self.height, self.width, True)]
+
+
+@dataclass
+class Placement:
+    """One piece placed on a sheet (coordinates in mm from the trimmed corner)."""
+
+    name: str
+    x: int
+    y: int
+    width: int
+    height: int
+    rotated: bool = False
+
+
+@dataclass
+class SheetLayout:
+    """Placements on a single sheet."""
+
+    width: int
+    height: int
+    placements: List[Placement] = field(default_factory=list)
+
+    @property
+    def used_area(self) -> int:
+        return sum(p.width * p.height for p in self.placements)
+
+    @property
+    def utilization(self) -> float:
+        return self.used_area / (self.width * self.height)
+
+
+@dataclass
+class NestingResult:
+    """Layout of one (material, color) group."""
+
+    material: str
+    color: str
+    sheets: List[SheetLayout] = field(default_factory=list)
+    # Parts that do not fit on an empty sheet in any allowed orientation.
+    oversized: List[NestingPart] = field(default_factory=list)
+
+    @property
+    def sheet_count(self) -> int:
+        return len(self.sheets)
+
+    @property
+    def piece_count(self) -> int:
+        return sum(len(sheet.placements) for sheet in self.sheets)
+
+    @property
+    def utilization(self) -> float:
+        if not self.sheets:
+            return 0.0
+        total = sum(sheet.width * sheet.height for sheet in self.sheets)
+        return sum(sheet.used_area for sheet in self.sheets) / total
+
+
+# Free rectangle: (x, y, width, height); sizes include one kerf.
+_Rect = Tuple[int, int, int, int]
+
+
+def _split_shorter_leftover(fw: int, fh: int, w: int, h: int) -> bool:
+    """True = horizontal cut (full-width strip below the part)."""
+    return (fw - w) <= (fh - h)
+
+
+def _split_longer_leftover(fw: int, fh: int, w: int, h: int) -> bool:
+    return (fw - w) > (fh - h)
+
+
+def _split_min_area(fw: int, fh: int, w: int, h: int) -> bool:
+    # Keep the larger leftover rectangle as whole as possible.
+    return (fw - w) * h < w * (fh - h)
+
+
+_SPLIT_RULES: Tuple[Callable[[int, int, int, int], bool], ...] = (
+    _split_shorter_leftover,
+    _split_longer_leftover,
+    _split_min_area,
+)
+
+
+def _fit_short_side(fw: int, fh: int, w: int, h: int) -> tuple:
+    """Best short side fit: smallest leftover along the tighter axis."""
+    return (min(fw - w, fh - h), max(fw - w, fh - h))
+
+
+def _fit_long_side(fw: int, fh: int, w: int, h: int) -> tuple:
+    """Best long side fit: smallest leftover along the looser axis."""
+    return (max(fw - w, fh - h), min(fw - w, fh - h))
+
+
+_FIT_RULES: Tuple[Callable[[int, int, int, int], tuple], ...] = (
+    _fit_short_side,
+    _fit_long_side,
+)
+
+_SORT_KEYS: Tuple[Callable[[NestingPart], tuple], ...] = (
+    lambda p: (-p.width * p.height, -max(p.width, p.height)),
+    lambda p: (-max(p.width, p.height), -p.width * p.height),
+    lambda p: (-p.height, -p.width),
+    lambda p: (-p.width, -p.height),
+    lambda p: (-(p.width + p.height), -p.width * p.height),
+)
+
+
+class _GuillotineSheet:
+    def __init__(self, width: int, height: int, kerf: int) -> None:
+        self.kerf = kerf
+        # Usable size grows by one kerf: the last piece in a row needs no cut.
+        self.free: List[_Rect] = [(0, 0, width + kerf, height + kerf)]
+        self.layout = SheetLayout(width, height)
+
+    def find(
+        self,
+        part: NestingPart,
+        fit_rule: Callable[[int, int, int, int], tuple] = _fit_short_side,
+    ) -> Optional[Tuple[int, int, int, bool]]:
+        """Best-scoring free position: (free index, w, h, rotated)."""
+        best = None
+        best_score = None
+        for index, (_x, _y, fw, fh) in enumerate(self.free):
+            for w, h, rotated in part.orientations():
+                w += self.kerf
+                h += self.kerf
+                if w <= fw and h <= fh:
+                    score = fit_rule(fw, fh, w, h)
+                    if best_score is None or score < best_score:
+                        best_score = score
+                        best = (index, w, h, rotated)
+        return best
+
+    def place(
+        self,
+        part: NestingPart,
+        position: Tuple[int, int, int, bool],
+        split_rule: Callable[[int, int, int, int], bool],
+    ) -> None:
+        index, w, h, rotated = position
+        x, y, fw, fh = self.free.pop(index)
+        self.layout.placements.append(
+            Placement(part.name, x, y, w - self.kerf, h - self.kerf, rotated)
+        )
+        if split_rule(fw, fh, w, h):
+            right = (x + w, y, fw - w, h)
+            below = (x, y + h, fw, fh - h)
+        else:
+            right = (x + w, y, fw - w, fh)
+            below = (x, y + h, w, fh - h)
+        for rect in (right, below):
+            if rect[2] > self.kerf and rect[3] > self.kerf:
+                self.free.append(rect)
+
+
+class NestingEngine:
+    """Guillotine nesting of parts onto standard sheets."""
+
+    def __init__(
+        self,
+        sheet_width: int = SHEET_WIDTH_MM,
+        sheet_height: int = SHEET_HEIGHT_MM,
+        kerf: int = DEFAULT_KERF_MM,
+        trim: int = DEFAULT_TRIM_MM,
+    ) -> None:
+        self.sheet_width = sheet_width
+        self.sheet_height = sheet_height
+        self.kerf = kerf
+        self.trim = trim
+
+    @property
+    def usable_width(self) -> int:
+        return self.sheet_width - 2 * self.trim
+
+    @property
+    def usable_height(self) -> int:
+        return self.sheet_height - 2 * self.trim
+
+    def nest(
+        self,
+        parts: Iterable[NestingPart],
+        material: str = "",
+        color: str = "",
+        mode: str = MODE_FAST,
+        time_budget: float = 2.0,
+        seed: int = 0,
+    ) -> NestingResult:
+        """Pack parts onto as few sheets as possible."""
+        result = NestingResult(material=material, color=color)
+        pieces: List[NestingPart] = []
+        for part in parts:
+            if part.quantity <= 0 or part.width <= 0 or part.height <= 0:
+                continue
+            if not self._fits_empty_sheet(part):
+                result.oversized.append(part)
+                continue
+            pieces.extend([part] * part.quantity)
+        if not pieces:
+            return result
+
+        ordered = sorted(pieces, key=_SORT_KEYS[0])
+        best = min(
+            (self._pack(ordered, _SPLIT_RULES[0], fit_rule) for fit_rule in _FIT_RULES),
+            key=self._score,
+        )
+        if mode == MODE_DEEP:
+            best = self._search(pieces, best, time_budget, seed)
+
+        result.sheets = best
+        return result
+
+    def nest_groups(
+        self,
+        rows: Iterable[Tuple[str, str, str, int, int, int]],
+        mode: str = MODE_FAST,
+        time_budget: float = 2.0,
+    ) -> List[NestingResult]:
+        """
+        Nest (material, color, name, width, height, quantity) rows, one
+        result per (material, color) group, sorted by material and color.
+        """
+        groups: Dict[Tuple[str, str], Dict[Tuple[str, int, int], int]] = {}
+        for material, color, name, width, height, quantity in rows:
+            group = groups.setdefault((material or "", color or ""), {})
+            key = (name, width, height)
+            group[key] = group.get(key, 0) + quantity
+
+        results = []
+        for (material, color), counts in sorted(groups.items()):
+            parts = [
+                NestingPart(name, width, height, quantity, detect_grain(name))
+                for (name, width, height), quantity in counts.items()
+            ]
+            # Split the time budget evenly between groups.
+            results.append(
+                self.nest(
+                    parts,
+                    material=material,
+                    color=color,
+                    mode=mode,
+                    time_budget=time_budget / len(groups),
+                )
+            )
+        return results
+
+    def _fits_empty_sheet(self, part: NestingPart) -> bool:
+        return any(
+            w <= self.usable_width and h <= self.usable_height
+            for w, h, _rotated in part.orientations()
+        )
+
+    def _pack(
+        self,
+        pieces: Sequence[NestingPart],
+        split_rule: Callable[[int, int, int, int], bool],
+        fit_rule: Callable[[int, int, int, int], tuple] = _fit_short_side,
+    ) -> List[SheetLayout]:
+        """First-fit over open sheets, best `fit_rule` position inside a sheet."""
+        sheets: List[_GuillotineSheet] = []
+        for piece in pieces:
+            for sheet in sheets:
+                position = sheet.find(piece, fit_rule)
+                if position is not None:
+                    sheet.place(piece, position, split_rule)
+                    break
+            else:
+                sheet = _GuillotineSheet(
+                    self.usable_width, self.usable_height, self.kerf
+                )
+                sheet.place(piece, sheet.find(piece, fit_rule), split_rule)
+                sheets.append(sheet)
+        return [sheet.layout for sheet in sheets]
+
+    @staticmethod
+    def _score(sheets: List[SheetLayout]) -> Tuple[int, int]:
+        # Fewest sheets first; then the emptiest last sheet (largest offcut).
+        return (len(sheets), sheets[-1].used_area if sheets else 0)
+
+    def _search(
+        self,
+        pieces: List[NestingPart],
+        best: List[SheetLayout],
+        time_budget: float,
+        seed: int,
+    ) -> List[SheetLayout]:
+        """Try deterministic variants, then random restarts until the deadline."""
+        deadline = time.perf_counter() + time_budget
+        lower_bound = -(
+            -sum(p.width * p.height for p in pieces)
+            // (self.usable_width * self.usable_height)
+        )
+        best_score = self._score(best)
+        if best_score[0] <= lower_bound:
+            return best
+
+        def consider(candidate: List[SheetLayout]) -> bool:
+            """Keep the better layout; True once the sheet count is optimal."""
+            nonlocal best, best_score
+            score = self._score(candidate)
+            if score < best_score:
+                best, best_score = candidate, score
+            return best_score[0] <= lower_bound
+
+        for sort_key in _SORT_KEYS:
+            ordered = sorted(pieces, key=sort_key)
+            for split_rule in _SPLIT_RULES:
+                for fit_rule in _FIT_RULES:
+                    if consider(self._pack(ordered, split_rule, fit_rule)):
+                        return best
+                    if time.perf_counter() >= deadline:
+                        return best
+
+        rng = random.Random(seed)
+        base = sorted(pieces, key=_SORT_KEYS[0])
+        while time.perf_counter() < deadline:
+            # Perturb the area-sorted order with a few random swaps.
+            ordered = list(base)
+            for _ in range(max(1, len(ordered) // 10)):
+                i = rng.randrange(len(ordered))
+                j = min(len(ordered) - 1, i + rng.randint(1, 5))
+                ordered[i], ordered[j] = ordered[j], ordered[i]
+            candidate = self._pack(
+                ordered, rng.choice(_SPLIT_RULES), rng.choice(_FIT_RULES)
+            )
+            if consider(candidate):
+                break
+        return best
@@ -0,0 +1,255 @@
+"""
+Columnar aggregation of project snapshot parts and accessories.
+
+ProjectService fetches flat row tuples for a whole project in a couple of
+joined queries; this module classifies them in a single pass and stores the
+result as compact per-category column batches. The legacy list-of-dicts
+shape used by reports is produced on demand via ``to_elements()``.
+"""
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Category keys, in the order reports consume them.
+FORMATKI = "formatki"
+FRONTY = "fronty"
+WITRYNY = "witryny"
+POLKI_SZKLANE = "polki_szklane"
+HDF = "hdf"
+AKCESORIA = "akcesoria"
+
+PART_CATEGORIES = (FORMATKI, FRONTY, WITRYNY, POLKI_SZKLANE, HDF)
+
+# Which cabinet color a category is reported with ("" = no color).
+_CATEGORY_COLOR_SOURCE = {
+    FORMATKI: "body",
+    POLKI_SZKLANE: "body",
+    FRONTY: "front",
+    WITRYNY: "front",
+    HDF: "",
+}
+
+
+def get_circled_number(n: int) -> str:
+    """Cabinet sequence number as shown in reports: ① … ⑳, then "(21)"."""
+    if 1 <= n <= 20:
+        return chr(9311 + n)
+    return f"({n})"
+
+
+@lru_cache(maxsize=1024)
+def classify_part_material(
+    material: Optional[str], part_name: Optional[str]
+) -> Tuple[str, str]:
+    """
+    Resolve (category, material) for a snapshot part.
+
+    Parts without explicit material fall back to name-based inference,
+    mirroring the historical report rules. Results are memoized because
+    projects repeat the same few (material, name) pairs many times.
+    """
+    if not material:
+        part_name_lc = (part_name or "").lower()
+        if "półka szkl" in part_name_lc or "polka szkl" in part_name_lc:
+            material = "PÓŁKA SZKLANA"
+        elif "witryn" in part_name_lc:
+            material = "WITRYNA"
+        elif "front" in part_name_lc:
+            material = "FRONT"
+        elif "hdf" in part_name_lc:
+            material = "HDF"
+        else:
+            material = "PLYTA 18"  # Default for panels
+
+    material_upper = material.upper()
+    if material_upper.startswith("PÓŁKA SZKLANA") or material_upper.startswith(
+        "POLKA SZKLANA"
+    ):
+        return POLKI_SZKLANE, material
+    if material_upper.startswith("WITRYNA"):
+        return WITRYNY, material
+    if material_upper.startswith("FRONT"):
+        return FRONTY, material
+    if material_upper.startswith("HDF"):
+        return HDF, material
+    return FORMATKI, material
+
+
+@dataclass
+class PartRowBatch:
+    """Column-oriented rows of one report category."""
+
+    category: str
+    cabinet_id: List[int] = field(default_factory=list)
+    sequence: List[int] = field(default_factory=list)
+    name: List[str] = field(default_factory=list)
+    quantity: List[int] = field(default_factory=list)
+    width: List[int] = field(default_factory=list)
+    height: List[int] = field(default_factory=list)
+    color: List[str] = field(default_factory=list)
+    material: List[str] = field(default_factory=list)
+    wrapping: List[str] = field(default_factory=list)
+    notes: List[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.name)
+
+    def extend(self, other: "PartRowBatch") -> None:
+        """Append all rows of another batch of the same category."""
+        self.cabinet_id.extend(other.cabinet_id)
+        self.sequence.extend(other.sequence)
+        self.name.extend(other.name)
+        self.quantity.extend(other.quantity)
+        self.width.extend(other.width)
+        self.height.extend(other.height)
+        self.color.extend(other.color)
+        self.material.extend(other.material)
+        self.wrapping.extend(other.wrapping)
+        self.notes.extend(other.notes)
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Expand the batch into the legacy list-of-dicts shape."""
+        include_material = self.category == FORMATKI
+        rows = []
+        for i in range(len(self.name)):
+            row = {
+                "seq": get_circled_number(self.sequence[i]),
+                "sequence": self.sequence[i],
+                "name": self.name[i],
+                "quantity": self.quantity[i],
+                "width": self.width[i],
+                "height": self.height[i],
+                "color": self.color[i],
+            }
+            if include_material:
+                row["material"] = self.material[i]
+            row["wrapping"] = self.wrapping[i]
+            row["notes"] = self.notes[i]
+            rows.append(row)
+        return rows
+
+
+@dataclass
+class AccessoryRowBatch:
+    """Column-oriented accessory rows (quantities already multiplied)."""
+
+    cabinet_id: List[int] = field(default_factory=list)
+    name: List[str] = field(default_factory=list)
+    source_accessory_id: List[Optional[int]] = field(default_factory=list)
+    quantity: List[int] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.name)
+
+    def extend(self, other: "AccessoryRowBatch") -> None:
+        """Append all rows of another accessory batch."""
+        self.cabinet_id.extend(other.cabinet_id)
+        self.name.extend(other.name)
+        self.source_accessory_id.extend(other.source_accessory_id)
+        self.quantity.extend(other.quantity)
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Expand the batch into the legacy list-of-dicts shape."""
+        return [
+            {
+                "name": self.name[i],
+                "source_accessory_id": self.source_accessory_id[i],
+                "quantity": self.quantity[i],
+                "notes": "",
+            }
+            for i in range(len(self.name))
+        ]
+
+
+@dataclass
+class ProjectAggregation:
+    """Per-category row batches for a whole project (or a single cabinet)."""
+
+    parts: Dict[str, PartRowBatch] = field(
+        default_factory=lambda: {c: PartRowBatch(c) for c in PART_CATEGORIES}
+    )
+    accessories: AccessoryRowBatch = field(default_factory=AccessoryRowBatch)
+
+    def extend(self, other: "ProjectAggregation") -> None:
+        """Append all rows of another aggregation."""
+        for category in PART_CATEGORIES:
+            self.parts[category].extend(other.parts[category])
+        self.accessories.extend(other.accessories)
+
+    def to_elements(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Return the dict-list structure of get_aggregated_project_elements."""
+        elements = {c: self.parts[c].to_dicts() for c in PART_CATEGORIES}
+        elements[AKCESORIA] = self.accessories.to_dicts()
+        return elements
+
+
+# Row layouts produced by ProjectService aggregation queries.
+# part row:      (cabinet_id, sequence, cabinet_qty, body_color, front_color,
+#                 handle_type, part_name, width, height, pieces, material,
+#                 wrapping, comments)
+# accessory row: (cabinet_id, cabinet_qty, name, source_accessory_id, count)
+
+
+def aggregate_part_rows(
+    rows: Iterable[Tuple], into: Optional[ProjectAggregation] = None
+) -> ProjectAggregation:
+    """Classify flat part rows into per-category column batches in one pass."""
+    result = into if into is not None else ProjectAggregation()
+    batches = result.parts
+
+    for (
+        cabinet_id,
+        sequence,
+        cabinet_qty,
+        body_color,
+        front_color,
+        handle_type,
+        part_name,
+        width,
+        height,
+        pieces,
+        material,
+        wrapping,
+        comments,
+    ) in rows:
+        category, resolved_material = classify_part_material(material, part_name)
+        batch = batches[category]
+        color_source = _CATEGORY_COLOR_SOURCE[category]
+
+        batch.cabinet_id.append(cabinet_id)
+        batch.sequence.append(sequence)
+        batch.name.append(part_name)
+        batch.quantity.append(pieces * cabinet_qty)
+        batch.width.append(width)
+        batch.height.append(height)
+        if color_source == "body":
+            batch.color.append(body_color)
+        elif color_source == "front":
+            batch.color.append(front_color)
+        else:
+            batch.color.append("")
+        batch.material.append(resolved_material)
+        batch.wrapping.append(wrapping or "")
+        if category in (FRONTY, WITRYNY):
+            batch.notes.append(f"Handle: {handle_type}")
+        else:
+            batch.notes.append(comments or "")
+
+    return result
+
+
+def aggregate_accessory_rows(
+    rows: Iterable[Tuple], into: Optional[ProjectAggregation] = None
+) -> ProjectAggregation:
+    """Append flat accessory rows, multiplying counts by cabinet quantity."""
+    result = into if into is not None else ProjectAggregation()
+    batch = result.accessories
+
+    for cabinet_id, cabinet_qty, name, source_accessory_id, count in rows:
+        batch.cabinet_id.append(cabinet_id)
+        batch.name.append(name)
+        batch.source_accessory_id.append(source_accessory_id)
+        batch.quantity.append(count * cabinet_qty)
+
+    return result
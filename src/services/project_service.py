@@ -1,36 +1,442 @@
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from itertools import groupby
+import inspect
 import logging
-from typing import List, Optional, Dict, Any
-
-from sqlalchemy import func, select
-from sqlalchemy.orm import Session, joinedload
+from typing import Callable, Iterable, Iterator, List, Optional, Dict, Any, Tuple
+import weakref
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import (
+    event,
+    func,
+    insert,
+    or_,
+    select,
+    text,
+    tuple_,
+)
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session, aliased, joinedload
+from sqlalchemy.orm.util import identity_key
 
 from src.db_schema.orm_models import (
     Accessory,
     Project,
     ProjectCabinet,
+    ProjectCabinetAccessory,
     ProjectCabinetPart,
     ProjectCabinetAccessorySnapshot,
+    CabinetPart,
     CabinetTemplate,
+    CabinetTemplateAccessory,
+)
+from src.db_schema.cabinet_display import DISPLAY_COLUMNS, refresh_cabinet_display
+from src.db_schema.project_search import (
+    BM25_WEIGHTS,
+    FTS_TABLE,
+    build_match_query,
+)
+from src.services.project_aggregation import (
+    ProjectAggregation,
+    aggregate_accessory_rows,
+    aggregate_part_rows,
+)
+from src.services.edge_banding import (
+    EdgeBandingTotal,
+    calculate_aggregation_edge_banding,
 )
 
 logger = logging.getLogger(__name__)
 
 
-def get_circled_number(n: int) -> str:
-    if 1 <= n <= 20:
-        return chr(9311 + n)
-    return f"({n})"
+# Rows per page of the project list.
+PROJECT_PAGE_SIZE = 100
+
+# Projects whose cabinet aggregations are kept in memory.
+AGGREGATION_CACHE_PROJECTS = 8
+
+
+class _AggregationCache:
+    """
+    Per-cabinet aggregations grouped by project, least recently used
+    project evicted first, so memory follows the projects in use rather
+    than every project opened or reported in the session.
+    """
+
+    def __init__(self, max_projects: int = AGGREGATION_CACHE_PROJECTS):
+        self.max_projects = max_projects
+        self._projects: "OrderedDict[int, Dict[int, tuple]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._projects)
+
+    def project(self, project_id: int) -> Dict[int, tuple]:
+        """Cabinet entries of a project, marked as most recently used."""
+        entries = self._projects.pop(project_id, None)
+        if entries is None:
+            entries = {}
+        self._projects[project_id] = entries
+        while len(self._projects) > self.max_projects:
+            self._projects.popitem(last=False)
+        return entries
+
+    def cabinet_ids(self, project_id: int) -> List[int]:
+        return list(self._projects.get(project_id, ()))
+
+    def discard_project(self, project_id: int) -> None:
+        self._projects.pop(project_id, None)
+
+    def discard_cabinets(self, cabinet_ids: Iterable[int]) -> None:
+        for entries in self._projects.values():
+            for cabinet_id in cabinet_ids:
+                entries.pop(cabinet_id, None)
+
+    def clear(self) -> None:
+        self._projects.clear()
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectListRow:
+    """Lightweight project row for lists and cards (no ORM object)."""
+
+    id: int
+    name: str
+    order_number: str
+    kitchen_type: str
+    client_name: Optional[str]
+    created_at: datetime
+
+
+@dataclass(frozen=True, slots=True)
+class CabinetListRow:
+    """
+    Display row of a project cabinet for cards and tables (no ORM object).
+
+    name, kitchen_type, dimensions and part_count are computed in SQL from
+    the template and the parts snapshot.
+    """
+
+    id: int
+    sequence_number: Optional[int]
+    quantity: Optional[int]
+    body_color: Optional[str]
+    front_color: Optional[str]
+    name: str
+    kitchen_type: str
+    width_mm: Optional[int]
+    height_mm: Optional[int]
+    part_count: int
+
+
+@dataclass
+class CabinetSpec:
+    """One cabinet to add with ProjectService.add_cabinets()."""
+
+    type_id: Optional[int]
+    body_color: str
+    front_color: str
+    handle_type: str
+    quantity: int = 1
+
+
+def _part_snapshot_row(cabinet_id: int, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Column values of one ProjectCabinetPart row for bulk inserts."""
+    return {
+        "project_cabinet_id": cabinet_id,
+        "part_name": data.get("part_name", ""),
+        "height_mm": data.get("height_mm", 0),
+        "width_mm": data.get("width_mm", 0),
+        "pieces": data.get("pieces", 1),
+        "wrapping": data.get("wrapping"),
+        "comments": data.get("comments"),
+        "material": data.get("material"),
+        "processing_json": data.get("processing_json"),
+        "source_template_id": data.get("source_template_id"),
+        "source_part_id": data.get("source_part_id"),
+        "calc_context_json": data.get("calc_context_json"),
+    }
+
+
+def _accessory_snapshot_row(cabinet_id: int, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Column values of one ProjectCabinetAccessorySnapshot row for bulk inserts."""
+    return {
+        "project_cabinet_id": cabinet_id,
+        "name": data.get("name", ""),
+        "count": data.get("count", 1),
+        "source_accessory_id": data.get("source_accessory_id"),
+    }
+
+
+@dataclass
+class _UnitOfWork:
+    """Open unit-of-work state of one session."""
+
+    depth: int = 0
+    colors: List[str] = field(default_factory=list)
+    listening: bool = False
+    # weak references to callables run when the unit of work is interrupted
+    listeners: List[Callable[[], Optional[Callable[[], None]]]] = field(
+        default_factory=list
+    )
+
+
+# Shared by all ProjectService instances working on the same session.
+_units_of_work: "WeakKeyDictionary[Session, _UnitOfWork]" = WeakKeyDictionary()
+
+
+def _on_transaction_end(session: Session, transaction) -> None:
+    """
+    End an open unit of work whose transaction was committed or rolled back
+    from outside (another service sharing the session). Its changes are no
+    longer all-or-nothing, or are gone, so the state is reset and listeners
+    are told to reload.
+    """
+    if transaction.parent is not None:
+        return  # SAVEPOINT of a single mutator
+    state = _units_of_work.get(session)
+    if state is None or not state.depth:
+        return
+
+    state.depth = 0
+    state.colors.clear()
+    ProjectService(session).invalidate_aggregation_cache()
+    logger.warning("Unit of work interrupted by a commit/rollback outside of it")
+
+    alive = []
+    for ref in state.listeners:
+        listener = ref()
+        if listener is None:
+            continue
+        alive.append(ref)
+        try:
+            listener()
+        except Exception as exc:
+            logger.warning("Unit of work listener failed: %s", exc)
+    state.listeners = alive
 
 
 class ProjectService:
     def __init__(self, db_session: Session):
         self.db = db_session
 
+    def begin_unit_of_work(self) -> None:
+        """
+        Start coalescing mutations into a single transaction.
+
+        Until the matching commit_unit_of_work(), every mutator runs inside a
+        SAVEPOINT and is flushed instead of committed, so a failing call is
+        still undone on its own while successful ones are written together.
+        Color usage tracking is deferred to the final commit. Calls nest and
+        the state is shared by all ProjectService instances on the session.
+        """
+        state = self._unit_of_work_state()
+        if not state.listening:
+            event.listen(self.db, "after_transaction_end", _on_transaction_end)
+            state.listening = True
+        state.depth += 1
+
+    def commit_unit_of_work(self) -> None:
+        """End a unit of work; the outermost call commits all pending changes."""
+        state = self._unit_of_work_state()
+        if not state.depth:
+            return
+        state.depth -= 1
+        if state.depth:
+            return
+
+        colors = list(dict.fromkeys(state.colors))
+        state.colors.clear()
+        try:
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            self.invalidate_aggregation_cache()
+            raise
+        if colors:
+            self._mark_colors_used(*colors)
+
+    def rollback_unit_of_work(self) -> None:
+        """Discard all changes of the current unit of work, however nested."""
+        state = self._unit_of_work_state()
+        state.depth = 0
+        state.colors.clear()
+        self.db.rollback()
+        self.invalidate_aggregation_cache()
+
+    def in_unit_of_work(self) -> bool:
+        return self._unit_of_work_state().depth > 0
+
+    def on_unit_of_work_interrupted(self, listener: Callable[[], None]) -> None:
+        """
+        Call listener() when an open unit of work ends because something
+        else committed or rolled back the session. Bound methods are held
+        weakly, so a subscribed object can still be garbage collected.
+        """
+        if inspect.ismethod(listener):
+            ref = weakref.WeakMethod(listener)
+        else:
+
+            def ref():
+                return listener
+
+        self._unit_of_work_state().listeners.append(ref)
+
+    @contextmanager
+    def unit_of_work(self) -> Iterator["ProjectService"]:
+        """Context manager committing all mutations made inside it at once."""
+        self.begin_unit_of_work()
+        try:
+            yield self
+        except Exception:
+            self.rollback_unit_of_work()
+            raise
+        self.commit_unit_of_work()
+
+    def _unit_of_work_state(self) -> _UnitOfWork:
+        state = _units_of_work.get(self.db)
+        if state is None:
+            state = _units_of_work[self.db] = _UnitOfWork()
+        return state
+
+    @contextmanager
+    def _atomic(self) -> Iterator[None]:
+        """
+        Atomic scope of one mutator.
+
+        Commits on success and rolls back on error; inside a unit of work it
+        is a SAVEPOINT released into the outer transaction instead.
+        """
+        if not self.in_unit_of_work():
+            try:
+                yield
+                self.db.commit()
+            except Exception:
+                self.db.rollback()
+                raise
+            return
+
+        self._begin_driver_transaction()
+        with self.db.begin_nested():
+            yield
+
+    def _begin_driver_transaction(self) -> None:
+        """
+        Make sure SQLite has an open transaction before a SAVEPOINT.
+
+        pysqlite only emits BEGIN ahead of DML, so a SAVEPOINT issued first
+        would start a transaction of its own and RELEASE would commit it.
+        """
+        connection = self.db.connection()
+        driver_connection = connection.connection.driver_connection
+        if getattr(driver_connection, "in_transaction", True):
+            return
+        connection.exec_driver_sql("BEGIN")
+
     def list_projects(self) -> List[Project]:
         stmt = select(Project).order_by(Project.created_at.desc(), Project.id.desc())
         return list(self.db.scalars(stmt).all())
 
+    def _project_rows_stmt(self, kitchen_type: Optional[str] = None):
+        stmt = select(
+            Project.id,
+            Project.name,
+            Project.order_number,
+            Project.kitchen_type,
+            Project.client_name,
+            Project.created_at,
+        )
+        if kitchen_type:
+            stmt = stmt.where(Project.kitchen_type == kitchen_type)
+        return stmt
+
+    def list_project_rows(
+        self,
+        *,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = PROJECT_PAGE_SIZE,
+        kitchen_type: Optional[str] = None,
+    ) -> List[ProjectListRow]:
+        """
+        One page of projects, newest first, as lightweight rows.
+
+        Keyset pagination on (created_at, id): pass the id of the last row
+        of the previous page as after_id. Each page is an index range seek,
+        so its cost does not grow with the page number. limit=None returns
+        all remaining rows.
+        """
+        stmt = self._project_rows_stmt(kitchen_type).order_by(
+            Project.created_at.desc(), Project.id.desc()
+        )
+        if after_id is not None:
+            anchor = aliased(Project)
+            stmt = stmt.where(
+                tuple_(Project.created_at, Project.id)
+                < select(anchor.created_at, anchor.id)
+                .where(anchor.id == after_id)
+                .scalar_subquery()
+            )
+        if limit:
+            stmt = stmt.limit(limit)
+        return [ProjectListRow(*row) for row in self.db.execute(stmt)]
+
+    def get_project_rows(
+        self, project_ids: List[int], *, kitchen_type: Optional[str] = None
+    ) -> List[ProjectListRow]:
+        """Rows of the given projects, in the order of project_ids."""
+        if not project_ids:
+            return []
+        stmt = self._project_rows_stmt(kitchen_type).where(Project.id.in_(project_ids))
+        rows = {row.id: ProjectListRow(*row) for row in self.db.execute(stmt)}
+        return [rows[pid] for pid in project_ids if pid in rows]
+
+    def count_projects(self, *, kitchen_type: Optional[str] = None) -> int:
+        stmt = select(func.count(Project.id))
+        if kitchen_type:
+            stmt = stmt.where(Project.kitchen_type == kitchen_type)
+        return self.db.scalar(stmt) or 0
+
+    def search_project_ids(self, query: str, limit: Optional[int] = None) -> List[int]:
+        """
+        IDs of projects matching free-text `query`, best matches first.
+
+        Every word must match the start of a word in the name, order number,
+        client data, kitchen type or notes; case and Polish diacritics are
+        ignored. Name and order number hits rank above client and note hits.
+        """
+        match = build_match_query(query)
+        if not match:
+            return []
+        stmt = text(
+            f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :match "
+            f"ORDER BY bm25({FTS_TABLE}, {BM25_WEIGHTS}), rowid DESC"
+            + (" LIMIT :limit" if limit else "")
+        )
+        try:
+            return list(self.db.scalars(stmt, {"match": match, "limit": limit}))
+        except OperationalError as exc:
+            logger.warning("Full-text project search failed, using LIKE: %s", exc)
+            return self._search_project_ids_like(query, limit)
+
+    def _search_project_ids_like(
+        self, query: str, limit: Optional[int] = None
+    ) -> List[int]:
+        """Substring fallback for databases without the FTS5 index."""
+        columns = (
+            Project.name,
+            Project.order_number,
+            Project.client_name,
+            Project.kitchen_type,
+        )
+        stmt = select(Project.id).order_by(Project.created_at.desc(), Project.id.desc())
+        for word in query.split():
+            stmt = stmt.where(or_(*(column.ilike(f"%{word}%") for column in columns)))
+        if limit:
+            stmt = stmt.limit(limit)
+        return list(self.db.scalars(stmt))
+
     def get_project(self, project_id: int) -> Optional[Project]:
         return self.db.get(Project, project_id)
 
@@ -41,9 +447,8 @@ class ProjectService:
 
     def create_project(self, **fields) -> Project:
         project = Project(**fields)
-        self.db.add(project)
-        self.db.commit()
-        self.db.refresh(project)
+        with self._atomic():
+            self.db.add(project)
         return project
 
     def update_project(self, project_id: int, **fields) -> Optional[Project]:
@@ -51,21 +456,20 @@ class ProjectService:
         if not project:
             return None
 
-        for attr, val in fields.items():
-            setattr(project, attr, val)
+        with self._atomic():
+            for attr, val in fields.items():
+                setattr(project, attr, val)
 
-        project.updated_at = datetime.now(timezone.utc)
-
-        self.db.commit()
-        self.db.refresh(project)
+            project.updated_at = datetime.now(timezone.utc)
         return project
 
     def delete_project(self, project_id: int) -> bool:
         project = self.get_project(project_id)
         if not project:
             return False
-        self.db.delete(project)
-        self.db.commit()
+        with self._atomic():
+            self.db.delete(project)
+        self._aggregation_cache().discard_project(project_id)
         return True
 
     def list_cabinets(self, project_id: int) -> List[ProjectCabinet]:
@@ -80,6 +484,46 @@ class ProjectService:
         )
         return list(self.db.scalars(stmt).unique().all())
 
+    def _cabinet_rows_stmt(self):
+        return select(
+            ProjectCabinet.id,
+            ProjectCabinet.sequence_number,
+            ProjectCabinet.quantity,
+            ProjectCabinet.body_color,
+            ProjectCabinet.front_color,
+            func.coalesce(
+                func.nullif(CabinetTemplate.name, ""),
+                ProjectCabinet.display_name,
+                "Niestandardowy",
+            ),
+            func.coalesce(CabinetTemplate.kitchen_type, "CUSTOM"),
+            ProjectCabinet.display_width_mm,
+            ProjectCabinet.display_height_mm,
+            ProjectCabinet.part_count,
+        ).outerjoin(CabinetTemplate, CabinetTemplate.id == ProjectCabinet.type_id)
+
+    def list_cabinet_rows(self, project_id: int) -> List[CabinetListRow]:
+        """
+        Display rows of a project's cabinets, by sequence number.
+
+        Dimensions, part counts and custom names are read from the display
+        columns maintained by the part mutators, and no ORM objects are
+        loaded, so rendering large projects does not fill the session's
+        identity map.
+        """
+        stmt = (
+            self._cabinet_rows_stmt()
+            .where(ProjectCabinet.project_id == project_id)
+            .order_by(ProjectCabinet.sequence_number)
+        )
+        return [CabinetListRow(*row) for row in self.db.execute(stmt)]
+
+    def get_cabinet_row(self, cabinet_id: int) -> Optional[CabinetListRow]:
+        row = self.db.execute(
+            self._cabinet_rows_stmt().where(ProjectCabinet.id == cabinet_id)
+        ).first()
+        return CabinetListRow(*row) if row else None
+
     def get_cabinet(self, cabinet_id: int) -> Optional[ProjectCabinet]:
         return self.db.get(ProjectCabinet, cabinet_id)
 
@@ -103,16 +547,22 @@ class ProjectService:
             handle_type=handle_type,
             quantity=quantity,
         )
-        self.db.add(cab)
-        self.db.flush()  # Get the ID without committing
-
-        # Materialize parts from catalog template if it's a standard cabinet
-        if type_id:
-            self._materialize_standard_cabinet_parts(cab, type_id)
-            self._materialize_standard_cabinet_accessories(cab, type_id)
+        with self._atomic():
+            self.db.add(cab)
+            self.db.flush()  # Get the ID without committing
+
+            # Materialize parts from catalog template if it's a standard cabinet
+            if type_id:
+                parts_by_type, accessories_by_type = self._template_snapshot_data(
+                    [type_id]
+                )
+                parts = parts_by_type[type_id]
+                accessories = accessories_by_type[type_id]
+                self._insert_snapshots(
+                    [_part_snapshot_row(cab.id, part) for part in parts],
+                    [_accessory_snapshot_row(cab.id, acc) for acc in accessories],
+                )
 
-        self.db.commit()
-        self.db.refresh(cab)
         self._mark_colors_used(body_color, front_color)
         return cab
 
@@ -124,11 +574,11 @@ class ProjectService:
         previous_body_color = cab.body_color
         previous_front_color = cab.front_color
 
-        for attr, val in fields.items():
-            setattr(cab, attr, val)
-        cab.updated_at = datetime.now(timezone.utc)
-        self.db.commit()
-        self.db.refresh(cab)
+        with self._atomic():
+            for attr, val in fields.items():
+                setattr(cab, attr, val)
+            cab.updated_at = datetime.now(timezone.utc)
+        self.invalidate_aggregation_cache(cab.id)
 
         body_changed = (
             "body_color" in fields
@@ -153,8 +603,9 @@ class ProjectService:
         cab = self.get_cabinet(cabinet_id)
         if not cab:
             return False
-        self.db.delete(cab)
-        self.db.commit()
+        with self._atomic():
+            self.db.delete(cab)
+        self.invalidate_aggregation_cache(cabinet_id)
         return True
 
     def duplicate_cabinet(self, cabinet_id: int) -> Optional[ProjectCabinet]:
@@ -187,39 +638,45 @@ class ProjectService:
             handle_type=source.handle_type,
             quantity=source.quantity,
         )
-        self.db.add(new_cabinet)
-        self.db.flush()  # Get the ID
-
-        # Duplicate all parts
-        for part in source.parts:
-            new_part = ProjectCabinetPart(
-                project_cabinet_id=new_cabinet.id,
-                part_name=part.part_name,
-                height_mm=part.height_mm,
-                width_mm=part.width_mm,
-                pieces=part.pieces,
-                wrapping=part.wrapping,
-                comments=part.comments,
-                material=part.material,
-                processing_json=part.processing_json,
-                source_template_id=part.source_template_id,
-                source_part_id=part.source_part_id,
-                calc_context_json=part.calc_context_json,
-            )
-            self.db.add(new_part)
-
-        # Duplicate all accessories
-        for acc in source.accessory_snapshots:
-            new_acc = ProjectCabinetAccessorySnapshot(
-                project_cabinet_id=new_cabinet.id,
-                name=acc.name,
-                count=acc.count,
-                source_accessory_id=acc.source_accessory_id,
+        with self._atomic():
+            self.db.add(new_cabinet)
+            self.db.flush()  # Get the ID
+
+            # Duplicate all parts and accessories
+            self._insert_snapshots(
+                [
+                    _part_snapshot_row(
+                        new_cabinet.id,
+                        {
+                            "part_name": part.part_name,
+                            "height_mm": part.height_mm,
+                            "width_mm": part.width_mm,
+                            "pieces": part.pieces,
+                            "wrapping": part.wrapping,
+                            "comments": part.comments,
+                            "material": part.material,
+                            "processing_json": part.processing_json,
+                            "source_template_id": part.source_template_id,
+                            "source_part_id": part.source_part_id,
+                            "calc_context_json": part.calc_context_json,
+                        },
+                    )
+                    for part in source.parts
+                ],
+                [
+                    _accessory_snapshot_row(
+                        new_cabinet.id,
+                        {
+                            "name": acc.name,
+                            "count": acc.count,
+                            "source_accessory_id": acc.source_accessory_id,
+                        },
+                    )
+                    for acc in source.accessory_snapshots
+                ],
             )
-            self.db.add(new_acc)
 
-        self.db.commit()
-        self.db.refresh(new_cabinet)
+        self.invalidate_aggregation_cache(new_cabinet.id)
         return new_cabinet
 
     def get_next_cabinet_sequence(self, project_id: int) -> int:
@@ -256,131 +713,237 @@ class ProjectService:
             handle_type=handle_type,
             quantity=quantity,
         )
-        self.db.add(cab)
-        self.db.flush()  # Get the ID without committing
-
-        # Materialize custom parts
-        self._materialize_custom_cabinet_parts(cab, custom_parts, calc_context)
-
-        # Materialize custom accessories if provided
-        if custom_accessories:
-            self._materialize_custom_cabinet_accessories(cab, custom_accessories)
+        with self._atomic():
+            self.db.add(cab)
+            self.db.flush()  # Get the ID without committing
+
+            # Materialize custom parts and accessories
+            self._insert_snapshots(
+                [
+                    _part_snapshot_row(
+                        cab.id,
+                        {
+                            **part_data,
+                            "source_template_id": None,  # Custom cabinet
+                            "source_part_id": None,  # Custom cabinet
+                            "calc_context_json": calc_context,
+                        },
+                    )
+                    for part_data in custom_parts
+                ],
+                [
+                    _accessory_snapshot_row(cab.id, acc_data)
+                    for acc_data in custom_accessories or []
+                ],
+            )
 
-        self.db.commit()
-        self.db.refresh(cab)
         self._mark_colors_used(body_color, front_color)
         return cab
 
     def _mark_colors_used(self, *color_names: str) -> None:
         """Best-effort color usage tracking for recent-color UX."""
+        if self.in_unit_of_work():
+            # Usage of a unit of work counts only if it commits.
+            self._unit_of_work_state().colors.extend(color_names)
+            return
         try:
             from src.services.color_palette_service import ColorPaletteService
 
-            palette = ColorPaletteService(self.db)
-            palette.ensure_seeded()
-            for name in color_names:
-                palette.mark_used(name)
-            palette.sync_runtime_color_map()
+            # Queued in memory and written in one batch by flush_usage()
+            # (idle timer, shutdown or the next recent-colors read).
+            # Body and front usually share a color; mark each one once.
+            ColorPaletteService(self.db).record_usage(*dict.fromkeys(color_names))
         except Exception as exc:
             logger.warning("Color usage tracking failed: %s", exc)
 
-    def _materialize_standard_cabinet_parts(
-        self, cabinet: ProjectCabinet, type_id: int
-    ):
-        """Materialize parts from a catalog template into ProjectCabinetPart snapshots."""
-        template = self.db.get(CabinetTemplate, type_id)
-        if not template:
-            return
+    def add_cabinets(
+        self,
+        project_id: int,
+        specs: Iterable[CabinetSpec],
+        *,
+        sequence_number: Optional[int] = None,
+    ) -> List[ProjectCabinet]:
+        """
+        Add several cabinets in one transaction.
 
-        for part in template.parts:
-            snapshot_part = ProjectCabinetPart(
-                project_cabinet_id=cabinet.id,
-                part_name=part.part_name,
-                height_mm=part.height_mm,
-                width_mm=part.width_mm,
-                pieces=part.pieces,
-                wrapping=part.wrapping,
-                comments=part.comments,
-                material=part.material,
-                processing_json=part.processing_json,
-                source_template_id=template.id,
-                source_part_id=part.id,
-                calc_context_json=None,  # Not needed for standard cabinets
+        Sequence numbers are allocated once as a contiguous block starting at
+        sequence_number (or after the current maximum), in the order of specs.
+        Cabinets, part snapshots and accessory snapshots are each written with
+        a single INSERT statement, templates are read once per distinct type
+        and color usage is tracked once for the whole batch.
+        """
+        specs = list(specs)
+        if not specs:
+            return []
+        if sequence_number is None:
+            sequence_number = self.get_next_cabinet_sequence(project_id)
+        last_sequence = sequence_number + len(specs) - 1
+        parts_by_type, accessories_by_type = self._template_snapshot_data(
+            {spec.type_id for spec in specs if spec.type_id}
+        )
+
+        with self._atomic():
+            self.db.execute(
+                insert(ProjectCabinet),
+                [
+                    {
+                        "project_id": project_id,
+                        "sequence_number": sequence_number + offset,
+                        "type_id": spec.type_id,
+                        "body_color": spec.body_color,
+                        "front_color": spec.front_color,
+                        "handle_type": spec.handle_type,
+                        "quantity": spec.quantity,
+                    }
+                    for offset, spec in enumerate(specs)
+                ],
+            )
+            # SQLite does not order multi-row RETURNING, so read the new
+            # rows back by their (unique) sequence numbers instead.
+            cabinets = list(
+                self.db.scalars(
+                    select(ProjectCabinet)
+                    .where(
+                        ProjectCabinet.project_id == project_id,
+                        ProjectCabinet.sequence_number.between(
+                            sequence_number, last_sequence
+                        ),
+                    )
+                    .order_by(ProjectCabinet.sequence_number)
+                )
+            )
+            self._insert_snapshots(
+                [
+                    _part_snapshot_row(cab.id, part)
+                    for cab in cabinets
+                    for part in parts_by_type.get(cab.type_id, ())
+                ],
+                [
+                    _accessory_snapshot_row(cab.id, acc)
+                    for cab in cabinets
+                    for acc in accessories_by_type.get(cab.type_id, ())
+                ],
             )
-            self.db.add(snapshot_part)
 
-    def _materialize_standard_cabinet_accessories(
-        self, cabinet: ProjectCabinet, type_id: int
-    ):
-        """Materialize accessories from a catalog template into ProjectCabinetAccessorySnapshot."""
-        try:
-            template = self.db.get(CabinetTemplate, type_id)
-            if not template:
-                return
-
-            # Check if template has accessories relationship and it's not empty
-            if not hasattr(template, "accessories") or not template.accessories:
-                return
-
-            # Iterate over accessories - use list() to materialize the query
-            accessories_list = list(template.accessories)
-            for template_accessory in accessories_list:
-                # Get accessory details from the linked Accessory object
-                accessory = template_accessory.accessory
-                if not accessory:
-                    continue
+        self._mark_colors_used(
+            *(color for spec in specs for color in (spec.body_color, spec.front_color))
+        )
+        return cabinets
 
-                snapshot_accessory = ProjectCabinetAccessorySnapshot(
-                    project_cabinet_id=cabinet.id,
-                    name=accessory.name,
-                    count=template_accessory.count,
-                    source_accessory_id=accessory.id,
-                )
-                self.db.add(snapshot_accessory)
-        except Exception as e:
-            # Log but don't fail - accessories are optional
-            import logging
+    def add_cabinets_of_type(
+        self,
+        project_id: int,
+        type_id: int,
+        count: int,
+        *,
+        body_color: str,
+        front_color: str,
+        handle_type: str,
+        quantity: int = 1,
+        sequence_number: Optional[int] = None,
+    ) -> List[ProjectCabinet]:
+        """Add `count` cabinets of one catalog type (see add_cabinets)."""
+        spec = CabinetSpec(type_id, body_color, front_color, handle_type, quantity)
+        return self.add_cabinets(
+            project_id, [spec] * max(count, 0), sequence_number=sequence_number
+        )
+
+    def _template_snapshot_data(
+        self, type_ids: Iterable[int]
+    ) -> Tuple[Dict[int, List[Dict[str, Any]]], Dict[int, List[Dict[str, Any]]]]:
+        """
+        Part and accessory snapshot values of catalog templates, per type id.
 
-            logging.getLogger(__name__).warning(
-                f"Failed to materialize accessories: {e}"
+        Read as plain column rows (no ORM objects) with one query per table;
+        the values are suitable for _part_snapshot_row / _accessory_snapshot_row.
+        """
+        type_ids = list(type_ids)
+        parts: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+        accessories: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+        if not type_ids:
+            return parts, accessories
+
+        part_rows = self.db.execute(
+            select(
+                CabinetPart.id,
+                CabinetPart.cabinet_type_id,
+                CabinetPart.part_name,
+                CabinetPart.height_mm,
+                CabinetPart.width_mm,
+                CabinetPart.pieces,
+                CabinetPart.wrapping,
+                CabinetPart.comments,
+                CabinetPart.material,
+                CabinetPart.processing_json,
+            )
+            .where(CabinetPart.cabinet_type_id.in_(type_ids))
+            .order_by(CabinetPart.id)
+        )
+        for row in part_rows:
+            parts[row.cabinet_type_id].append(
+                {
+                    "part_name": row.part_name,
+                    "height_mm": row.height_mm,
+                    "width_mm": row.width_mm,
+                    "pieces": row.pieces,
+                    "wrapping": row.wrapping,
+                    "comments": row.comments,
+                    "material": row.material,
+                    "processing_json": row.processing_json,
+                    "source_template_id": row.cabinet_type_id,
+                    "source_part_id": row.id,
+                }
+            )
+
+        accessory_rows = self.db.execute(
+            select(
+                CabinetTemplateAccessory.cabinet_type_id,
+                CabinetTemplateAccessory.count,
+                Accessory.id,
+                Accessory.name,
             )
+            .join(Accessory, Accessory.id == CabinetTemplateAccessory.accessory_id)
+            .where(CabinetTemplateAccessory.cabinet_type_id.in_(type_ids))
+        )
+        for row in accessory_rows:
+            accessories[row.cabinet_type_id].append(
+                {"name": row.name, "count": row.count, "source_accessory_id": row.id}
+            )
+        return parts, accessories
 
-    def _materialize_custom_cabinet_parts(
+    def _insert_snapshots(
         self,
-        cabinet: ProjectCabinet,
-        parts_data: List[Dict[str, Any]],
-        calc_context: Dict[str, Any] = None,
-    ):
-        """Materialize custom calculated parts into ProjectCabinetPart snapshots."""
-        for part_data in parts_data:
-            snapshot_part = ProjectCabinetPart(
-                project_cabinet_id=cabinet.id,
-                part_name=part_data.get("part_name", ""),
-                height_mm=part_data.get("height_mm", 0),
-                width_mm=part_data.get("width_mm", 0),
-                pieces=part_data.get("pieces", 1),
-                wrapping=part_data.get("wrapping"),
-                comments=part_data.get("comments"),
-                material=part_data.get("material"),
-                processing_json=part_data.get("processing_json"),
-                source_template_id=None,  # Custom cabinet
-                source_part_id=None,  # Custom cabinet
-                calc_context_json=calc_context,  # Store calculation context
+        part_rows: List[Dict[str, Any]],
+        accessory_rows: List[Dict[str, Any]],
+    ) -> None:
+        """Write snapshot rows with one executemany INSERT per table."""
+        # render_nulls keeps None values in every row, so rows with and
+        # without e.g. wrapping are not split into separate statements.
+        if part_rows:
+            self.db.execute(
+                insert(ProjectCabinetPart).execution_options(render_nulls=True),
+                part_rows,
             )
-            self.db.add(snapshot_part)
-
-    def _materialize_custom_cabinet_accessories(
-        self, cabinet: ProjectCabinet, accessories_data: List[Dict[str, Any]]
-    ):
-        """Materialize custom accessories into ProjectCabinetAccessorySnapshot."""
-        for acc_data in accessories_data:
-            snapshot_accessory = ProjectCabinetAccessorySnapshot(
-                project_cabinet_id=cabinet.id,
-                name=acc_data.get("name", ""),
-                count=acc_data.get("count", 1),
-                source_accessory_id=acc_data.get("source_accessory_id"),  # Can be None
+        if accessory_rows:
+            self.db.execute(
+                insert(ProjectCabinetAccessorySnapshot).execution_options(
+                    render_nulls=True
+                ),
+                accessory_rows,
             )
-            self.db.add(snapshot_accessory)
+        self._refresh_cabinet_display(row["project_cabinet_id"] for row in part_rows)
+
+    def _refresh_cabinet_display(self, cabinet_ids: Iterable[int]) -> None:
+        """Recompute cached display columns after the parts of cabinets changed."""
+        cabinet_ids = set(cabinet_ids)
+        if not cabinet_ids:
+            return
+        self.db.flush()
+        refresh_cabinet_display(self.db.connection(), cabinet_ids)
+        for cabinet_id in cabinet_ids:
+            cabinet = self.db.identity_map.get(identity_key(ProjectCabinet, cabinet_id))
+            if cabinet is not None:
+                self.db.expire(cabinet, DISPLAY_COLUMNS)
 
     def update_cabinet_parts(
         self, cabinet_id: int, parts_data: List[Dict[str, Any]]
@@ -390,30 +953,33 @@ class ProjectService:
         if not cabinet:
             return False
 
-        # Remove existing parts
-        for part in cabinet.parts:
-            self.db.delete(part)
-
-        # Add updated parts
-        for part_data in parts_data:
-            snapshot_part = ProjectCabinetPart(
-                project_cabinet_id=cabinet.id,
-                part_name=part_data.get("part_name", ""),
-                height_mm=part_data.get("height_mm", 0),
-                width_mm=part_data.get("width_mm", 0),
-                pieces=part_data.get("pieces", 1),
-                wrapping=part_data.get("wrapping"),
-                comments=part_data.get("comments"),
-                material=part_data.get("material"),
-                processing_json=part_data.get("processing_json"),
-                source_template_id=part_data.get("source_template_id"),
-                source_part_id=part_data.get("source_part_id"),
-                calc_context_json=part_data.get("calc_context_json"),
-            )
-            self.db.add(snapshot_part)
+        with self._atomic():
+            # Remove existing parts
+            for part in cabinet.parts:
+                self.db.delete(part)
+
+            # Add updated parts
+            for part_data in parts_data:
+                snapshot_part = ProjectCabinetPart(
+                    project_cabinet_id=cabinet.id,
+                    part_name=part_data.get("part_name", ""),
+                    height_mm=part_data.get("height_mm", 0),
+                    width_mm=part_data.get("width_mm", 0),
+                    pieces=part_data.get("pieces", 1),
+                    wrapping=part_data.get("wrapping"),
+                    comments=part_data.get("comments"),
+                    material=part_data.get("material"),
+                    processing_json=part_data.get("processing_json"),
+                    source_template_id=part_data.get("source_template_id"),
+                    source_part_id=part_data.get("source_part_id"),
+                    calc_context_json=part_data.get("calc_context_json"),
+                )
+                self.db.add(snapshot_part)
 
-        cabinet.updated_at = datetime.now(timezone.utc)
-        self.db.commit()
+            cabinet.updated_at = datetime.now(timezone.utc)
+            self._refresh_cabinet_display([cabinet.id])
+
+        self.invalidate_aggregation_cache(cabinet.id)
         return True
 
     def add_part_to_cabinet(
@@ -437,27 +1003,26 @@ class ProjectService:
         if not part_name:
             return False
 
-        snapshot_part = ProjectCabinetPart(
-            project_cabinet_id=cabinet.id,
-            part_name=part_name,
-            height_mm=height_mm,
-            width_mm=width_mm,
-            pieces=pieces,
-            material=material,
-            wrapping=wrapping,
-            comments=comments,
-            source_template_id=source_template_id,
-            source_part_id=source_part_id,
-        )
-        self.db.add(snapshot_part)
-
-        cabinet.updated_at = datetime.now(timezone.utc)
-
         try:
-            self.db.commit()
+            with self._atomic():
+                snapshot_part = ProjectCabinetPart(
+                    project_cabinet_id=cabinet.id,
+                    part_name=part_name,
+                    height_mm=height_mm,
+                    width_mm=width_mm,
+                    pieces=pieces,
+                    material=material,
+                    wrapping=wrapping,
+                    comments=comments,
+                    source_template_id=source_template_id,
+                    source_part_id=source_part_id,
+                )
+                self.db.add(snapshot_part)
+
+                cabinet.updated_at = datetime.now(timezone.utc)
+                self._refresh_cabinet_display([cabinet.id])
             return True
         except Exception:
-            self.db.rollback()
             return False
 
     def update_part(self, part_id: int, part_data: Dict[str, Any]) -> bool:
@@ -466,18 +1031,17 @@ class ProjectService:
         if not part:
             return False
 
-        # Update part fields
-        for key, value in part_data.items():
-            if hasattr(part, key):
-                setattr(part, key, value)
-
-        part.project_cabinet.updated_at = datetime.now(timezone.utc)
-
         try:
-            self.db.commit()
+            with self._atomic():
+                # Update part fields
+                for key, value in part_data.items():
+                    if hasattr(part, key):
+                        setattr(part, key, value)
+
+                part.project_cabinet.updated_at = datetime.now(timezone.utc)
+                self._refresh_cabinet_display([part.project_cabinet_id])
             return True
         except Exception:
-            self.db.rollback()
             return False
 
     def remove_part_from_cabinet(self, part_id: int) -> bool:
@@ -486,16 +1050,15 @@ class ProjectService:
         if not part:
             return False
 
-        cabinet = part.project_cabinet
-        self.db.delete(part)
-
-        cabinet.updated_at = datetime.now(timezone.utc)
-
         try:
-            self.db.commit()
+            with self._atomic():
+                cabinet = part.project_cabinet
+                self.db.delete(part)
+
+                cabinet.updated_at = datetime.now(timezone.utc)
+                self._refresh_cabinet_display([cabinet.id])
             return True
         except Exception:
-            self.db.rollback()
             return False
 
     def add_accessory_to_cabinet(
@@ -517,22 +1080,20 @@ class ProjectService:
         if not name:
             return False  # Name is required
 
-        # Create accessory snapshot
-        snapshot_accessory = ProjectCabinetAccessorySnapshot(
-            project_cabinet_id=cabinet.id,
-            name=name,
-            count=count,
-            source_accessory_id=source_accessory_id,
-        )
-        self.db.add(snapshot_accessory)
-
-        cabinet.updated_at = datetime.now(timezone.utc)
-
         try:
-            self.db.commit()
+            with self._atomic():
+                # Create accessory snapshot
+                snapshot_accessory = ProjectCabinetAccessorySnapshot(
+                    project_cabinet_id=cabinet.id,
+                    name=name,
+                    count=count,
+                    source_accessory_id=source_accessory_id,
+                )
+                self.db.add(snapshot_accessory)
+
+                cabinet.updated_at = datetime.now(timezone.utc)
             return True
         except Exception:
-            self.db.rollback()
             return False
 
     def remove_accessory_from_cabinet(self, accessory_snapshot_id: int) -> bool:
@@ -546,11 +1107,11 @@ class ProjectService:
         if not accessory_snapshot:
             return False
 
-        cabinet = accessory_snapshot.project_cabinet
-        self.db.delete(accessory_snapshot)
+        with self._atomic():
+            cabinet = accessory_snapshot.project_cabinet
+            self.db.delete(accessory_snapshot)
 
-        cabinet.updated_at = datetime.now(timezone.utc)
-        self.db.commit()
+            cabinet.updated_at = datetime.now(timezone.utc)
         return True
 
     def update_accessory_quantity(
@@ -570,10 +1131,9 @@ class ProjectService:
         if new_count <= 0:
             return False  # Only positive counts allowed
 
-        accessory_snapshot.count = new_count
-        accessory_snapshot.project_cabinet.updated_at = datetime.now(timezone.utc)
-
-        self.db.commit()
+        with self._atomic():
+            accessory_snapshot.count = new_count
+            accessory_snapshot.project_cabinet.updated_at = datetime.now(timezone.utc)
         return True
 
     def update_accessory_snapshot(
@@ -591,35 +1151,36 @@ class ProjectService:
         if not accessory_snapshot:
             return False
 
-        if name is not None:
-            cleaned_name = name.strip()
-            if not cleaned_name:
-                return False
-
-            previous_name = accessory_snapshot.name
-            accessory_snapshot.name = cleaned_name
-
-            # Keep source traceability aligned with the selected name.
-            if cleaned_name != previous_name:
-                source_accessory = self.db.scalar(
-                    select(Accessory).where(Accessory.name == cleaned_name)
-                )
-                accessory_snapshot.source_accessory_id = (
-                    source_accessory.id if source_accessory else None
-                )
+        # Validate before touching the snapshot
+        cleaned_name = name.strip() if name is not None else None
+        if name is not None and not cleaned_name:
+            return False
+        if count is not None and count <= 0:
+            return False
 
-        if count is not None:
-            if count <= 0:
-                return False
-            accessory_snapshot.count = count
+        try:
+            with self._atomic():
+                if cleaned_name is not None:
+                    previous_name = accessory_snapshot.name
+                    accessory_snapshot.name = cleaned_name
+
+                    # Keep source traceability aligned with the selected name.
+                    if cleaned_name != previous_name:
+                        source_accessory = self.db.scalar(
+                            select(Accessory).where(Accessory.name == cleaned_name)
+                        )
+                        accessory_snapshot.source_accessory_id = (
+                            source_accessory.id if source_accessory else None
+                        )
 
-        accessory_snapshot.project_cabinet.updated_at = datetime.now(timezone.utc)
+                if count is not None:
+                    accessory_snapshot.count = count
 
-        try:
-            self.db.commit()
+                accessory_snapshot.project_cabinet.updated_at = datetime.now(
+                    timezone.utc
+                )
             return True
         except Exception:
-            self.db.rollback()
             return False
 
     def save_cabinet_editor_changes(
@@ -645,159 +1206,183 @@ class ProjectService:
         had_changes = False
 
         try:
-            if instance_values:
-                had_changes = True
-                for attr, val in instance_values.items():
-                    setattr(cabinet, attr, val)
-
-            if parts_changes is not None:
-                had_changes = True
-                if isinstance(parts_changes, list):
-                    # Custom cabinet mode: replace full parts snapshot.
-                    for part in list(cabinet.parts):
-                        self.db.delete(part)
-
-                    for part_data in parts_changes:
-                        self.db.add(
-                            ProjectCabinetPart(
-                                project_cabinet_id=cabinet.id,
-                                part_name=part_data.get("part_name", ""),
-                                height_mm=part_data.get("height_mm", 0),
-                                width_mm=part_data.get("width_mm", 0),
-                                pieces=part_data.get("pieces", 1),
-                                wrapping=part_data.get("wrapping"),
-                                comments=part_data.get("comments"),
-                                material=part_data.get("material"),
-                                processing_json=part_data.get("processing_json"),
-                                source_template_id=part_data.get("source_template_id"),
-                                source_part_id=part_data.get("source_part_id"),
-                                calc_context_json=part_data.get("calc_context_json"),
+            with self._atomic():
+                if instance_values:
+                    had_changes = True
+                    for attr, val in instance_values.items():
+                        setattr(cabinet, attr, val)
+
+                if parts_changes is not None:
+                    had_changes = True
+                    if isinstance(parts_changes, list):
+                        # Custom cabinet mode: replace full parts snapshot.
+                        for part in list(cabinet.parts):
+                            self.db.delete(part)
+
+                        for part_data in parts_changes:
+                            self.db.add(
+                                ProjectCabinetPart(
+                                    project_cabinet_id=cabinet.id,
+                                    part_name=part_data.get("part_name", ""),
+                                    height_mm=part_data.get("height_mm", 0),
+                                    width_mm=part_data.get("width_mm", 0),
+                                    pieces=part_data.get("pieces", 1),
+                                    wrapping=part_data.get("wrapping"),
+                                    comments=part_data.get("comments"),
+                                    material=part_data.get("material"),
+                                    processing_json=part_data.get("processing_json"),
+                                    source_template_id=part_data.get(
+                                        "source_template_id"
+                                    ),
+                                    source_part_id=part_data.get("source_part_id"),
+                                    calc_context_json=part_data.get(
+                                        "calc_context_json"
+                                    ),
+                                )
+                            )
+                    elif isinstance(parts_changes, dict):
+                        for part_id in parts_changes.get("parts_to_remove", []):
+                            db_part = self.db.get(ProjectCabinetPart, int(part_id))
+                            if not db_part or db_part.project_cabinet_id != cabinet.id:
+                                raise ValueError("Invalid part removal request")
+                            self.db.delete(db_part)
+
+                        for part_id, part_data in parts_changes.get(
+                            "parts_changes", {}
+                        ).items():
+                            db_part = self.db.get(ProjectCabinetPart, int(part_id))
+                            if not db_part or db_part.project_cabinet_id != cabinet.id:
+                                raise ValueError("Invalid part update request")
+
+                            for key, value in part_data.items():
+                                if hasattr(db_part, key):
+                                    setattr(db_part, key, value)
+
+                        for part_data in parts_changes.get("parts_to_add", []):
+                            part_name = part_data.get("part_name", "")
+                            if not part_name:
+                                raise ValueError("Part name is required")
+
+                            self.db.add(
+                                ProjectCabinetPart(
+                                    project_cabinet_id=cabinet.id,
+                                    part_name=part_name,
+                                    height_mm=part_data.get("height_mm", 0),
+                                    width_mm=part_data.get("width_mm", 0),
+                                    pieces=part_data.get("pieces", 1),
+                                    material=part_data.get("material"),
+                                    wrapping=part_data.get("wrapping"),
+                                    comments=part_data.get("comments"),
+                                    source_template_id=part_data.get(
+                                        "source_template_id"
+                                    ),
+                                    source_part_id=part_data.get("source_part_id"),
+                                    processing_json=part_data.get("processing_json"),
+                                    calc_context_json=part_data.get(
+                                        "calc_context_json"
+                                    ),
+                                )
                             )
+                    else:
+                        raise ValueError("Unsupported parts payload")
+
+                    self._refresh_cabinet_display([cabinet.id])
+
+                if accessories_changes is not None:
+                    had_changes = True
+                    for acc_data in accessories_changes.get("accessories_to_add", []):
+                        name = (acc_data.get("name", "") or "").strip()
+                        count = acc_data.get("count", 1)
+                        if not name or count <= 0:
+                            raise ValueError("Invalid accessory add request")
+
+                        source_accessory = self.db.scalar(
+                            select(Accessory).where(Accessory.name == name)
+                        )
+                        source_accessory_id = (
+                            source_accessory.id
+                            if source_accessory
+                            else acc_data.get("source_accessory_id")
                         )
-                elif isinstance(parts_changes, dict):
-                    for part_id in parts_changes.get("parts_to_remove", []):
-                        db_part = self.db.get(ProjectCabinetPart, int(part_id))
-                        if not db_part or db_part.project_cabinet_id != cabinet.id:
-                            raise ValueError("Invalid part removal request")
-                        self.db.delete(db_part)
-
-                    for part_id, part_data in parts_changes.get(
-                        "parts_changes", {}
-                    ).items():
-                        db_part = self.db.get(ProjectCabinetPart, int(part_id))
-                        if not db_part or db_part.project_cabinet_id != cabinet.id:
-                            raise ValueError("Invalid part update request")
-
-                        for key, value in part_data.items():
-                            if hasattr(db_part, key):
-                                setattr(db_part, key, value)
-
-                    for part_data in parts_changes.get("parts_to_add", []):
-                        part_name = part_data.get("part_name", "")
-                        if not part_name:
-                            raise ValueError("Part name is required")
 
                         self.db.add(
-                            ProjectCabinetPart(
+                            ProjectCabinetAccessorySnapshot(
                                 project_cabinet_id=cabinet.id,
-                                part_name=part_name,
-                                height_mm=part_data.get("height_mm", 0),
-                                width_mm=part_data.get("width_mm", 0),
-                                pieces=part_data.get("pieces", 1),
-                                material=part_data.get("material"),
-                                wrapping=part_data.get("wrapping"),
-                                comments=part_data.get("comments"),
-                                source_template_id=part_data.get("source_template_id"),
-                                source_part_id=part_data.get("source_part_id"),
-                                processing_json=part_data.get("processing_json"),
-                                calc_context_json=part_data.get("calc_context_json"),
+                                name=name,
+                                count=count,
+                                source_accessory_id=source_accessory_id,
                             )
                         )
-                else:
-                    raise ValueError("Unsupported parts payload")
-
-            if accessories_changes is not None:
-                had_changes = True
-                for acc_data in accessories_changes.get("accessories_to_add", []):
-                    name = (acc_data.get("name", "") or "").strip()
-                    count = acc_data.get("count", 1)
-                    if not name or count <= 0:
-                        raise ValueError("Invalid accessory add request")
-
-                    source_accessory = self.db.scalar(
-                        select(Accessory).where(Accessory.name == name)
-                    )
-                    source_accessory_id = (
-                        source_accessory.id
-                        if source_accessory
-                        else acc_data.get("source_accessory_id")
-                    )
 
-                    self.db.add(
-                        ProjectCabinetAccessorySnapshot(
-                            project_cabinet_id=cabinet.id,
-                            name=name,
-                            count=count,
-                            source_accessory_id=source_accessory_id,
+                    for acc_id in accessories_changes.get("accessories_to_remove", []):
+                        snapshot = self.db.get(
+                            ProjectCabinetAccessorySnapshot, int(acc_id)
                         )
-                    )
-
-                for acc_id in accessories_changes.get("accessories_to_remove", []):
-                    snapshot = self.db.get(ProjectCabinetAccessorySnapshot, int(acc_id))
-                    if not snapshot or snapshot.project_cabinet_id != cabinet.id:
-                        raise ValueError("Invalid accessory removal request")
-                    self.db.delete(snapshot)
-
-                updates = accessories_changes.get("accessories_changes", {})
-                for acc_id, update_data in updates.items():
-                    snapshot = self.db.get(ProjectCabinetAccessorySnapshot, int(acc_id))
-                    if not snapshot or snapshot.project_cabinet_id != cabinet.id:
-                        raise ValueError("Invalid accessory update request")
-
-                    if "name" in update_data and update_data.get("name") is not None:
-                        cleaned_name = update_data.get("name", "").strip()
-                        if not cleaned_name:
-                            raise ValueError("Accessory name is required")
-
-                        previous_name = snapshot.name
-                        snapshot.name = cleaned_name
-                        if cleaned_name != previous_name:
-                            source_accessory = self.db.scalar(
-                                select(Accessory).where(Accessory.name == cleaned_name)
-                            )
-                            snapshot.source_accessory_id = (
-                                source_accessory.id if source_accessory else None
-                            )
-
-                    if "count" in update_data and update_data.get("count") is not None:
-                        new_count = update_data.get("count")
-                        if new_count <= 0:
-                            raise ValueError("Accessory count must be positive")
-                        snapshot.count = new_count
+                        if not snapshot or snapshot.project_cabinet_id != cabinet.id:
+                            raise ValueError("Invalid accessory removal request")
+                        self.db.delete(snapshot)
 
-                if not updates:
-                    for acc_id, new_quantity in accessories_changes.get(
-                        "quantity_changes", {}
-                    ).items():
+                    updates = accessories_changes.get("accessories_changes", {})
+                    for acc_id, update_data in updates.items():
                         snapshot = self.db.get(
                             ProjectCabinetAccessorySnapshot, int(acc_id)
                         )
                         if not snapshot or snapshot.project_cabinet_id != cabinet.id:
-                            raise ValueError(
-                                "Invalid accessory quantity update request"
+                            raise ValueError("Invalid accessory update request")
+
+                        if (
+                            "name" in update_data
+                            and update_data.get("name") is not None
+                        ):
+                            cleaned_name = update_data.get("name", "").strip()
+                            if not cleaned_name:
+                                raise ValueError("Accessory name is required")
+
+                            previous_name = snapshot.name
+                            snapshot.name = cleaned_name
+                            if cleaned_name != previous_name:
+                                source_accessory = self.db.scalar(
+                                    select(Accessory).where(
+                                        Accessory.name == cleaned_name
+                                    )
+                                )
+                                snapshot.source_accessory_id = (
+                                    source_accessory.id if source_accessory else None
+                                )
+
+                        if (
+                            "count" in update_data
+                            and update_data.get("count") is not None
+                        ):
+                            new_count = update_data.get("count")
+                            if new_count <= 0:
+                                raise ValueError("Accessory count must be positive")
+                            snapshot.count = new_count
+
+                    if not updates:
+                        for acc_id, new_quantity in accessories_changes.get(
+                            "quantity_changes", {}
+                        ).items():
+                            snapshot = self.db.get(
+                                ProjectCabinetAccessorySnapshot, int(acc_id)
                             )
-                        if new_quantity <= 0:
-                            raise ValueError("Accessory count must be positive")
-                        snapshot.count = new_quantity
-
-            if had_changes:
-                cabinet.updated_at = datetime.now(timezone.utc)
-
-            self.db.commit()
-            self.db.refresh(cabinet)
+                            if (
+                                not snapshot
+                                or snapshot.project_cabinet_id != cabinet.id
+                            ):
+                                raise ValueError(
+                                    "Invalid accessory quantity update request"
+                                )
+                            if new_quantity <= 0:
+                                raise ValueError("Accessory count must be positive")
+                            snapshot.count = new_quantity
+
+                if had_changes:
+                    cabinet.updated_at = datetime.now(timezone.utc)
         except Exception:
-            self.db.rollback()
             return False
+        finally:
+            self.invalidate_aggregation_cache(cabinet_id)
 
         colors_to_mark = []
         if cabinet.body_color != previous_body_color and cabinet.body_color:
@@ -816,187 +1401,167 @@ class ProjectService:
         Get all elements in a project from snapshot data.
         Returns a dictionary with lists for formatki, fronty, witryny,
         polki_szklane, hdf, and akcesoria.
+
+        Thin adapter over get_aggregated_project_batches() kept for callers
+        that expect the list-of-dicts shape.
         """
-        project = self.get_project(project_id)
-        if not project:
-            return {
-                "formatki": [],
-                "fronty": [],
-                "witryny": [],
-                "polki_szklane": [],
-                "hdf": [],
-                "akcesoria": [],
-            }
-
-        formatki = []
-        fronty = []
-        witryny = []
-        polki_szklane = []
-        hdf = []
-        akcesoria = []
-
-        for cab in project.cabinets:
-            qty = cab.quantity
-            seq = cab.sequence_number
-            seq_symbol = get_circled_number(seq)
-
-            # Process all parts from snapshot (works for both standard and custom)
-            self._process_cabinet_parts_snapshot(
-                cab,
-                qty,
-                seq,
-                seq_symbol,
-                formatki,
-                fronty,
-                hdf,
-                witryny,
-                polki_szklane,
+        return self.get_aggregated_project_batches(project_id).to_elements()
+
+    def get_aggregated_project_batches(self, project_id: int) -> ProjectAggregation:
+        """
+        Aggregate snapshot parts and accessories of a project into columnar
+        per-category batches.
+
+        Results are cached per cabinet, keyed on (updated_at, quantity), so
+        only cabinets changed since the previous call are re-queried; the
+        cache holds the most recently aggregated projects only. Parts
+        and accessories of those cabinets are fetched as flat rows with one
+        joined query each instead of walking cabinet relationships.
+        """
+        fingerprints = self.db.execute(
+            select(
+                ProjectCabinet.id,
+                ProjectCabinet.updated_at,
+                ProjectCabinet.quantity,
             )
+            .where(ProjectCabinet.project_id == project_id)
+            .order_by(ProjectCabinet.id)
+        ).all()
+
+        cache = self._aggregation_cache().project(project_id)
+        current = {cabinet_id for cabinet_id, _updated_at, _quantity in fingerprints}
+        for cabinet_id in [key for key in cache if key not in current]:
+            del cache[cabinet_id]
+
+        stale = {
+            cabinet_id: (updated_at, quantity)
+            for cabinet_id, updated_at, quantity in fingerprints
+            if cabinet_id not in cache or cache[cabinet_id][0] != (updated_at, quantity)
+        }
+        if stale:
+            if len(stale) == len(fingerprints):
+                scope = ProjectCabinet.project_id == project_id
+            else:
+                scope = ProjectCabinet.id.in_(list(stale))
+            fresh = self._aggregate_cabinets(scope)
+            for cabinet_id, key in stale.items():
+                cache[cabinet_id] = (key, fresh.get(cabinet_id, ProjectAggregation()))
+
+        # Copy cached rows so callers never mutate cache entries.
+        result = ProjectAggregation()
+        for cabinet_id, _updated_at, _quantity in fingerprints:
+            result.extend(cache[cabinet_id][1])
+        return result
+
+    def aggregate_project_cabinets(self, project_id: int) -> List[ProjectAggregation]:
+        """
+        Per-cabinet aggregations of a project in cabinet order, uncached.
 
-            # Process accessories from snapshot
-            self._process_accessories_snapshot(cab, qty, akcesoria)
+        For one-off bulk reads such as cut-list exports, which would
+        otherwise fill the aggregation cache with every exported cabinet.
+        """
+        per_cabinet = self._aggregate_cabinets(ProjectCabinet.project_id == project_id)
+        return [per_cabinet[cabinet_id] for cabinet_id in sorted(per_cabinet)]
 
-        return {
-            "formatki": formatki,
-            "fronty": fronty,
-            "witryny": witryny,
-            "polki_szklane": polki_szklane,
-            "hdf": hdf,
-            "akcesoria": akcesoria,
-        }
+    def get_project_edge_banding(self, project_id: int) -> List[EdgeBandingTotal]:
+        """
+        Sum edge-banding (okleina) lengths of a project per color.
 
-    def _process_cabinet_parts_snapshot(
-        self,
-        cab,
-        qty,
-        seq,
-        seq_symbol,
-        formatki,
-        fronty,
-        hdf,
-        witryny,
-        polki_szklane,
-    ):
-        """Process elements from cabinet parts snapshot (works for both standard and custom)"""
-        # Process all parts from the snapshot
-        for part in cab.parts:
-            part_qty = part.pieces * qty
-
-            # Determine material from part data (with fallback logic)
-            material = part.material
-            if not material:
-                part_name_lc = part.part_name.lower()
-                if "półka szkl" in part_name_lc or "polka szkl" in part_name_lc:
-                    material = "PÓŁKA SZKLANA"
-                elif "witryn" in part_name_lc:
-                    material = "WITRYNA"
-                elif "front" in part_name_lc:
-                    material = "FRONT"
-                elif "hdf" in part_name_lc:
-                    material = "HDF"
-                else:
-                    material = "PLYTA 18"  # Default for panels
-
-            # Determine category based on material
-            material_upper = material.upper() if material else ""
-            if material_upper.startswith("PÓŁKA SZKLANA") or material_upper.startswith(
-                "POLKA SZKLANA"
-            ):
-                polki_szklane.append(
-                    {
-                        "seq": seq_symbol,
-                        "sequence": seq,
-                        "name": part.part_name,
-                        "quantity": part_qty,
-                        "width": part.width_mm,
-                        "height": part.height_mm,
-                        "color": cab.body_color,
-                        "wrapping": part.wrapping or "",
-                        "notes": part.comments or "",
-                    }
-                )
-            elif material_upper.startswith("WITRYNA"):
-                witryny.append(
-                    {
-                        "seq": seq_symbol,
-                        "sequence": seq,
-                        "name": part.part_name,
-                        "quantity": part_qty,
-                        "width": part.width_mm,
-                        "height": part.height_mm,
-                        "color": cab.front_color,
-                        "wrapping": part.wrapping or "",
-                        "notes": f"Handle: {cab.handle_type}",
-                    }
-                )
-            elif material_upper.startswith("FRONT"):
-                fronty.append(
-                    {
-                        "seq": seq_symbol,
-                        "sequence": seq,
-                        "name": part.part_name,
-                        "quantity": part_qty,
-                        "width": part.width_mm,
-                        "height": part.height_mm,
-                        "color": cab.front_color,
-                        "wrapping": part.wrapping or "",
-                        "notes": f"Handle: {cab.handle_type}",
-                    }
-                )
-            elif material_upper.startswith("HDF"):
-                hdf.append(
-                    {
-                        "seq": seq_symbol,
-                        "sequence": seq,
-                        "name": part.part_name,
-                        "quantity": part_qty,
-                        "width": part.width_mm,
-                        "height": part.height_mm,
-                        "color": "",
-                        "wrapping": part.wrapping or "",
-                        "notes": part.comments or "",
-                    }
-                )
-            else:
-                # Default to formatki (panels)
-                formatki.append(
-                    {
-                        "seq": seq_symbol,
-                        "sequence": seq,
-                        "name": part.part_name,
-                        "quantity": part_qty,
-                        "width": part.width_mm,
-                        "height": part.height_mm,
-                        "color": cab.body_color,
-                        "material": material,
-                        "wrapping": part.wrapping or "",
-                        "notes": part.comments or "",
-                    }
-                )
+        Uses the cached part aggregation, so quantities already include
+        pieces and cabinet quantity.
+        """
+        return calculate_aggregation_edge_banding(
+            self.get_aggregated_project_batches(project_id)
+        )
 
-    def _process_accessories_snapshot(self, cab, qty, akcesoria):
-        """Process accessories from snapshot (works for both standard and custom)"""
-        # Process accessory snapshots
-        for acc_snapshot in cab.accessory_snapshots:
-            total = acc_snapshot.count * qty
-            akcesoria.append(
-                {
-                    "name": acc_snapshot.name,
-                    "source_accessory_id": acc_snapshot.source_accessory_id,
-                    "quantity": total,
-                    "notes": "",
-                }
-            )
+    def invalidate_aggregation_cache(self, *cabinet_ids: int) -> None:
+        """Drop cached aggregation of given cabinets (all cabinets if none given)."""
+        cache = self._aggregation_cache()
+        if not cabinet_ids:
+            cache.clear()
+            return
+        cache.discard_cabinets(cabinet_ids)
 
-        # Legacy support: also process old-style accessories if they exist
-        for link in getattr(cab, "accessories", []):
-            acc = link.accessory
-            total = link.count * qty
-            akcesoria.append(
-                {
-                    "name": acc.name,
-                    "source_accessory_id": getattr(acc, "id", None),
-                    "quantity": total,
-                    "notes": "",
-                }
+    def _aggregation_cache(self) -> _AggregationCache:
+        """
+        Per-cabinet aggregation cache shared by all services on this session.
+
+        Stored in Session.info so ReportGenerator, views and controllers that
+        build their own ProjectService on the app session reuse it.
+        """
+        cache = self.db.info.get("project_aggregation_cache")
+        if cache is None:
+            cache = self.db.info["project_aggregation_cache"] = _AggregationCache()
+        return cache
+
+    def _aggregate_cabinets(self, scope) -> Dict[int, ProjectAggregation]:
+        """Run the aggregation queries for cabinets matching scope, per cabinet."""
+        part_rows = self.db.execute(
+            select(
+                ProjectCabinet.id,
+                ProjectCabinet.sequence_number,
+                ProjectCabinet.quantity,
+                ProjectCabinet.body_color,
+                ProjectCabinet.front_color,
+                ProjectCabinet.handle_type,
+                ProjectCabinetPart.part_name,
+                ProjectCabinetPart.width_mm,
+                ProjectCabinetPart.height_mm,
+                ProjectCabinetPart.pieces,
+                ProjectCabinetPart.material,
+                ProjectCabinetPart.wrapping,
+                ProjectCabinetPart.comments,
+            )
+            .join(
+                ProjectCabinetPart,
+                ProjectCabinetPart.project_cabinet_id == ProjectCabinet.id,
+            )
+            .where(scope)
+            .order_by(ProjectCabinet.id, ProjectCabinetPart.id)
+        ).all()
+
+        snapshot_rows = self.db.execute(
+            select(
+                ProjectCabinet.id,
+                ProjectCabinet.quantity,
+                ProjectCabinetAccessorySnapshot.name,
+                ProjectCabinetAccessorySnapshot.source_accessory_id,
+                ProjectCabinetAccessorySnapshot.count,
+            )
+            .join(
+                ProjectCabinetAccessorySnapshot,
+                ProjectCabinetAccessorySnapshot.project_cabinet_id == ProjectCabinet.id,
+            )
+            .where(scope)
+            .order_by(ProjectCabinet.id, ProjectCabinetAccessorySnapshot.id)
+        ).all()
+
+        # Legacy support: old-style accessory links
+        legacy_rows = self.db.execute(
+            select(
+                ProjectCabinet.id,
+                ProjectCabinet.quantity,
+                Accessory.name,
+                Accessory.id,
+                ProjectCabinetAccessory.count,
+            )
+            .join(
+                ProjectCabinetAccessory,
+                ProjectCabinetAccessory.project_cabinet_id == ProjectCabinet.id,
+            )
+            .join(Accessory, Accessory.id == ProjectCabinetAccessory.accessory_id)
+            .where(scope)
+            .order_by(ProjectCabinet.id)
+        ).all()
+
+        per_cabinet: Dict[int, ProjectAggregation] = {}
+        for cabinet_id, rows in groupby(part_rows, key=lambda row: row[0]):
+            per_cabinet[cabinet_id] = aggregate_part_rows(rows)
+
+        # Keep per-cabinet ordering: snapshots first, then legacy links.
+        accessory_rows = sorted(snapshot_rows + legacy_rows, key=lambda row: row[0])
+        for cabinet_id, rows in groupby(accessory_rows, key=lambda row: row[0]):
+            aggregate_accessory_rows(
+                rows, into=per_cabinet.setdefault(cabinet_id, ProjectAggregation())
             )
+        return per_cabinet
@@ -0,0 +1,129 @@
+"""
+Batch report generation across many projects.
+
+Reports are rendered in parallel on a process pool. Each worker process opens
+its own read-only SQLite connection, so no session or ORM object is shared
+between processes. This module has no Qt dependency; BatchReportService wraps
+it for the GUI.
+"""
+
+import logging
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+logger = logging.getLogger(__name__)
+
+# Per-process state populated by _init_worker().
+_worker_session: Optional[Session] = None
+
+
+@dataclass
+class BatchReportResult:
+    """Outcome of one project in a batch run."""
+
+    project_id: int
+    path: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def create_read_only_engine(db_path: Path):
+    """Create an engine whose connections open the database read-only."""
+    uri = f"file:{Path(db_path).as_posix()}?mode=ro"
+    return create_engine("sqlite://", creator=lambda: sqlite3.connect(uri, uri=True))
+
+
+def _init_worker(db_path: str) -> None:
+    """Process pool initializer: open one read connection for this worker."""
+    global _worker_session
+    engine = create_read_only_engine(Path(db_path))
+    _worker_session = sessionmaker(bind=engine)()
+
+
+def _render_project_report(project_id: int, output_dir: str) -> str:
+    """Render a single project report inside a worker process."""
+    from src.db_schema.orm_models import Project
+    from src.services.report_generator import ReportGenerator
+
+    project = _worker_session.get(Project, project_id)
+    if project is None:
+        raise LookupError(f"Projekt {project_id} nie istnieje")
+    generator = ReportGenerator(db_session=_worker_session)
+    return generator.generate(project, output_dir=output_dir, auto_open=False)
+
+
+class ReportBatchRunner:
+    """Render reports for many projects on a process pool."""
+
+    def __init__(self, db_path: Path, max_workers: Optional[int] = None):
+        self.db_path = Path(db_path)
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+
+    def run(
+        self,
+        project_ids: Sequence[int],
+        output_dir: str,
+        progress_callback: Optional[
+            Callable[[int, int, BatchReportResult], None]
+        ] = None,
+        is_cancelled: Optional[Callable[[], bool]] = None,
+    ) -> List[BatchReportResult]:
+        """
+        Generate a report for every project ID.
+
+        Args:
+            project_ids: Projects to render
+            output_dir: Directory for generated .docx files
+            progress_callback: Called as (done, total, result) after each project
+            is_cancelled: Polled between projects; pending work is dropped when True
+
+        Returns:
+            One BatchReportResult per finished project, in completion order
+        """
+        total = len(project_ids)
+        results: List[BatchReportResult] = []
+        if not total:
+            return results
+
+        workers = min(self.max_workers, total)
+        logger.info("Generating %d reports on %d worker processes", total, workers)
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(str(self.db_path),),
+        ) as executor:
+            futures = {
+                executor.submit(_render_project_report, project_id, output_dir): (
+                    project_id
+                )
+                for project_id in project_ids
+            }
+            for future in as_completed(futures):
+                project_id = futures[future]
+                try:
+                    result = BatchReportResult(project_id, path=future.result())
+                except Exception as exc:
+                    logger.warning("Report for project %s failed: %s", project_id, exc)
+                    result = BatchReportResult(project_id, error=str(exc))
+
+                results.append(result)
+                if progress_callback:
+                    progress_callback(len(results), total, result)
+
+                if is_cancelled and is_cancelled():
+                    logger.info("Batch report generation cancelled")
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    break
+
+        return results
@@ -3,28 +3,80 @@ import re
 import sys
 import subprocess
 import logging
+from itertools import chain
 from pathlib import Path
 from datetime import date
-from typing import List, Tuple, Optional, Any, Dict
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, List, Tuple, Optional, Any, Dict
 from types import SimpleNamespace
 
-from docx import Document
 from docx.document import Document as DocxDocument
 from docx.section import Section
-from docx.shared import Pt, Inches
+from docx.shared import Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml import OxmlElement
-from docx.oxml.shared import qn
 
 from src.app.paths import get_base_path
 from src.db_schema.orm_models import Project
+from src.services.project_aggregation import get_circled_number
 from src.services.project_service import ProjectService
+from src.services.edge_banding import (
+    EDGE_LONG,
+    EDGE_SHORT,
+    EdgeBandingTotal,
+    calculate_edge_banding,
+)
+from src.services.nesting import MODE_DEEP, MODE_FAST, NestingEngine, NestingResult
+from src.services.report_pagination import ReportPagination
+from src.services.report_stream_writer import StreamingDocxWriter
+from src.services.report_template import (
+    ReportTemplate,
+    get_report_template,
+    on_setting_changed as on_template_setting_changed,
+)
 from src.services.settings_service import SettingsService
 from sqlalchemy.orm import Session
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Settings read while rendering a report; copied into ReportSnapshot.
+REPORT_SETTING_KEYS = (
+    "report_program_logo_variant",
+    "company_logo_path",
+    "report_page_break_strictness",
+    "report_include_sheet_summary",
+    "report_sheet_nesting_deep",
+    "report_include_edge_banding",
+)
+
+# Seconds the deep nesting search may spend on the sheet summary.
+SHEET_NESTING_TIME_BUDGET = 2.0
+
+
+class SettingsSnapshot:
+    """Read-only stand-in for SettingsService backed by plain values."""
+
+    def __init__(self, values: Optional[Dict[str, Any]] = None) -> None:
+        self._values = dict(values or {})
+
+    def get_setting_value(self, key: str, default=None):
+        return self._values.get(key, default)
+
+
+@dataclass
+class ReportSnapshot:
+    """
+    Detached copy of everything needed to render a project report.
+
+    Built on the thread owning the database session (see
+    ReportGenerator.create_snapshot), so rendering can run on a worker
+    thread without touching ORM objects.
+    """
+
+    project: SimpleNamespace
+    elements: Dict[str, List[Dict[str, Any]]]
+    settings: SettingsSnapshot = field(default_factory=SettingsSnapshot)
+
 
 class ReportGenerator:
     """
@@ -32,8 +84,18 @@ class ReportGenerator:
 
     This class is responsible only for document generation and formatting.
     All data access and business logic is delegated to service classes.
+
+    Two writers are available: "python-docx" builds every table row in the
+    python-docx object tree, "streaming" writes table rows directly into the
+    saved package (see StreamingDocxWriter). "auto" picks streaming for
+    reports with more than STREAMING_ROW_THRESHOLD rows.
     """
 
+    WRITER_DOCX = "python-docx"
+    WRITER_STREAMING = "streaming"
+    WRITER_AUTO = "auto"
+    STREAMING_ROW_THRESHOLD = 1500
+
     def __init__(
         self,
         program_logo_path: Optional[Path] = None,
@@ -70,35 +132,143 @@ class ReportGenerator:
         self.settings_service = (
             SettingsService(resolved_db_session) if resolved_db_session else None
         )
+        if self.settings_service:
+            self.settings_service.subscribe(on_template_setting_changed)
+        self._stream_writer: Optional[StreamingDocxWriter] = None
+        self._pagination: Optional[ReportPagination] = None
+        # Estimated page count of the last generated report.
+        self.last_page_estimate = 0
+        self._progress_callback: Optional[Callable[[int, str], None]] = None
+        self._is_cancelled: Optional[Callable[[], bool]] = None
+        self._progress_total = 0
+        self._progress_done = 0
+
+    def create_snapshot(self, project: Project) -> ReportSnapshot:
+        """
+        Copy project fields, aggregated elements and report settings.
+
+        Must be called on the thread that owns the database session.
+        """
+        project_data = SimpleNamespace(
+            **{
+                column.key: getattr(project, column.key)
+                for column in Project.__table__.columns
+            }
+        )
+        if self.project_service and project.id:
+            elements = self.project_service.get_aggregated_project_elements(project.id)
+        else:
+            formatki, fronty, witryny, polki_szklane, hdf, akcesoria = (
+                self._extract_elements_directly_with_witryny(project)
+            )
+            elements = {
+                "formatki": [vars(item) for item in formatki],
+                "fronty": [vars(item) for item in fronty],
+                "witryny": [vars(item) for item in witryny],
+                "polki_szklane": [vars(item) for item in polki_szklane],
+                "hdf": [vars(item) for item in hdf],
+                "akcesoria": [vars(item) for item in akcesoria],
+            }
+
+        settings = {}
+        if self.settings_service:
+            for key in REPORT_SETTING_KEYS:
+                value = self.settings_service.get_setting_value(key)
+                if value is not None:
+                    settings[key] = value
+
+        return ReportSnapshot(
+            project=project_data,
+            elements=elements,
+            settings=SettingsSnapshot(settings),
+        )
+
+    def generate_from_snapshot(
+        self,
+        snapshot: ReportSnapshot,
+        output_dir: str = "documents/reports",
+        auto_open: bool = False,
+        writer: str = WRITER_AUTO,
+        progress_callback: Optional[Callable[[int, str], None]] = None,
+        is_cancelled: Optional[Callable[[], bool]] = None,
+    ) -> str:
+        """
+        Generate the .docx report from a detached snapshot.
+
+        Safe to call from a worker thread: no database access happens here.
+        Settings are read from ``snapshot.settings``.
+        """
+        settings_service = self.settings_service
+        self.settings_service = snapshot.settings
+        try:
+            return self._generate(
+                snapshot.project,
+                snapshot.elements,
+                output_dir,
+                auto_open,
+                writer,
+                progress_callback,
+                is_cancelled,
+            )
+        finally:
+            self.settings_service = settings_service
 
     def generate(
         self,
         project: Project,
         output_dir: str = "documents/reports",
         auto_open: bool = True,
+        writer: str = WRITER_AUTO,
+        progress_callback: Optional[Callable[[int, str], None]] = None,
+        is_cancelled: Optional[Callable[[], bool]] = None,
     ) -> str:
         """
         Generate the .docx report and return its file path.
+
+        Args:
+            writer: "python-docx", "streaming" or "auto" (see class docstring)
+            progress_callback: Called as (percent, section title) per section
+            is_cancelled: Polled between sections; raises ReportCancelledError
         """
+        elements = None
+        if self.project_service and project.id:
+            # Get aggregated elements from service
+            logger.debug("Using project service to get aggregated elements")
+            elements = self.project_service.get_aggregated_project_elements(project.id)
+        return self._generate(
+            project,
+            elements,
+            output_dir,
+            auto_open,
+            writer,
+            progress_callback,
+            is_cancelled,
+        )
+
+    def _generate(
+        self,
+        project: Any,
+        elements: Optional[Dict[str, List[Dict[str, Any]]]],
+        output_dir: str,
+        auto_open: bool,
+        writer: str,
+        progress_callback: Optional[Callable[[int, str], None]],
+        is_cancelled: Optional[Callable[[], bool]],
+    ) -> str:
         try:
             logger.info(
                 f"Generating report for project: {project.name} (ID: {project.id})"
             )
-            doc = Document()
+            self._progress_callback = progress_callback
+            self._is_cancelled = is_cancelled
+            # Page setup, header logos and footer come from the cached template
+            doc = self._get_report_template().new_document()
             section = doc.sections[0]
-            section.different_first_page_header_footer = False
-
-            # Header and footer on every page
+            self._pagination = ReportPagination.for_document(doc)
             self._add_header(section, project)
-            self._add_footer(section)
 
             # Get data for report
-            if self.project_service and project.id:
-                # Get aggregated elements from service
-                logger.debug("Using project service to get aggregated elements")
-                elements = self.project_service.get_aggregated_project_elements(
-                    project.id
-                )
+            if elements is not None:
                 formatki = self._dict_to_namespace_list(elements["formatki"])
                 fronty = self._dict_to_namespace_list(elements["fronty"])
                 witryny = self._dict_to_namespace_list(elements.get("witryny", []))
@@ -124,6 +294,18 @@ class ReportGenerator:
             hdf = self._sort_by_cabinet_and_color(hdf)
             akcesoria = self._aggregate_accessories(akcesoria)
 
+            total_rows = sum(
+                len(items)
+                for items in (formatki, fronty, witryny, polki_szklane, hdf, akcesoria)
+            )
+            if writer == self.WRITER_STREAMING or (
+                writer == self.WRITER_AUTO and total_rows > self.STREAMING_ROW_THRESHOLD
+            ):
+                logger.debug("Using streaming writer for %d report rows", total_rows)
+                self._stream_writer = StreamingDocxWriter()
+            self._progress_total = total_rows
+            self._progress_done = 0
+
             # Split formatki by material type
             formatki_plyta_12 = [
                 p for p in formatki if getattr(p, "material", "") == "PLYTA 12"
@@ -168,8 +350,57 @@ class ReportGenerator:
             self._add_parts_section(doc, "HDF", hdf)
             self._add_parts_section(doc, "AKCESORIA", akcesoria, accessory=True)
 
+            # Optional sheet requirement (nesting) summary
+            if self._get_report_flag("report_include_sheet_summary"):
+                rows = [
+                    (
+                        getattr(p, "material", ""),
+                        p.color,
+                        p.name,
+                        p.width,
+                        p.height,
+                        p.quantity,
+                    )
+                    for p in formatki
+                ]
+                rows.extend(
+                    ("FRONT", p.color, p.name, p.width, p.height, p.quantity)
+                    for p in fronty
+                )
+                rows.extend(
+                    ("HDF", "", p.name, p.width, p.height, p.quantity) for p in hdf
+                )
+                deep = self._get_report_flag("report_sheet_nesting_deep")
+                self._add_sheet_summary_section(
+                    doc,
+                    NestingEngine().nest_groups(
+                        rows,
+                        mode=MODE_DEEP if deep else MODE_FAST,
+                        time_budget=SHEET_NESTING_TIME_BUDGET,
+                    ),
+                )
+
+            # Optional edge-banding (okleina) summary
+            if self._get_report_flag("report_include_edge_banding"):
+                self._add_edge_banding_section(
+                    doc,
+                    calculate_edge_banding(
+                        (
+                            p.color,
+                            p.width,
+                            p.height,
+                            p.quantity,
+                            getattr(p, "wrapping", ""),
+                        )
+                        for p in chain(formatki, fronty, witryny, polki_szklane, hdf)
+                    ),
+                )
+
             # Optional notes
             self._add_notes(doc, project)
+            self.last_page_estimate = self._pagination.page_count
+
+            self._report_progress("Zapisywanie")
 
             # Save with handling for open files
             out_dir = Path(output_dir)
@@ -178,17 +409,44 @@ class ReportGenerator:
                 f"projekt_{project.order_number}"
             )
             output_path = self._get_available_filename(out_dir, base_name)
-            doc.save(str(output_path))
+            if self._stream_writer is not None:
+                self._stream_writer.save(doc, str(output_path))
+            else:
+                doc.save(str(output_path))
             logger.info(f"Report saved to: {output_path}")
+            if self._progress_callback:
+                self._progress_callback(100, "Zapisywanie")
 
             if auto_open:
                 self._open_file(output_path)
 
             return str(output_path)
 
+        except ReportCancelledError:
+            logger.info("Report generation cancelled")
+            raise
         except Exception as e:
             logger.error(f"Error generating report: {str(e)}", exc_info=True)
             raise ReportGenerationError(f"Failed to generate report: {str(e)}")
+        finally:
+            self._stream_writer = None
+            self._pagination = None
+            self._progress_callback = None
+            self._is_cancelled = None
+
+    def _report_progress(self, title: str, rows: int = 0) -> None:
+        """Check for cancellation and report progress before a section."""
+        if self._is_cancelled and self._is_cancelled():
+            raise ReportCancelledError("Generowanie raportu anulowane")
+        if self._progress_callback:
+            # Keep the last few percent for saving the document.
+            percent = (
+                int(95 * self._progress_done / self._progress_total)
+                if self._progress_total
+                else 0
+            )
+            self._progress_callback(percent, title)
+        self._progress_done += rows
 
     def _sort_by_cabinet_and_color(
         self, items: List[SimpleNamespace]
@@ -337,8 +595,6 @@ class ReportGenerator:
         """Process a cabinet (catalog or custom) and add its parts to the appropriate lists"""
         # Get the sequence number for this cabinet
         seq_num = getattr(cab, "sequence_number", 0)
-        from src.services.project_service import get_circled_number
-
         seq_symbol = get_circled_number(seq_num)
 
         # Determine parts source based on cabinet type
@@ -557,16 +813,15 @@ class ReportGenerator:
             logger.warning("Failed to read company logo path from settings: %s", exc)
             return None
 
-    def _add_header(self, section: Section, project: Project) -> None:
-        header = section.header
-        usable_width = section.page_width - section.left_margin - section.right_margin
-        table = header.add_table(1, 2, usable_width)
-        table.autofit = True
+    def _get_report_template(self) -> ReportTemplate:
+        """Template for the current logo settings (built once, then cached)."""
+        return get_report_template(
+            self._get_program_logo_path(), self._get_company_logo_path()
+        )
 
-        # Left: metadata in single line with Polish labels
-        cell_meta = table.rows[0].cells[0]
-        p = cell_meta.paragraphs[0]
-        p.alignment = WD_ALIGN_PARAGRAPH.LEFT
+    def _add_header(self, section: Section, project: Project) -> None:
+        """Fill the template header's metadata cell for this project."""
+        p = section.header.tables[0].rows[0].cells[0].paragraphs[0]
 
         # Single line format with Polish labels
         info_text = (
@@ -582,46 +837,6 @@ class ReportGenerator:
         run = p.add_run(info_text)
         run.font.size = Pt(10)
 
-        # Right: logos (company + Cabplanner)
-        cell_logo = table.rows[0].cells[1]
-        paragraph_logo = cell_logo.paragraphs[0]
-        paragraph_logo.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-
-        company_logo_path = self._get_company_logo_path()
-        if company_logo_path:
-            run_logo = paragraph_logo.add_run()
-            run_logo.add_picture(str(company_logo_path), width=Inches(1))
-
-        program_logo_path = self._get_program_logo_path()
-        if program_logo_path:
-            # Keep program logo below company logo if both are present.
-            if company_logo_path:
-                paragraph_logo = cell_logo.add_paragraph()
-                paragraph_logo.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-            run_program_logo = paragraph_logo.add_run()
-            run_program_logo.add_picture(str(program_logo_path), width=Inches(0.52))
-
-    def _add_footer(self, section: Section) -> None:
-        footer = section.footer
-        usable_width = section.page_width - section.left_margin - section.right_margin
-        table = footer.add_table(1, 2, usable_width)
-        table.autofit = True
-
-        # Branding
-        cell_brand = table.rows[0].cells[0]
-        p_brand = cell_brand.paragraphs[0]
-        p_brand.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        run = p_brand.add_run("Wygenerowano przez Cabplanner")
-        run.italic = True
-
-        # Page number
-        cell_page = table.rows[0].cells[1]
-        p_page = cell_page.paragraphs[0]
-        p_page.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-        fld = OxmlElement("w:fldSimple")
-        fld.set(qn("w:instr"), "PAGE")
-        p_page._p.append(fld)
-
     def _add_parts_section(
         self,
         doc: DocxDocument,
@@ -630,16 +845,8 @@ class ReportGenerator:
         accessory: bool = False,
         hide_color_values: bool = False,
     ) -> None:
-        # Check if we need a page break before adding section
-        if parts and self._should_break_page_for_section(doc, len(parts)):
-            doc.add_page_break()
-
-        heading = doc.add_heading(title, level=2)
-        # Keep heading with the following content to avoid orphaned section titles.
-        heading.paragraph_format.keep_with_next = True
-        if not parts:
-            doc.add_paragraph("Brak pozycji.")
-            return
+        self._report_progress(title, len(parts))
+        pagination = self._pagination or ReportPagination.for_document(doc)
 
         cols = (
             ["Poz.", "Nazwa akcesorium", "Ilość", "Uwagi"]
@@ -654,6 +861,39 @@ class ReportGenerator:
                 "Uwagi",
             ]
         )
+        column_widths = pagination.table_column_widths(
+            [pagination.text_width / len(cols)] * len(cols)
+        )
+        # Only row heights are kept here; the cell texts are generated again
+        # while the table is written, so a section is never held in memory
+        row_heights = [pagination.row_height(cols, column_widths)]
+        row_heights.extend(
+            pagination.rows_height(
+                self._iter_section_rows(parts, accessory, hide_color_values),
+                column_widths,
+            )
+        )
+        heading_height = pagination.heading_height(title)
+
+        # Check if we need a page break before adding section
+        if parts and self._should_break_page_for_section(
+            doc, len(parts), section_height=heading_height + sum(row_heights)
+        ):
+            doc.add_page_break()
+            pagination.add_page_break()
+
+        heading = doc.add_heading(title, level=2)
+        pagination.add_heading(title)
+        # Keep heading with the following content to avoid orphaned section titles.
+        heading.paragraph_format.keep_with_next = True
+        if not parts:
+            doc.add_paragraph("Brak pozycji.")
+            pagination.add_paragraph("Brak pozycji.")
+            return
+
+        for height in row_heights:
+            pagination.add_row_height(height)
+
         table = doc.add_table(rows=1, cols=len(cols))
         hdr = table.rows[0].cells
         for i, col in enumerate(cols):
@@ -661,42 +901,160 @@ class ReportGenerator:
         qty_col_idx = 2 if accessory else 3
         hdr[qty_col_idx].paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
 
-        for row_index, part in enumerate(parts, start=1):
-            cells = table.add_row().cells
+        rows = self._iter_section_rows(parts, accessory, hide_color_values)
+        if self._stream_writer is not None:
+            self._stream_writer.defer_rows(
+                table, rows, len(parts), centered_columns=(qty_col_idx,)
+            )
+            return
 
+        for values in rows:
+            cells = table.add_row().cells
+            for i, value in enumerate(values):
+                cells[i].text = value
+            cells[qty_col_idx].paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+    def _iter_section_rows(
+        self, parts: List[Any], accessory: bool, hide_color_values: bool
+    ) -> Iterator[List[str]]:
+        """Yield cell texts for each data row of a parts/accessories table."""
+        for row_index, part in enumerate(parts, start=1):
             if accessory:
                 # Accessories are project-wide aggregate; use row index, not cabinet sequence.
-                cells[0].text = str(row_index)
-                cells[1].text = part.name
-                cells[2].text = str(part.quantity)
-                cells[2].paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
-                cells[3].text = getattr(part, "notes", "") or ""
+                yield [
+                    str(row_index),
+                    part.name,
+                    str(part.quantity),
+                    getattr(part, "notes", "") or "",
+                ]
             else:
                 # Parts keep cabinet sequence marker.
-                cells[0].text = getattr(part, "seq", "")
-                cells[1].text = part.name
-                cells[2].text = f"{part.width} x {part.height}"
-                cells[3].text = str(part.quantity)
-                cells[3].paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
-                cells[4].text = getattr(part, "wrapping", "") or ""
-                cells[5].text = (
-                    "" if hide_color_values else getattr(part, "color", "") or ""
-                )
-                cells[6].text = getattr(part, "notes", "") or ""
+                yield [
+                    getattr(part, "seq", ""),
+                    part.name,
+                    f"{part.width} x {part.height}",
+                    str(part.quantity),
+                    getattr(part, "wrapping", "") or "",
+                    "" if hide_color_values else getattr(part, "color", "") or "",
+                    getattr(part, "notes", "") or "",
+                ]
+
+    def _get_report_flag(self, key: str) -> bool:
+        """Whether an optional report section is enabled in settings."""
+        if not self.settings_service:
+            return False
+        try:
+            value = self.settings_service.get_setting_value(key, False)
+        except Exception as exc:
+            logger.warning("Failed to read setting %s: %s", key, exc)
+            return False
+        if isinstance(value, str):
+            return value.strip().lower() in ("true", "1", "tak", "yes")
+        return bool(value)
+
+    def _add_sheet_summary_section(
+        self, doc: DocxDocument, results: List[NestingResult]
+    ) -> None:
+        """Table with the number of 2800 x 2070 sheets per material and color."""
+        title = "ZAPOTRZEBOWANIE NA PŁYTY"
+        self._report_progress(title, 0)
+        if not results:
+            return
+
+        cols = ["Materiał", "Kolor", "Arkusze", "Wykorzystanie", "Uwagi"]
+        rows = []
+        for result in results:
+            oversized = sum(part.quantity for part in result.oversized)
+            rows.append(
+                [
+                    result.material,
+                    result.color,
+                    str(result.sheet_count),
+                    f"{result.utilization:.0%}",
+                    f"Za duże na arkusz: {oversized} szt." if oversized else "",
+                ]
+            )
+
+        self._add_summary_table(doc, title, cols, rows)
+
+    def _add_edge_banding_section(
+        self, doc: DocxDocument, totals: List[EdgeBandingTotal]
+    ) -> None:
+        """Table with edge-banding meters per color, split into D and K edges."""
+        title = "OKLEINA"
+        self._report_progress(title, 0)
+        if not totals:
+            return
+
+        cols = ["Kolor", "D [m]", "K [m]", "Razem [m]", "Krawędzie"]
+        rows = [
+            [
+                total.color or "-",
+                f"{total.meters(EDGE_LONG):.2f}",
+                f"{total.meters(EDGE_SHORT):.2f}",
+                f"{total.meters():.2f}",
+                str(total.total_edges),
+            ]
+            for total in totals
+        ]
+
+        self._add_summary_table(doc, title, cols, rows)
+
+    def _add_summary_table(
+        self,
+        doc: DocxDocument,
+        title: str,
+        cols: List[str],
+        rows: List[List[str]],
+        column_widths: Optional[List[float]] = None,
+    ) -> None:
+        """
+        Heading plus a plain text table, paginated as one section.
+
+        column_widths are in points; by default the text width is split
+        equally between the columns.
+        """
+        pagination = self._pagination or ReportPagination.for_document(doc)
+        column_widths = pagination.table_column_widths(
+            column_widths or [pagination.text_width / len(cols)] * len(cols)
+        )
+        row_heights = [pagination.row_height(cols, column_widths)]
+        row_heights.extend(pagination.rows_height(rows, column_widths))
+        if self._should_break_page_for_section(
+            doc,
+            len(rows),
+            section_height=pagination.heading_height(title) + sum(row_heights),
+        ):
+            doc.add_page_break()
+            pagination.add_page_break()
+
+        heading = doc.add_heading(title, level=2)
+        heading.paragraph_format.keep_with_next = True
+        pagination.add_heading(title)
+
+        table = doc.add_table(rows=1, cols=len(cols))
+        for cell, col in zip(table.rows[0].cells, cols):
+            cell.text = col
+        for values in rows:
+            for cell, value in zip(table.add_row().cells, values):
+                cell.text = value
+        for height in row_heights:
+            pagination.add_row_height(height)
 
     def _add_notes(self, doc: DocxDocument, project: Project) -> None:
-        if getattr(project, "blaty_note", None):
-            p = doc.add_paragraph()
-            p.add_run("Blaty: ").bold = True
-            p.add_run(project.blaty_note)
-        if getattr(project, "cokoly_note", None):
-            p = doc.add_paragraph()
-            p.add_run("Cokoły: ").bold = True
-            p.add_run(project.cokoly_note)
-        if getattr(project, "uwagi_note", None):
+        for label, attr in (
+            ("Blaty: ", "blaty_note"),
+            ("Cokoły: ", "cokoly_note"),
+            ("Uwagi: ", "uwagi_note"),
+        ):
+            note = getattr(project, attr, None)
+            if not note:
+                continue
             p = doc.add_paragraph()
-            p.add_run("Uwagi: ").bold = True
-            p.add_run(project.uwagi_note)
+            p.add_run(label).bold = True
+            p.add_run(note)
+            if self._pagination is not None:
+                self._pagination.add_paragraph(label + note)
 
     def _get_available_filename(self, output_dir: Path, base_name: str) -> Path:
         """
@@ -753,20 +1111,31 @@ class ReportGenerator:
         return "standardowa"
 
     def _should_break_page_for_section(
-        self, doc: DocxDocument, items_count: int
+        self,
+        doc: DocxDocument,
+        items_count: int,
+        section_height: Optional[float] = None,
     ) -> bool:
-        """Check if we should add a page break before a new section."""
+        """
+        Check if we should add a page break before a new section.
+
+        Uses the running page model of the report being generated; outside
+        generate() the document is scanned once to build one.
+
+        Args:
+            items_count: Number of data rows in the section
+            section_height: Heading + table height in points; estimated from
+                single-line rows when omitted
+        """
         if items_count <= 0:
             return False
 
         strictness = self._get_page_break_strictness()
-        current_elements = len(doc.paragraphs) + sum(
-            len(table.rows) for table in doc.tables
-        )
+        pagination = self._pagination or ReportPagination.from_document(doc)
 
         # "Ostra": every next section starts on a new page.
         if strictness == "ostra":
-            return current_elements > 0
+            return pagination.has_content
 
         policy = {
             "lagodna": {"section_margin": 0, "min_start_lines": 3},
@@ -775,29 +1144,36 @@ class ReportGenerator:
         }
         current_policy = policy[strictness]
 
-        # Simple pagination heuristic based on already generated paragraphs and table rows.
-        # It is not exact, but it helps keep each section on one page whenever feasible.
-        lines_per_page = 45
-        lines_used = current_elements % lines_per_page
-        lines_remaining = lines_per_page - lines_used if lines_used else lines_per_page
+        row_height = pagination.body.paragraph_height(1)
+        heading_height = pagination.heading_height("")
+        if section_height is None:
+            # Heading + table header + single-line rows.
+            section_height = heading_height + (items_count + 1) * row_height
 
-        # Full section estimate: heading + table header + all rows + policy margin.
-        section_lines_needed = items_count + 3 + current_policy["section_margin"]
-        if section_lines_needed <= lines_per_page:
-            return lines_remaining < section_lines_needed
+        # Keep the whole section on one page whenever it fits on one page.
+        section_needed = (
+            section_height
+            + current_policy["section_margin"] * pagination.body.line_height
+        )
+        if section_needed <= pagination.page_height:
+            return pagination.remaining < section_needed
 
         # Very large sections cannot fit entirely on one page.
         # In that case, require enough space for heading + table header + first rows.
-        return lines_remaining < current_policy["min_start_lines"]
+        min_start = (
+            heading_height + (current_policy["min_start_lines"] - 1) * row_height
+        )
+        return pagination.remaining < min_start
 
     def _open_file(self, path: Path) -> None:
         try:
+            # Launch the viewer without waiting for it to exit.
             if os.name == "nt":
                 os.startfile(path)
             elif sys.platform == "darwin":
-                subprocess.call(["open", path])
+                subprocess.Popen(["open", path])
             else:
-                subprocess.call(["xdg-open", path])
+                subprocess.Popen(["xdg-open", path])
             logger.debug(f"Successfully opened file: {path}")
         except Exception as e:
             logger.error(f"Error opening file {path}: {str(e)}")
@@ -808,3 +1184,9 @@ class ReportGenerationError(Exception):
     """Exception raised when report generation fails"""
 
     pass
+
+
+class ReportCancelledError(ReportGenerationError):
+    """Exception raised when report generation is cancelled"""
+
+    pass
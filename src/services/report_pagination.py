@@ -0,0 +1,240 @@
+"""
+Incremental page-fill model for .docx reports.
+
+ReportGenerator needs to know how much of the current page is used before it
+starts a new section. Instead of rescanning the document, the generator
+reports every paragraph, heading and table row it adds to a ReportPagination
+instance, which keeps a running height in points. Heights are estimated from
+the document's style metrics (font size, line spacing, paragraph spacing),
+table column widths and word-wrapped cell text.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from docx.document import Document as DocxDocument
+from docx.oxml.shared import qn
+from docx.shared import Length
+
+# Rendered line height relative to font size for the default Calibri face.
+LINE_HEIGHT_FACTOR = 1.22
+# Average glyph advance relative to font size, used for word-wrap estimates.
+AVG_CHAR_WIDTH_FACTOR = 0.5
+# Word's default left/right cell margins (108 twips each).
+CELL_HORIZONTAL_PADDING_PT = 10.8
+
+_TWIPS_PER_PT = 20
+
+
+@dataclass(frozen=True)
+class TextMetrics:
+    """Vertical metrics of one paragraph style, in points."""
+
+    font_size: float = 11.0
+    line_spacing: float = 1.0
+    space_before: float = 0.0
+    space_after: float = 0.0
+
+    @property
+    def line_height(self) -> float:
+        return self.font_size * LINE_HEIGHT_FACTOR * self.line_spacing
+
+    @property
+    def char_width(self) -> float:
+        return self.font_size * AVG_CHAR_WIDTH_FACTOR
+
+    def paragraph_height(self, lines: int = 1) -> float:
+        return self.space_before + max(lines, 1) * self.line_height + self.space_after
+
+    def wrapped_lines(self, text: str, width: float) -> int:
+        """Number of lines `text` takes when wrapped to `width` points."""
+        chars_per_line = max(int(width / self.char_width), 1)
+        lines = 0
+        for line in (text or "").split("\n"):
+            lines += max(math.ceil(len(line.expandtabs(4)) / chars_per_line), 1)
+        return lines
+
+
+def _style_metrics(doc: DocxDocument, style_name: str) -> TextMetrics:
+    """Resolve a paragraph style's metrics, following base styles and docDefaults."""
+    font_size = line_spacing = space_before = space_after = None
+
+    try:
+        style = doc.styles[style_name]
+    except KeyError:
+        style = None
+    while style is not None:
+        paragraph_format = style.paragraph_format
+        if font_size is None and style.font.size is not None:
+            font_size = style.font.size.pt
+        if line_spacing is None and paragraph_format.line_spacing is not None:
+            line_spacing = paragraph_format.line_spacing
+        if space_before is None and paragraph_format.space_before is not None:
+            space_before = paragraph_format.space_before.pt
+        if space_after is None and paragraph_format.space_after is not None:
+            space_after = paragraph_format.space_after.pt
+        style = style.base_style
+
+    defaults = doc.styles.element.find(qn("w:docDefaults"))
+    if defaults is not None:
+        size = defaults.find(f"{qn('w:rPrDefault')}/{qn('w:rPr')}/{qn('w:sz')}")
+        if font_size is None and size is not None:
+            font_size = int(size.get(qn("w:val"))) / 2
+        spacing = defaults.find(f"{qn('w:pPrDefault')}/{qn('w:pPr')}/{qn('w:spacing')}")
+        if spacing is not None:
+            if space_before is None and spacing.get(qn("w:before")):
+                space_before = int(spacing.get(qn("w:before"))) / _TWIPS_PER_PT
+            if space_after is None and spacing.get(qn("w:after")):
+                space_after = int(spacing.get(qn("w:after"))) / _TWIPS_PER_PT
+            if (
+                line_spacing is None
+                and spacing.get(qn("w:line"))
+                and spacing.get(qn("w:lineRule"), "auto") == "auto"
+            ):
+                line_spacing = int(spacing.get(qn("w:line"))) / 240
+
+    font_size = font_size or 11.0
+    if isinstance(line_spacing, Length):
+        # Exact/at-least spacing: express as a multiple of the natural height.
+        line_spacing = line_spacing.pt / (font_size * LINE_HEIGHT_FACTOR)
+
+    return TextMetrics(
+        font_size=font_size,
+        line_spacing=line_spacing or 1.0,
+        space_before=space_before or 0.0,
+        space_after=space_after or 0.0,
+    )
+
+
+class ReportPagination:
+    """
+    Running estimate of page usage for a document being built.
+
+    All sizes are in points. Every ``add_*`` call is O(1) per line/row, so
+    the cost of pagination decisions no longer grows with document size.
+    """
+
+    def __init__(
+        self,
+        page_height: float,
+        text_width: float,
+        body: TextMetrics,
+        headings: Optional[Dict[int, TextMetrics]] = None,
+    ) -> None:
+        self.page_height = page_height
+        self.text_width = text_width
+        self.body = body
+        self.headings = headings or {}
+        self.page_count = 1
+        self.used = 0.0
+
+    @classmethod
+    def for_document(cls, doc: DocxDocument) -> "ReportPagination":
+        """Create an empty model using the page size and styles of `doc`."""
+        section = doc.sections[0]
+        page_height = Length(
+            section.page_height - section.top_margin - section.bottom_margin
+        ).pt
+        text_width = Length(
+            section.page_width - section.left_margin - section.right_margin
+        ).pt
+        headings = {
+            level: _style_metrics(doc, f"Heading {level}") for level in (1, 2, 3)
+        }
+        return cls(page_height, text_width, _style_metrics(doc, "Normal"), headings)
+
+    @classmethod
+    def from_document(cls, doc: DocxDocument) -> "ReportPagination":
+        """
+        Build a model by scanning the existing body of `doc` once.
+
+        Used when pagination is queried outside ReportGenerator.generate().
+        """
+        model = cls.for_document(doc)
+        for block in doc.element.body.iterchildren():
+            if block.tag == qn("w:p"):
+                if block.findall(f".//{qn('w:br')}[@{qn('w:type')}='page']"):
+                    model.add_page_break()
+                    continue
+                style_id = block.style or ""
+                level = (
+                    int(style_id[-1])
+                    if style_id.startswith("Heading") and style_id[-1:].isdigit()
+                    else None
+                )
+                text = "".join(t.text or "" for t in block.iter(qn("w:t")))
+                if level:
+                    model.add_heading(text, level)
+                else:
+                    model.add_paragraph(text)
+            elif block.tag == qn("w:tbl"):
+                widths = model.table_column_widths(
+                    [
+                        int(col.get(qn("w:w"), 0)) / _TWIPS_PER_PT
+                        for col in block.iter(qn("w:gridCol"))
+                    ]
+                )
+                for tr in block.iter(qn("w:tr")):
+                    cells = [
+                        "".join(t.text or "" for t in tc.iter(qn("w:t")))
+                        for tc in tr.iter(qn("w:tc"))
+                    ]
+                    model.add_row_height(model.row_height(cells, widths))
+        return model
+
+    @property
+    def remaining(self) -> float:
+        """Free height left on the current page."""
+        return self.page_height - self.used
+
+    @property
+    def has_content(self) -> bool:
+        return self.page_count > 1 or self.used > 0
+
+    def _place(self, height: float) -> None:
+        """Place an unbreakable block, moving it to a new page if needed."""
+        if self.used and self.used + height > self.page_height:
+            self.page_count += 1
+            self.used = 0.0
+        self.used += height
+        # Blocks taller than a page spill over to following pages.
+        while self.used > self.page_height:
+            self.page_count += 1
+            self.used -= self.page_height
+
+    def heading_height(self, text: str, level: int = 2) -> float:
+        metrics = self.headings.get(level, self.body)
+        return metrics.paragraph_height(metrics.wrapped_lines(text, self.text_width))
+
+    def add_heading(self, text: str, level: int = 2) -> None:
+        self._place(self.heading_height(text, level))
+
+    def add_paragraph(self, text: str = "") -> None:
+        self._place(
+            self.body.paragraph_height(self.body.wrapped_lines(text, self.text_width))
+        )
+
+    def add_page_break(self) -> None:
+        """Start a new page; the break paragraph's remainder takes one line."""
+        self.page_count += 1
+        self.used = self.body.paragraph_height(1)
+
+    def table_column_widths(self, widths: Sequence[float]) -> List[float]:
+        """Usable text width per column (column width minus cell padding)."""
+        return [max(width - CELL_HORIZONTAL_PADDING_PT, 1.0) for width in widths]
+
+    def row_height(self, cells: Sequence[str], widths: Sequence[float]) -> float:
+        """Height of a table row: its tallest wrapped cell."""
+        lines = 1
+        for text, width in zip(cells, widths):
+            lines = max(lines, self.body.wrapped_lines(text, width))
+        return self.body.paragraph_height(lines)
+
+    def rows_height(
+        self, rows: Iterable[Sequence[str]], widths: Sequence[float]
+    ) -> List[float]:
+        return [self.row_height(cells, widths) for cells in rows]
+
+    def add_row_height(self, height: float) -> None:
+        self._place(height)
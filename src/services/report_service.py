@@ -0,0 +1,102 @@
+"""
+Qt-facing service for generating a single report in the background.
+
+The project is copied into a ReportSnapshot on the GUI thread; the worker
+renders the document from that snapshot, so the UI database session is never
+used from another thread.
+"""
+
+import logging
+from typing import Optional
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+from sqlalchemy.orm import Session
+
+from src.db_schema.orm_models import Project
+from src.services.report_generator import (
+    ReportCancelledError,
+    ReportGenerator,
+    ReportSnapshot,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ReportWorker(QRunnable):
+    """Worker rendering a report snapshot in a background thread."""
+
+    def __init__(
+        self, service: "ReportService", snapshot: ReportSnapshot, output_dir: str
+    ):
+        super().__init__()
+        self.service = service
+        self.snapshot = snapshot
+        self.output_dir = output_dir
+        self.cancelled = False
+
+    def is_cancelled(self) -> bool:
+        """Check if report generation was cancelled."""
+        return self.cancelled
+
+    def cancel(self):
+        """Cancel report generation before the next section."""
+        self.cancelled = True
+
+    def run(self):
+        """Render the report without blocking UI."""
+        try:
+            generator = ReportGenerator(
+                program_logo_path=self.service.report_generator.program_logo_path,
+                company_logo_path=self.service.report_generator.company_logo_path,
+            )
+            path = generator.generate_from_snapshot(
+                self.snapshot,
+                output_dir=self.output_dir,
+                auto_open=False,
+                progress_callback=self.service.report_progress.emit,
+                is_cancelled=self.is_cancelled,
+            )
+            self.service.report_finished.emit(path)
+        except ReportCancelledError:
+            self.service.report_cancelled.emit()
+        except Exception as e:
+            logger.exception("Report generation failed: %s", e)
+            self.service.report_failed.emit(e)
+
+
+class ReportService(QObject):
+    """Service for generating project reports off the GUI thread."""
+
+    report_progress = Signal(int, str)  # percent, section title
+    report_finished = Signal(str)  # path to generated .docx
+    report_failed = Signal(Exception)
+    report_cancelled = Signal()
+
+    def __init__(self, db_session: Session, parent=None):
+        super().__init__(parent)
+        self.report_generator = ReportGenerator(db_session=db_session)
+        self.thread_pool = QThreadPool()
+        self.worker: Optional[ReportWorker] = None
+
+        self.report_finished.connect(self._clear_worker)
+        self.report_failed.connect(self._clear_worker)
+        self.report_cancelled.connect(self._clear_worker)
+
+    def is_running(self) -> bool:
+        return self.worker is not None
+
+    def generate(self, project: Project, output_dir: str):
+        """Snapshot project data (on the caller's thread) and render it async."""
+        logger.info("Starting background report for project %s", project.id)
+        snapshot = self.report_generator.create_snapshot(project)
+        self.worker = ReportWorker(self, snapshot, output_dir)
+        self.thread_pool.start(self.worker)
+
+    def cancel(self):
+        """Cancel the running report."""
+        if self.worker:
+            logger.info("Cancelling report generation...")
+            self.worker.cancel()
+
+    def _clear_worker(self, *args):
+        self.worker = None
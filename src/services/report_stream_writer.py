@@ -0,0 +1,135 @@
+"""
+Streaming writer for large .docx reports.
+
+python-docx keeps every table row as an lxml element and `table.add_row()`
+gets slower as tables grow. For large cut lists the report body is instead
+built with python-docx only up to each table's header row; the data rows are
+deferred and written straight into ``word/document.xml`` inside the zip
+package as WordprocessingML fragments when the report is saved.
+"""
+
+import re
+from io import BytesIO
+from typing import Dict, Iterable, List, Sequence, Tuple
+from xml.sax.saxutils import escape
+from zipfile import ZIP_DEFLATED, ZipFile
+
+from docx.document import Document as DocxDocument
+from docx.oxml.shared import qn
+from docx.table import Table
+from lxml import etree
+
+DOCUMENT_PART = "word/document.xml"
+
+_MARKER_PREFIX = "cabplanner-rows-"
+_MARKER_RE = re.compile(r"<!--(" + _MARKER_PREFIX + r"\d+)-->")
+# XML 1.0 forbids most control characters; python-docx would reject them too.
+_INVALID_XML_CHARS_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+_ROWS_PER_CHUNK = 256
+
+
+def _text_runs_xml(text: str) -> str:
+    """Render cell text as runs, mapping tabs/newlines like python-docx does."""
+    text = _INVALID_XML_CHARS_RE.sub("", text or "")
+    pieces: List[str] = []
+    for line_index, line in enumerate(text.replace("\r\n", "\n").split("\n")):
+        if line_index:
+            pieces.append("<w:br/>")
+        for tab_index, chunk in enumerate(line.split("\t")):
+            if tab_index:
+                pieces.append("<w:tab/>")
+            if chunk:
+                pieces.append(f'<w:t xml:space="preserve">{escape(chunk)}</w:t>')
+    if not pieces:
+        pieces.append("<w:t/>")
+    return "<w:r>" + "".join(pieces) + "</w:r>"
+
+
+class StreamingDocxWriter:
+    """Collects deferred table rows and writes them while saving the package."""
+
+    def __init__(self) -> None:
+        self._streams: Dict[
+            str, Tuple[List[Tuple[str, str]], Iterable[Sequence[str]], frozenset]
+        ] = {}
+        self.row_count = 0
+
+    def defer_rows(
+        self,
+        table: Table,
+        rows: Iterable[Sequence[str]],
+        row_count: int,
+        centered_columns: Iterable[int] = (),
+    ) -> None:
+        """
+        Register rows to be emitted after the (header) rows already in `table`.
+
+        Cell widths are copied from the table's first row so streamed rows
+        match what python-docx would have produced with `add_row()`.
+        """
+        marker = f"{_MARKER_PREFIX}{len(self._streams)}"
+        cell_widths = []
+        for tc in table._tbl.tr_lst[0].tc_lst:
+            tc_w = tc.tcPr.tcW if tc.tcPr is not None else None
+            if tc_w is None:
+                cell_widths.append(("auto", "0"))
+            else:
+                cell_widths.append((tc_w.get(qn("w:type")), tc_w.get(qn("w:w"))))
+
+        table._tbl.append(etree.Comment(marker))
+        self._streams[marker] = (cell_widths, rows, frozenset(centered_columns))
+        self.row_count += row_count
+
+    def save(self, doc: DocxDocument, path: str) -> None:
+        """Save `doc`, splicing all deferred rows into the main document part."""
+        skeleton = BytesIO()
+        doc.save(skeleton)
+        skeleton.seek(0)
+
+        with ZipFile(skeleton) as src, ZipFile(path, "w", ZIP_DEFLATED) as dst:
+            for item in src.infolist():
+                data = src.read(item.filename)
+                if item.filename == DOCUMENT_PART:
+                    self._write_document(data.decode("utf-8"), dst)
+                else:
+                    dst.writestr(item, data)
+
+    def _write_document(self, document_xml: str, dst: ZipFile) -> None:
+        with dst.open(DOCUMENT_PART, "w") as out:
+            position = 0
+            for match in _MARKER_RE.finditer(document_xml):
+                out.write(document_xml[position : match.start()].encode("utf-8"))
+                position = match.end()
+                stream = self._streams.get(match.group(1))
+                if stream is not None:
+                    for chunk in self._iter_row_chunks(*stream):
+                        out.write(chunk.encode("utf-8"))
+            out.write(document_xml[position:].encode("utf-8"))
+
+    @staticmethod
+    def _iter_row_chunks(
+        cell_widths: List[Tuple[str, str]],
+        rows: Iterable[Sequence[str]],
+        centered_columns: frozenset,
+    ) -> Iterable[str]:
+        cell_props = [
+            f'<w:tcPr><w:tcW w:type="{width_type}" w:w="{width}"/></w:tcPr>'
+            for width_type, width in cell_widths
+        ]
+        centered = '<w:pPr><w:jc w:val="center"/></w:pPr>'
+
+        buffer: List[str] = []
+        for row in rows:
+            cells = []
+            for index, value in enumerate(row):
+                paragraph_props = centered if index in centered_columns else ""
+                cells.append(
+                    f"<w:tc>{cell_props[index]}<w:p>{paragraph_props}"
+                    f"{_text_runs_xml(str(value))}</w:p></w:tc>"
+                )
+            buffer.append("<w:tr>" + "".join(cells) + "</w:tr>")
+            if len(buffer) >= _ROWS_PER_CHUNK:
+                yield "".join(buffer)
+                buffer.clear()
+        if buffer:
+            yield "".join(buffer)
@@ -0,0 +1,156 @@
+"""
+Prebuilt report templates.
+
+Every report shares the same page setup, header layout with logos and
+footer; only the header's project line differs. A ReportTemplate holds a
+saved .docx package with all of that (including the embedded logo image
+parts) and is opened as a fresh document for each report, so logo files are
+read and header/footer XML is built once per settings revision rather than
+once per report.
+
+Templates are cached by the resolved logo paths and their modification
+times. Changing the logo settings, or replacing a logo file, produces a new
+key and therefore a new template; templates built for replaced logo
+settings are dropped by on_setting_changed(), a SettingsService listener.
+"""
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from io import BytesIO
+from pathlib import Path
+from typing import Optional
+
+from docx import Document
+from docx.document import Document as DocxDocument
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml import OxmlElement
+from docx.oxml.shared import qn
+from docx.section import Section
+from docx.shared import Inches
+
+
+def _mtime(path: Optional[Path]) -> float:
+    try:
+        return os.stat(path).st_mtime if path else 0.0
+    except OSError:
+        return 0.0
+
+
+@dataclass(frozen=True)
+class ReportTemplateKey:
+    """Everything a template depends on."""
+
+    program_logo: Optional[str] = None
+    program_logo_mtime: float = 0.0
+    company_logo: Optional[str] = None
+    company_logo_mtime: float = 0.0
+
+    @classmethod
+    def for_logos(
+        cls, program_logo: Optional[Path], company_logo: Optional[Path]
+    ) -> "ReportTemplateKey":
+        return cls(
+            program_logo=str(program_logo) if program_logo else None,
+            program_logo_mtime=_mtime(program_logo),
+            company_logo=str(company_logo) if company_logo else None,
+            company_logo_mtime=_mtime(company_logo),
+        )
+
+
+class ReportTemplate:
+    """A saved blank report package, cloned into a new document per report."""
+
+    def __init__(self, package: bytes) -> None:
+        self._package = package
+
+    def new_document(self) -> DocxDocument:
+        """Open an independent copy of the template."""
+        return Document(BytesIO(self._package))
+
+    @classmethod
+    def build(cls, key: ReportTemplateKey) -> "ReportTemplate":
+        doc = Document()
+        section = doc.sections[0]
+        section.different_first_page_header_footer = False
+        _add_header_layout(section, key.program_logo, key.company_logo)
+        _add_footer(section)
+
+        package = BytesIO()
+        doc.save(package)
+        return cls(package.getvalue())
+
+
+@lru_cache(maxsize=4)
+def _cached_template(key: ReportTemplateKey) -> ReportTemplate:
+    return ReportTemplate.build(key)
+
+
+def get_report_template(
+    program_logo: Optional[Path], company_logo: Optional[Path]
+) -> ReportTemplate:
+    """Return the cached template for these logos, building it if needed."""
+    return _cached_template(ReportTemplateKey.for_logos(program_logo, company_logo))
+
+
+# Settings that select the logos of a template.
+LOGO_SETTING_KEYS = frozenset({"company_logo_path", "report_program_logo_variant"})
+
+
+def on_setting_changed(key: str, _value) -> None:
+    """SettingsService listener dropping templates of old logo settings."""
+    if key in LOGO_SETTING_KEYS:
+        _cached_template.cache_clear()
+
+
+def _add_header_layout(
+    section: Section, program_logo: Optional[str], company_logo: Optional[str]
+) -> None:
+    """Header table: project info cell (filled per report) and logos."""
+    header = section.header
+    usable_width = section.page_width - section.left_margin - section.right_margin
+    table = header.add_table(1, 2, usable_width)
+    table.autofit = True
+
+    # Left: metadata in single line, filled by ReportGenerator
+    cell_meta = table.rows[0].cells[0]
+    cell_meta.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.LEFT
+
+    # Right: logos (company + Cabplanner)
+    cell_logo = table.rows[0].cells[1]
+    paragraph_logo = cell_logo.paragraphs[0]
+    paragraph_logo.alignment = WD_ALIGN_PARAGRAPH.RIGHT
+
+    if company_logo:
+        run_logo = paragraph_logo.add_run()
+        run_logo.add_picture(company_logo, width=Inches(1))
+
+    if program_logo:
+        # Keep program logo below company logo if both are present.
+        if company_logo:
+            paragraph_logo = cell_logo.add_paragraph()
+            paragraph_logo.alignment = WD_ALIGN_PARAGRAPH.RIGHT
+        run_program_logo = paragraph_logo.add_run()
+        run_program_logo.add_picture(program_logo, width=Inches(0.52))
+
+
+def _add_footer(section: Section) -> None:
+    footer = section.footer
+    usable_width = section.page_width - section.left_margin - section.right_margin
+    table = footer.add_table(1, 2, usable_width)
+    table.autofit = True
+
+    # Branding
+    cell_brand = table.rows[0].cells[0]
+    p_brand = cell_brand.paragraphs[0]
+    p_brand.alignment = WD_ALIGN_PARAGRAPH.LEFT
+    run = p_brand.add_run("Wygenerowano przez Cabplanner")
+    run.italic = True
+
+    # Page number
+    cell_page = table.rows[0].cells[1]
+    p_page = cell_page.paragraphs[0]
+    p_page.alignment = WD_ALIGN_PARAGRAPH.RIGHT
+    fld = OxmlElement("w:fldSimple")
+    fld.set(qn("w:instr"), "PAGE")
+    p_page._p.append(fld)
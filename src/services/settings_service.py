@@ -1,13 +1,58 @@
 """
 Settings service for Cabplanner application.
 Manages application settings and preferences.
+
+All settings of a database are loaded once into a typed in-memory snapshot
+shared by every SettingsService on that database; reads are served from it,
+writes go to the database first and then update the snapshot. Consumers
+that depend on a setting subscribe() to changes instead of re-reading it.
 """
 
+import inspect
+import logging
+import weakref
+from typing import Any, Callable, Dict, List, Optional
+from weakref import WeakKeyDictionary
+
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from src.db_schema.orm_models import Setting
 
+logger = logging.getLogger(__name__)
+
+SettingListener = Callable[[str, Any], None]
+
+
+def _parse_value(value: str, value_type: str):
+    if value_type == "bool":
+        return value.lower() == "true"
+    elif value_type == "int":
+        return int(value)
+    elif value_type == "float":
+        return float(value)
+    else:
+        return value
+
+
+class _SettingsCache:
+    """Typed values of one database plus the listeners of their changes."""
+
+    def __init__(self):
+        # key -> parsed value, or the ValueError raised parsing it
+        self.values: Optional[Dict[str, Any]] = None
+        self.listeners: List[Callable[[], Optional[SettingListener]]] = []
+
+    def set(self, key: str, value: str, value_type: str) -> None:
+        try:
+            self.values[key] = _parse_value(value, value_type)
+        except ValueError as exc:
+            self.values[key] = exc
+
+
+# Shared by all SettingsService instances working on the same database.
+_caches: "WeakKeyDictionary[object, _SettingsCache]" = WeakKeyDictionary()
+
 
 class SettingsService:
     """Service for managing application settings."""
@@ -21,6 +66,70 @@ class SettingsService:
         """
         self.db = db_session
 
+    def _cache(self) -> _SettingsCache:
+        bind = self.db.get_bind()
+        cache = _caches.get(bind)
+        if cache is None:
+            cache = _caches[bind] = _SettingsCache()
+        if cache.values is None:
+            rows = self.db.execute(
+                select(Setting.key, Setting.value, Setting.value_type)
+            ).all()
+            cache.values = {}
+            for key, value, value_type in rows:
+                cache.set(key, value, value_type)
+        return cache
+
+    def reload(self) -> None:
+        """Drop the snapshot; the next read loads all settings again."""
+        cache = _caches.get(self.db.get_bind())
+        if cache is not None:
+            cache.values = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Typed copy of all valid settings."""
+        return {
+            key: value
+            for key, value in self._cache().values.items()
+            if not isinstance(value, ValueError)
+        }
+
+    def subscribe(self, listener: SettingListener) -> None:
+        """
+        Call listener(key, value) after a setting changes (value is None
+        for a deleted setting). Bound methods are held weakly, so a
+        subscribed object can still be garbage collected. Subscribing an
+        already subscribed listener does nothing.
+        """
+        cache = self._cache()
+        if any(ref() == listener for ref in cache.listeners):
+            return
+        if inspect.ismethod(listener):
+            ref = weakref.WeakMethod(listener)
+        else:
+
+            def ref():
+                return listener
+
+        cache.listeners.append(ref)
+
+    def unsubscribe(self, listener: SettingListener) -> None:
+        cache = self._cache()
+        cache.listeners = [ref for ref in cache.listeners if ref() != listener]
+
+    def _notify(self, cache: _SettingsCache, key: str, value) -> None:
+        alive = []
+        for ref in cache.listeners:
+            listener = ref()
+            if listener is None:
+                continue
+            alive.append(ref)
+            try:
+                listener(key, value)
+            except Exception as exc:
+                logger.warning("Setting listener failed for %s: %s", key, exc)
+        cache.listeners = alive
+
     def get_setting(self, key: str) -> Setting:
         """
         Get a setting by key.
@@ -45,19 +154,14 @@ class SettingsService:
         Returns:
             The setting value or default
         """
-        setting = self.get_setting(key)
-        if not setting:
+        values = self._cache().values
+        if key not in values:
             return default
 
-        # Handle different value types
-        if setting.value_type == "bool":
-            return setting.value.lower() == "true"
-        elif setting.value_type == "int":
-            return int(setting.value)
-        elif setting.value_type == "float":
-            return float(setting.value)
-        else:
-            return setting.value
+        value = values[key]
+        if isinstance(value, ValueError):
+            raise ValueError(str(value))
+        return value
 
     def set_setting(self, key: str, value, value_type: str = None):
         """
@@ -85,6 +189,9 @@ class SettingsService:
             else:
                 value_type = "str"
 
+        # Load the snapshot before writing so the change can be detected
+        cache = self._cache()
+
         # Try to get existing setting
         setting = self.get_setting(key)
 
@@ -99,6 +206,12 @@ class SettingsService:
 
         self.db.commit()
         self.db.refresh(setting)
+
+        previous = cache.values.get(key)
+        cache.set(key, setting.value, setting.value_type)
+        current = cache.values[key]
+        if type(previous) is not type(current) or previous != current:
+            self._notify(cache, key, current)
         return setting
 
     def delete_setting(self, key: str) -> bool:
@@ -111,10 +224,13 @@ class SettingsService:
         Returns:
             bool: True if deleted, False if not found
         """
+        cache = self._cache()
         setting = self.get_setting(key)
         if setting:
             self.db.delete(setting)
             self.db.commit()
+            cache.values.pop(key, None)
+            self._notify(cache, key, None)
             return True
         return False
 
@@ -111,3 +111,85 @@ def test_catalog_window_search_enter_applies_immediately(qapp):
     window.close()
     window.deleteLater()
     qapp.processEvents()
+
+
+def test_add_footer_color_completer_suggests_fuzzy_matches(qapp):
+    from src.gui.cabinet_catalog.add_footer import AddFooter
+    from src.gui.widgets.color_completer import ColorCompleter
+
+    footer = AddFooter()
+    footer.set_enabled(True)
+    footer.show()
+    qapp.processEvents()
+
+    combo = footer.body_color_combo
+    completer = combo.completer()
+    assert isinstance(completer, ColorCompleter)
+
+    combo.lineEdit().clear()
+    QTest.keyClicks(combo.lineEdit(), "czrny")
+    qapp.processEvents()
+
+    assert completer.matches()[0] == "Czarny"
+
+    footer.close()
+    footer.deleteLater()
+    qapp.processEvents()
+
+
+class _RecordingController:
+    def __init__(self):
+        self.batches = []
+
+    def add_catalog_cabinets(self, specs):
+        self.batches.append(list(specs))
+        return []
+
+
+def test_catalog_window_adds_selected_types_in_one_batch(qapp, monkeypatch):
+    from types import SimpleNamespace
+
+    # GIVEN a catalog with two types, opened in add mode from a project
+    service = _FakeCatalogService()
+    second = CatalogCabinetType(
+        id=2,
+        name="G60",
+        sku="LOFT-002",
+        width_mm=600,
+        height_mm=720,
+        depth_mm=320,
+        preview_path=None,
+        kitchen_type="LOFT",
+        description="Test item",
+    )
+    monkeypatch.setattr(
+        service,
+        "list_types",
+        lambda query="", filters=None: _FakeCatalogService.list_types(
+            service, query, filters
+        )
+        + [second],
+    )
+    controller = _RecordingController()
+    window = CatalogWindow(
+        catalog_service=service,
+        project_service=controller,
+        initial_mode="add",
+        target_project=SimpleNamespace(id=7),
+    )
+    window.show()
+    qapp.processEvents()
+
+    # WHEN both rows are selected and added with quantity 3
+    window.browser_widget.table_view.selectAll()
+    window.add_footer.qty_spinbox.setValue(3)
+    window._on_add_clicked()
+
+    # THEN one batch with a spec per selected type reaches the controller
+    assert len(controller.batches) == 1
+    specs = controller.batches[0]
+    assert sorted(spec.type_id for spec in specs) == [1, 2]
+    assert all(spec.quantity == 3 for spec in specs)
+
+    window.deleteLater()
+    qapp.processEvents()
@@ -27,7 +27,8 @@ class TestProjectCabinetDuplication:
     def mock_session(self):
         """Create a mock database session."""
         session = Mock()
-        session.add = Mock()
+        # Stands in for the flush assigning the new cabinet's primary key
+        session.add = Mock(side_effect=lambda obj: setattr(obj, "id", 200))
         session.flush = Mock()
         session.commit = Mock()
         session.refresh = Mock()
@@ -35,6 +36,17 @@ class TestProjectCabinetDuplication:
         session.scalar = Mock(return_value=5)  # Next sequence number = 6
         return session
 
+    @staticmethod
+    def _inserted_rows(mock_session, model):
+        """Rows passed to bulk INSERT statements targeting model's table."""
+        rows = []
+        for call in mock_session.execute.call_args_list:
+            stmt, *params = call.args
+            table = getattr(stmt, "table", None)
+            if table is not None and table.name == model.__tablename__ and params:
+                rows.extend(params[0])
+        return rows
+
     @pytest.fixture
     def source_cabinet(self):
         """Create a source cabinet with parts and accessories."""
@@ -116,6 +128,7 @@ class TestProjectCabinetDuplication:
 
         def capture_add(obj):
             added_objects.append(obj)
+            obj.id = 200
 
         mock_session.add.side_effect = capture_add
 
@@ -132,22 +145,15 @@ class TestProjectCabinetDuplication:
 
         mock_session.get.return_value = source_cabinet
 
-        added_objects = []
-
-        def capture_add(obj):
-            added_objects.append(obj)
-
-        mock_session.add.side_effect = capture_add
-
         service = ProjectService(mock_session)
         service.duplicate_cabinet(1)
 
-        # Find parts in added objects
-        parts = [obj for obj in added_objects if isinstance(obj, ProjectCabinetPart)]
+        # Parts are written with one bulk insert
+        parts = self._inserted_rows(mock_session, ProjectCabinetPart)
         assert len(parts) == 2
 
         # Check part names
-        part_names = {p.part_name for p in parts}
+        part_names = {p["part_name"] for p in parts}
         assert "Bok lewy" in part_names
         assert "Bok prawy" in part_names
 
@@ -159,25 +165,14 @@ class TestProjectCabinetDuplication:
 
         mock_session.get.return_value = source_cabinet
 
-        added_objects = []
-
-        def capture_add(obj):
-            added_objects.append(obj)
-
-        mock_session.add.side_effect = capture_add
-
         service = ProjectService(mock_session)
         service.duplicate_cabinet(1)
 
-        # Find accessories in added objects
-        accessories = [
-            obj
-            for obj in added_objects
-            if isinstance(obj, ProjectCabinetAccessorySnapshot)
-        ]
+        # Accessories are written with one bulk insert
+        accessories = self._inserted_rows(mock_session, ProjectCabinetAccessorySnapshot)
         assert len(accessories) == 1
-        assert accessories[0].name == "Zawias"
-        assert accessories[0].count == 4
+        assert accessories[0]["name"] == "Zawias"
+        assert accessories[0]["count"] == 4
 
     def test_duplicate_nonexistent_cabinet_returns_none(self, mock_session):
         """Test that duplicating non-existent cabinet returns None."""
@@ -0,0 +1,46 @@
+from src.domain.color_index import ColorIndex, fold_color_key, normalize_color_key
+
+
+def test_keys_collapse_whitespace_case_and_diacritics():
+    assert normalize_color_key("  Dąb   SONOMA ") == "dąb sonoma"
+    assert fold_color_key("  Dąb   SONOMA ") == "dab sonoma"
+    assert fold_color_key("Biały Połysk") == "bialy polysk"
+
+
+def test_lookup_prefers_runtime_and_exact_matches():
+    index = ColorIndex({"Dąb": "#C2B280", "Dab": "#111111", "Szary": "#808080"})
+    index.set_runtime({"Szary": "#777777"})
+
+    # exact static name wins over folded matches
+    assert index.lookup("Dab") == "#111111"
+    # runtime wins over static at the same level
+    assert index.lookup("szary") == "#777777"
+    assert index.lookup_static("szary") == "#808080"
+    # diacritic-insensitive fallback
+    assert index.lookup(" DĄB ") == "#C2B280"
+    assert index.lookup("Nieznany") is None
+
+
+def test_exact_static_lookup_skips_folded_matches_and_aliases():
+    index = ColorIndex({"Dąb": "#C2B280", "Dab": "#C2B280", "Szary": "#808080"})
+
+    assert index.lookup_static_exact(" SZARY ") == "#808080"
+    assert index.lookup_static_exact("dąb") == "#C2B280"
+    # unaccented alias of "Dąb" and a folded-only match
+    assert index.lookup_static_exact("Dab") is None
+    assert index.lookup_static_exact("Szäry") is None
+
+
+def test_add_runtime_updates_without_rebuild():
+    index = ColorIndex()
+    index.set_runtime({"Dąb Lancelot": "#AA8855"})
+
+    index.add_runtime("Egger H1145 ST10", "#C8A77A")
+    index.add_runtime("Dąb Lancelot", "#996633")
+
+    assert index.lookup("egger  h1145 st10") == "#C8A77A"
+    assert index.lookup("dab lancelot") == "#996633"
+    assert index.runtime_colors() == {
+        "Dąb Lancelot": "#996633",
+        "Egger H1145 ST10": "#C8A77A",
+    }
@@ -0,0 +1,58 @@
+import random
+import time
+
+import pytest
+
+from src.domain.color_lab import ColorLabIndex, delta_e, hex_to_lab
+from src.services.color_dictionary_snapshot import SYSTEM_COLOR_SNAPSHOT
+
+
+def test_hex_to_lab_matches_reference_values():
+    assert hex_to_lab("#FFFFFF") == pytest.approx((100.0, 0.0, 0.0), abs=0.01)
+    assert hex_to_lab("#000") == pytest.approx((0.0, 0.0, 0.0), abs=0.01)
+    assert hex_to_lab("#FF0000") == pytest.approx((53.24, 80.09, 67.20), abs=0.05)
+    with pytest.raises(ValueError):
+        hex_to_lab("#12")
+
+
+def test_nearest_matches_brute_force():
+    # GIVEN
+    rng = random.Random(7)
+    colors = {f"Kolor {i}": f"#{rng.randrange(0x1000000):06X}" for i in range(300)}
+    index = ColorLabIndex(colors)
+
+    for _ in range(50):
+        query = f"#{rng.randrange(0x1000000):06X}"
+
+        # WHEN
+        found = index.nearest(query, k=5)
+
+        # THEN
+        expected = sorted(
+            delta_e(hex_to_lab(query), hex_to_lab(hex_code))
+            for hex_code in colors.values()
+        )[:5]
+        assert [match.delta_e for match in found] == pytest.approx(expected)
+
+
+def test_added_colors_are_found_after_rebuild():
+    index = ColorLabIndex({"Biały": "#FFFFFF", "Czarny": "#000000"})
+
+    index.add("Grafit", "#3A3A3A")
+
+    nearest = index.nearest("#383838", k=2)
+    assert [match.name for match in nearest] == ["Grafit", "Czarny"]
+    assert nearest[0].delta_e < 1.0
+
+
+def test_nearest_query_is_fast_enough_for_live_picking():
+    index = ColorLabIndex(dict(SYSTEM_COLOR_SNAPSHOT))
+    index.nearest("#FFFFFF")
+    queries = [f"#{value:06X}" for value in range(0, 0x1000000, 0x1000000 // 500)]
+
+    start = time.perf_counter()
+    for query in queries:
+        index.nearest(query, k=5)
+    per_query = (time.perf_counter() - start) / len(queries)
+
+    assert per_query < 0.001
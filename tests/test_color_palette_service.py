@@ -1,4 +1,5 @@
 import pytest
+from sqlalchemy import event
 
 from src.db_schema.orm_models import CabinetColor
 from src.services.color_palette_service import ColorPaletteService
@@ -61,11 +62,138 @@ def test_resolve_hex_for_system_user_and_direct_hex(session):
     assert service.resolve_hex("kolor klienta") == "#12AB9F"
 
 
-def test_list_searchable_names_includes_added_user_color(session):
+def test_added_user_color_is_visible_to_gui_lookup_without_resync(session):
+    from src.gui.constants.colors import get_color_hex
+
+    service = ColorPaletteService(session)
+    service.ensure_seeded()
+
+    service.add_user_color("Łososiowy klienta", "#fa8072")
+
+    assert get_color_hex("lososiowy KLIENTA") == "#FA8072"
+    assert service.resolve_hex("Lososiowy klienta") == "#FA8072"
+
+
+def test_flush_usage_writes_queued_events_in_one_batch(session):
+    service = ColorPaletteService(session)
+    service.ensure_seeded()
+    # "Dąb" exists only in the static GUI map, not in the system dictionary
+    assert session.query(CabinetColor).filter_by(normalized_name="dąb").count() == 0
+
+    for _ in range(3):
+        service.record_usage("Czarny", "Biały")
+    service.record_usage("Dąb")
+    assert len(service.usage_queue()) == 3
+
+    statements = []
+
+    def _on_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.split()[0])
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", _on_execute)
+    try:
+        written = service.flush_usage()
+    finally:
+        event.remove(engine, "before_cursor_execute", _on_execute)
+
+    assert written == 3
+    assert statements.count("UPDATE") == 1
+    assert len(service.usage_queue()) == 0
+    counts = dict(
+        session.query(CabinetColor.normalized_name, CabinetColor.usage_count)
+        .filter(CabinetColor.normalized_name.in_(["czarny", "biały", "dąb"]))
+        .all()
+    )
+    assert counts == {"czarny": 3, "biały": 3, "dąb": 1}
+
+
+def test_unaccented_spellings_do_not_create_palette_rows(session):
+    # GIVEN a seeded palette
+    service = ColorPaletteService(session)
+    service.ensure_seeded()
+    before = session.query(CabinetColor).count()
+
+    # WHEN colors are used under unaccented spellings of static names
+    assert service.mark_used("Dab") is None
+    assert service.mark_used("Dab Sonoma") is None
+    service.record_usage("Dab")
+    assert service.flush_usage() == 0
+
+    # THEN no diacritic-less duplicates are stored, lookups still resolve
+    assert session.query(CabinetColor).count() == before
+    assert service.resolve_hex("Dab Sonoma") == "#D2B48C"
+
+
+def test_flush_usage_leaves_other_pending_changes_alone(session):
+    # GIVEN queued usage and an unrelated, uncommitted change in the session
+    service = ColorPaletteService(session)
+    service.ensure_seeded()
+    service.record_usage("Czarny")
+    draft = CabinetColor(
+        name="Szkic klienta",
+        normalized_name="szkic klienta",
+        hex_code="#123456",
+        source="user",
+        usage_count=0,
+        is_active=True,
+    )
+    session.add(draft)
+
+    # WHEN the periodic flush runs
+    written = service.flush_usage()
+
+    # THEN neither the draft nor the usage is committed; usage stays queued
+    assert written == 0
+    assert draft in session.new
+    assert len(service.usage_queue()) == 1
+    session.rollback()
+    assert (
+        session.query(CabinetColor).filter_by(normalized_name="szkic klienta").count()
+        == 0
+    )
+
+    # WHEN the session is clean again
+    written = service.flush_usage()
+
+    # THEN the queued usage is written
+    assert written == 1
+    czarny = session.query(CabinetColor).filter_by(normalized_name="czarny").one()
+    assert czarny.usage_count == 1
+
+
+def test_search_colors_is_fuzzy_and_follows_new_colors_and_usage(session):
+    # GIVEN
+    service = ColorPaletteService(session)
+    service.ensure_seeded()
+    assert service.search_colors("klienta") == []
+
+    # WHEN
+    service.add_user_color("Kolor Klienta Łódź", "#12ab9f")
+    service.add_user_color("Kolor Klienta Kraków", "#12ab9e")
+    service.record_usage("Kolor Klienta Kraków")
+    service.flush_usage()
+
+    # THEN
+    assert service.search_colors("kolor klenta lodz", limit=1) == ["Kolor Klienta Łódź"]
+    assert service.search_colors("kolor klienta", limit=2) == [
+        "Kolor Klienta Kraków",
+        "Kolor Klienta Łódź",
+    ]
+
+
+def test_nearest_colors_includes_new_user_colors(session):
+    # GIVEN
     service = ColorPaletteService(session)
     service.ensure_seeded()
-    service.add_user_color("Kolor runtime", "#13579B")
+    assert service.nearest_colors("#fff", limit=1)[0].hex_code == "#FFFFFF"
 
-    names = service.list_searchable_names()
+    # WHEN
+    service.add_user_color("Dąb klienta", "#A77B4F")
 
-    assert any(name.casefold() == "kolor runtime" for name in names)
+    # THEN
+    nearest = service.nearest_colors("#a67c50", limit=2)
+    assert nearest[0].name == "Dąb klienta"
+    assert nearest[0].delta_e < nearest[1].delta_e
+    with pytest.raises(ValueError):
+        service.nearest_colors("brązowy")
@@ -0,0 +1,55 @@
+import time
+from datetime import datetime, timedelta
+
+from src.domain.color_search import ColorSearchIndex, color_trigrams
+from src.services.color_dictionary_snapshot import SYSTEM_COLOR_SNAPSHOT
+
+
+def test_trigrams_are_folded_and_padded_per_word():
+    assert color_trigrams("Dąb SONOMA") == color_trigrams("dab  sonoma")
+    assert "  d" in color_trigrams("Dąb")
+    assert "ab " in color_trigrams("Dąb")
+
+
+def test_search_tolerates_typos_and_ranks_by_usage():
+    # GIVEN
+    index = ColorSearchIndex()
+    for name in ("Dąb Sonoma", "Dąb Lancelot", "Biały", "Szary Grafit"):
+        index.add(name)
+    now = datetime(2026, 1, 1)
+    index.record_usage("Dąb Lancelot", count=3, when=now)
+
+    # WHEN / THEN
+    assert index.search("dab sonma", limit=1) == ["Dąb Sonoma"]
+    assert index.search("grafit") == ["Szary Grafit"]
+    assert index.search("dab")[:2] == ["Dąb Lancelot", "Dąb Sonoma"]
+    assert index.search("xyz") == []
+    assert index.search("") == []
+
+    index.record_usage("Dąb Sonoma", count=3, when=now + timedelta(days=1))
+    assert index.search("dab")[:2] == ["Dąb Sonoma", "Dąb Lancelot"]
+
+
+def test_index_updates_incrementally():
+    index = ColorSearchIndex()
+    index.add("Biały")
+
+    index.add("Kolor klienta")
+    assert index.search("klienta") == ["Kolor klienta"]
+
+    index.remove("Kolor klienta")
+    assert index.search("klienta") == []
+    assert len(index) == 1
+
+
+def test_top_k_query_is_sub_millisecond():
+    index = ColorSearchIndex()
+    index.add_many(name for name, _ in SYSTEM_COLOR_SNAPSHOT)
+    queries = ["dab", "bialy polysk", "szry", "antracyt", "orzech"] * 200
+
+    start = time.perf_counter()
+    for query in queries:
+        index.search(query, limit=10)
+    per_query = (time.perf_counter() - start) / len(queries)
+
+    assert per_query < 0.001
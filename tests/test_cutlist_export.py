@@ -0,0 +1,126 @@
+import csv
+
+import pytest
+
+from src.services.cutlist_export import (
+    CUTLIST_COLUMNS,
+    CutListExporter,
+    CutListExportError,
+    read_columnar,
+)
+
+
+def _add_cabinet(project_service, project_id, sequence, quantity):
+    return project_service.add_custom_cabinet(
+        project_id,
+        sequence_number=sequence,
+        body_color="Biały",
+        front_color="Dąb",
+        handle_type="Gola",
+        quantity=quantity,
+        custom_parts=[
+            {
+                "part_name": "bok",
+                "width_mm": 560,
+                "height_mm": 720,
+                "pieces": 2,
+                "material": "PLYTA 18",
+                "wrapping": "DDKK",
+            },
+            {"part_name": "front drzwi", "width_mm": 596, "height_mm": 716},
+            {
+                "part_name": "plecy",
+                "width_mm": 590,
+                "height_mm": 710,
+                "material": "HDF",
+            },
+        ],
+        custom_accessories=[{"name": "Zawias", "count": 2}],
+    )
+
+
+@pytest.fixture
+def two_projects(project_service):
+    first = project_service.create_project(
+        name="Cut A", kitchen_type="LOFT", order_number="CUT-A"
+    )
+    second = project_service.create_project(
+        name="Cut B", kitchen_type="LOFT", order_number="CUT-B"
+    )
+    _add_cabinet(project_service, first.id, 1, quantity=1)
+    _add_cabinet(project_service, second.id, 1, quantity=2)
+    _add_cabinet(project_service, second.id, 2, quantity=1)
+    return [first.id, second.id]
+
+
+def test_csv_export_writes_typed_rows_for_all_projects(
+    tmp_path, project_service, two_projects
+):
+    """
+    Given: two projects with custom cabinets
+    When: exporting their cut list to CSV
+    Then: every part row is written with multiplied quantities, no accessories
+    """
+    path = tmp_path / "cut.csv"
+
+    count = CutListExporter(project_service).export_csv(two_projects, path)
+
+    with open(path, newline="", encoding="utf-8") as fh:
+        rows = list(csv.reader(fh, delimiter=";"))
+    assert rows[0] == [name for name, _type in CUTLIST_COLUMNS]
+    assert count == len(rows) - 1 == 9
+    assert ["CUT-B", "1", "bok", "PLYTA 18", "Biały", "560", "720", "4", "DDKK"] in rows
+    assert ["CUT-A", "1", "plecy", "HDF", "", "590", "710", "1", ""] in rows
+    assert not any(row[2] == "Zawias" for row in rows)
+
+
+def test_columnar_export_round_trips_across_row_groups(
+    tmp_path, project_service, two_projects
+):
+    """
+    Given: a cut list larger than one row group
+    When: exporting to the columnar format and reading it back
+    Then: the rows match the exporter's rows in order
+    """
+    exporter = CutListExporter(project_service)
+    path = tmp_path / "cut.cpcl"
+
+    count = exporter.export_columnar(two_projects, path, row_group_size=4)
+
+    groups = list(read_columnar(path))
+    assert [len(group["part"]) for group in groups] == [4, 4, 1]
+    names = [name for name, _type in CUTLIST_COLUMNS]
+    read_rows = [
+        tuple(group[name][i] for name in names)
+        for group in groups
+        for i in range(len(group["part"]))
+    ]
+    assert count == 9
+    assert read_rows == list(exporter.iter_rows(two_projects))
+
+
+def test_export_unknown_project_raises(tmp_path, project_service):
+    """
+    Given: a project ID that does not exist
+    When: exporting
+    Then: CutListExportError is raised
+    """
+    with pytest.raises(CutListExportError):
+        CutListExporter(project_service).export_csv([999], tmp_path / "x.csv")
+
+
+def test_export_leaves_aggregation_cache_untouched(
+    tmp_path, project_service, two_projects
+):
+    """
+    Given: an empty aggregation cache
+    When: exporting the cut list of several projects
+    Then: no cabinet aggregation is cached by the export
+    """
+    project_service.invalidate_aggregation_cache()
+    exporter = CutListExporter(project_service)
+
+    exporter.export_csv(two_projects, tmp_path / "cut.csv")
+    exporter.export_columnar(two_projects, tmp_path / "cut.cpcl")
+
+    assert len(project_service._aggregation_cache()) == 0
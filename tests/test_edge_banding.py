@@ -0,0 +1,109 @@
+import time
+
+import pytest
+
+from src.services.edge_banding import (
+    EDGE_LONG,
+    EDGE_SHORT,
+    calculate_edge_banding,
+    decode_wrapping,
+)
+
+
+@pytest.mark.parametrize(
+    "code, expected",
+    [
+        ("D", (1, 0)),
+        ("DKK", (1, 2)),
+        ("DDKK", (2, 2)),
+        ("kk", (0, 2)),
+        ("D-D K", (2, 1)),
+        ("DDDKKK", (2, 2)),
+        ("", (0, 0)),
+        (None, (0, 0)),
+    ],
+)
+def test_decode_wrapping(code, expected):
+    assert decode_wrapping(code) == expected
+
+
+def test_lengths_use_long_and_short_side_and_quantity():
+    """
+    Given: parts with different codes, orientations and quantities
+    When: calculating edge banding
+    Then: D edges use the longer side, K edges the shorter one, summed per color
+    """
+    rows = [
+        ("Biały", 560, 720, 2, "DKK"),  # 2 x (720 + 2 * 560)
+        ("Biały", 600, 18, 1, "D"),  # 600
+        ("Dąb", 716, 596, 3, "DDKK"),  # 3 x (2 * 716 + 2 * 596)
+        ("Dąb", 590, 710, 1, ""),  # not banded
+    ]
+
+    totals = {total.color: total for total in calculate_edge_banding(rows)}
+
+    assert list(totals) == ["Biały", "Dąb"]
+    white = totals["Biały"]
+    assert (white.long_mm, white.short_mm) == (2 * 720 + 600, 2 * 2 * 560)
+    assert (white.long_edges, white.short_edges) == (3, 4)
+    oak = totals["Dąb"]
+    assert oak.length_mm(EDGE_LONG) == 3 * 2 * 716
+    assert oak.length_mm(EDGE_SHORT) == 3 * 2 * 596
+    assert oak.meters() == pytest.approx((3 * 2 * 716 + 3 * 2 * 596) / 1000)
+
+
+def test_project_edge_banding_includes_cabinet_quantity(project_service):
+    """
+    Given: a cabinet with quantity 3 and banded parts
+    When: computing edge banding through ProjectService
+    Then: lengths include pieces and cabinet quantity
+    """
+    project = project_service.create_project(
+        name="Okleina", kitchen_type="LOFT", order_number="EDGE-1"
+    )
+    project_service.add_custom_cabinet(
+        project.id,
+        sequence_number=1,
+        body_color="Biały",
+        front_color="Dąb",
+        handle_type="Gola",
+        quantity=3,
+        custom_parts=[
+            {
+                "part_name": "bok",
+                "width_mm": 560,
+                "height_mm": 720,
+                "pieces": 2,
+                "wrapping": "DKK",
+            },
+            {
+                "part_name": "front",
+                "width_mm": 596,
+                "height_mm": 716,
+                "wrapping": "DDKK",
+            },
+        ],
+    )
+
+    totals = {
+        total.color: total
+        for total in project_service.get_project_edge_banding(project.id)
+    }
+
+    assert totals["Biały"].long_mm == 3 * 2 * 720
+    assert totals["Biały"].short_mm == 3 * 2 * 2 * 560
+    assert totals["Dąb"].total_mm == 3 * (2 * 716 + 2 * 596)
+
+
+def test_thousands_of_parts_are_fast():
+    rows = [
+        (f"Kolor {i % 12}", 300 + i % 500, 200 + i % 700, 1 + i % 3, "DDKK")
+        for i in range(20000)
+    ]
+
+    start = time.perf_counter()
+    totals = calculate_edge_banding(rows)
+    elapsed = time.perf_counter() - start
+
+    assert len(totals) == 12
+    assert elapsed < 0.5
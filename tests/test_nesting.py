@@ -0,0 +1,137 @@
+import random
+
+from src.services.nesting import (
+    GRAIN_ALONG_HEIGHT,
+    GRAIN_ALONG_WIDTH,
+    GRAIN_FREE,
+    MODE_DEEP,
+    NestingEngine,
+    NestingPart,
+    detect_grain,
+)
+
+
+def _assert_valid_layout(result, kerf):
+    for sheet in result.sheets:
+        placed = sheet.placements
+        for a in placed:
+            assert a.x >= 0 and a.y >= 0
+            assert a.x + a.width <= sheet.width
+            assert a.y + a.height <= sheet.height
+            for b in placed:
+                if a is b:
+                    continue
+                assert (
+                    a.x + a.width + kerf <= b.x
+                    or b.x + b.width + kerf <= a.x
+                    or a.y + a.height + kerf <= b.y
+                    or b.y + b.height + kerf <= a.y
+                ), (a, b)
+
+
+def test_detect_grain_from_part_name():
+    assert detect_grain("Bok lewy (słoje pionowo)") == GRAIN_ALONG_HEIGHT
+    assert detect_grain("Wieniec sloje poziomo") == GRAIN_ALONG_WIDTH
+    assert detect_grain("Półka") == GRAIN_FREE
+
+
+def test_exact_fit_uses_one_sheet():
+    """
+    Given: four quarter-sheet parts and no kerf or trim
+    When: nesting in deep mode
+    Then: they fill exactly one sheet
+    """
+    engine = NestingEngine(kerf=0, trim=0)
+
+    result = engine.nest(
+        [NestingPart("ćwiartka", 1400, 1035, quantity=4)],
+        mode=MODE_DEEP,
+        time_budget=1.0,
+    )
+
+    assert result.sheet_count == 1
+    assert result.utilization == 1.0
+    _assert_valid_layout(result, kerf=0)
+
+
+def test_grain_direction_controls_rotation():
+    """
+    Given: tall parts with and without a grain note
+    When: nesting
+    Then: "słoje poziomo" parts are never rotated, "pionowo" parts always are
+    """
+    engine = NestingEngine()
+    parts = [
+        NestingPart("bok słoje poziomo", 600, 1500, 2, GRAIN_ALONG_WIDTH),
+        NestingPart("bok słoje pionowo", 600, 1500, 2, GRAIN_ALONG_HEIGHT),
+    ]
+
+    result = engine.nest(parts)
+
+    placements = [p for sheet in result.sheets for p in sheet.placements]
+    for placement in placements:
+        if "poziomo" in placement.name:
+            assert not placement.rotated
+            assert (placement.width, placement.height) == (600, 1500)
+        else:
+            assert placement.rotated
+            assert (placement.width, placement.height) == (1500, 600)
+    _assert_valid_layout(result, kerf=engine.kerf)
+
+
+def test_oversized_parts_are_reported_not_placed():
+    """
+    Given: a part that only fits the sheet rotated, but its grain forbids it
+    When: nesting
+    Then: it is reported as oversized
+    """
+    engine = NestingEngine()
+    part = NestingPart("blat słoje pionowo", 2500, 600, 1, GRAIN_ALONG_HEIGHT)
+
+    result = engine.nest([part])
+
+    assert result.sheet_count == 0
+    assert result.oversized == [part]
+
+
+def test_deep_mode_is_never_worse_than_fast():
+    """
+    Given: a random mix of kitchen parts
+    When: nesting in fast and deep mode
+    Then: deep mode uses at most as many sheets and places every piece
+    """
+    rng = random.Random(7)
+    parts = [
+        NestingPart(f"p{i}", rng.randint(150, 1200), rng.randint(100, 800), 2)
+        for i in range(60)
+    ]
+    engine = NestingEngine()
+
+    fast = engine.nest(parts)
+    deep = engine.nest(parts, mode=MODE_DEEP, time_budget=0.3)
+
+    assert deep.sheet_count <= fast.sheet_count
+    assert deep.piece_count == fast.piece_count == 120
+    _assert_valid_layout(deep, kerf=engine.kerf)
+
+
+def test_nest_groups_by_material_and_color():
+    """
+    Given: cut-list rows of PLYTA 18, front and HDF parts
+    When: nesting them as groups
+    Then: each (material, color) group gets its own result, equal parts
+          merged
+    """
+    rows = [
+        ("PLYTA 18", "Biały", "bok", 560, 720, 4),
+        ("PLYTA 18", "Biały", "bok", 560, 720, 2),
+        ("FRONT", "Dąb", "front", 596, 716, 3),
+        ("HDF", "", "plecy", 590, 710, 3),
+    ]
+
+    results = NestingEngine().nest_groups(rows)
+
+    groups = {(r.material, r.color): r for r in results}
+    assert set(groups) == {("FRONT", "Dąb"), ("HDF", ""), ("PLYTA 18", "Biały")}
+    assert groups[("PLYTA 18", "Biały")].piece_count == 6
+    assert all(r.sheet_count == 1 for r in results)
@@ -57,7 +57,7 @@ class TestProjectDetailsController:
         controller = ProjectDetailsController(session, sample_project)
 
         # Mock project_service to raise exception
-        controller.project_service.list_cabinets = Mock(
+        controller.project_service.list_cabinet_rows = Mock(
             side_effect=Exception("Database error")
         )
 
@@ -484,7 +484,12 @@ class TestProjectDetailsController:
             cabinet2 = controller.cabinets[1]
 
             # Verify they have the same project_id (they should)
-            assert cabinet1.project_id == cabinet2.project_id == sample_project.id
+            get_cabinet = controller.project_service.get_cabinet
+            assert (
+                get_cabinet(cabinet1.id).project_id
+                == get_cabinet(cabinet2.id).project_id
+                == sample_project.id
+            )
 
             # Set up validation error spy
             validation_error_spy = Mock()
@@ -659,3 +664,88 @@ class TestProjectDetailsController:
         )
         errors = validate_sequence_unique(cabinets)
         assert len(errors) == 2  # Should detect both 1 and 2 as duplicates
+
+    def test_quantity_steps_are_committed_together(
+        self, session, engine, sample_project, sample_project_cabinets
+    ):
+        """Rapid quantity changes share one commit within the commit window."""
+        from sqlalchemy import event
+
+        controller = ProjectDetailsController(session, sample_project)
+        controller.load_data()
+        cabinet_id = controller.cabinets[0].id
+        commits = []
+
+        def _on_commit(connection):
+            commits.append(connection)
+
+        event.listen(engine, "commit", _on_commit)
+        try:
+            for quantity in range(3, 8):
+                controller.on_quantity_changed(cabinet_id, quantity)
+            assert commits == []
+            assert controller.project_service.in_unit_of_work()
+
+            assert controller.commit_pending_changes()
+        finally:
+            event.remove(engine, "commit", _on_commit)
+
+        assert len(commits) == 1
+        assert not controller.project_service.in_unit_of_work()
+        session.expire_all()
+        assert controller.project_service.get_cabinet(cabinet_id).quantity == 7
+
+    def test_rollback_by_another_service_ends_commit_window(
+        self, session, sample_project, sample_project_cabinets
+    ):
+        """A rollback on the shared session mid-window resets and reloads."""
+        import os
+
+        from PySide6.QtWidgets import QApplication
+
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        app = QApplication.instance() or QApplication([])
+
+        # GIVEN quantity steps waiting in the commit window
+        controller = ProjectDetailsController(session, sample_project)
+        controller.load_data()
+        cabinet_id = controller.cabinets[0].id
+        original = controller.cabinets[0].quantity
+        controller.on_quantity_changed(cabinet_id, original + 3)
+        assert controller.project_service.in_unit_of_work()
+
+        # WHEN another service on the same session rolls back
+        session.rollback()
+        app.processEvents()
+
+        # THEN the unit of work is closed and the view shows the stored value
+        assert not controller.project_service.in_unit_of_work()
+        assert controller.commit_pending_changes()
+        row = next(c for c in controller.cabinets if c.id == cabinet_id)
+        assert row.quantity == original
+
+    def test_add_catalog_cabinets_refreshes_once(
+        self, session, sample_project, sample_project_cabinets
+    ):
+        """A batch of catalog cabinets is added with a single view refresh."""
+        from src.services.project_service import CabinetSpec
+
+        controller = ProjectDetailsController(session, sample_project)
+        controller.load_data()
+        next_sequence = controller.get_next_cabinet_sequence(sample_project.id)
+        data_loaded_spy = Mock()
+        controller.data_loaded.connect(data_loaded_spy)
+        specs = [
+            CabinetSpec(
+                sample_project_cabinets[0].type_id, "Biały", "Dąb", "Gola", quantity=2
+            )
+            for _ in range(5)
+        ]
+
+        new_cabinets = controller.add_catalog_cabinets(specs)
+
+        data_loaded_spy.assert_called_once()
+        assert [cab.sequence_number for cab in new_cabinets] == list(
+            range(next_sequence, next_sequence + 5)
+        )
+        assert all(cab.quantity == 2 for cab in new_cabinets)
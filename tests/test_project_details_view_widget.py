@@ -14,6 +14,7 @@ from src.gui.project_details.constants import VIEW_MODE_TABLE
 from src.gui.project_details.models import CabinetTableModel
 from src.gui.project_details.view import ProjectDetailsView
 from src.gui.project_details import widget as widget_module
+from src.services.project_service import CabinetListRow
 
 
 @pytest.fixture(scope="module")
@@ -35,32 +36,27 @@ def project_details_view(qapp):
     qapp.processEvents()
 
 
-def _make_part(width_mm=None, height_mm=None, calc_context_json=None):
-    return SimpleNamespace(
-        width_mm=width_mm,
-        height_mm=height_mm,
-        calc_context_json=calc_context_json,
-    )
-
-
 def _make_cabinet(
     cabinet_id: int,
     sequence: int = 1,
     quantity: int = 1,
-    cabinet_type=None,
-    parts=None,
+    name: str = "Niestandardowy",
+    width_mm=None,
+    height_mm=None,
     body_color="Biały",
     front_color="Biały",
 ):
-    return SimpleNamespace(
+    return CabinetListRow(
         id=cabinet_id,
-        type_id=getattr(cabinet_type, "id", None),
         sequence_number=sequence,
         quantity=quantity,
-        cabinet_type=cabinet_type,
-        parts=parts or [],
         body_color=body_color,
         front_color=front_color,
+        name=name,
+        kitchen_type="CUSTOM",
+        width_mm=width_mm,
+        height_mm=height_mm,
+        part_count=1 if width_mm else 0,
     )
 
 
@@ -136,19 +132,20 @@ def test_table_refreshes_when_data_changes_in_table_mode(project_details_view):
     assert model.data(model.index(0, 5)) == 3
 
 
-def test_cabinet_table_model_uses_custom_name_and_real_dimensions():
-    parts = [
-        _make_part(
-            width_mm=600,
-            height_mm=720,
-            calc_context_json={"template_name": "D60"},
-        )
-    ]
-    cabinet = _make_cabinet(31, sequence=7, quantity=2, cabinet_type=None, parts=parts)
-    model = CabinetTableModel([cabinet])
+def test_cabinet_table_model_shows_row_name_and_dimensions():
+    cabinet = _make_cabinet(
+        31,
+        sequence=7,
+        quantity=2,
+        name="D60 + niestandardowa",
+        width_mm=600,
+        height_mm=720,
+    )
+    model = CabinetTableModel([cabinet, _make_cabinet(32, sequence=8)])
 
     assert model.data(model.index(0, 1)) == "D60 + niestandardowa"
     assert model.data(model.index(0, 2)) == "600x720 mm"
+    assert model.data(model.index(1, 2)) == "brak wymiarów"
     assert model.data(model.index(0, 0), role=Qt.ItemDataRole.UserRole) == 31
 
 
@@ -0,0 +1,49 @@
+"""
+Lazy paging of the main window project list model.
+"""
+
+import os
+
+import pytest
+from PySide6.QtWidgets import QApplication
+
+from src.gui.models.project_list_model import ProjectListModel
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def test_model_fetches_pages_on_demand(qapp):
+    rows = list(range(250))
+    requests = []
+
+    def fetch_page(last_row):
+        requests.append(last_row)
+        start = 0 if last_row is None else last_row + 1
+        page = rows[start : start + 100]
+        return page, start + 100 < len(rows)
+
+    model = ProjectListModel()
+    inserted = []
+    model.rowsInserted.connect(
+        lambda parent, first, last: inserted.append((first, last))
+    )
+
+    model.set_page_source(fetch_page)
+    assert model.rowCount() == 100
+    assert model.canFetchMore()
+
+    model.fetchMore()
+    model.fetchMore()
+    assert model.rowCount() == 250
+    assert not model.canFetchMore()
+    model.fetchMore()
+
+    assert requests == [None, 99, 199]
+    assert inserted == [(0, 99), (100, 199), (200, 249)]
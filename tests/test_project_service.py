@@ -1,11 +1,16 @@
 import pytest
 from datetime import datetime
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import sessionmaker
 
 from src.db_schema.orm_models import Base, CabinetColor
-from src.services.project_service import ProjectService
+from src.services.project_service import (
+    AGGREGATION_CACHE_PROJECTS,
+    CabinetSpec,
+    ProjectService,
+)
 from src.services.template_service import TemplateService
 from src.services.color_palette_service import ColorPaletteService
 
@@ -218,6 +223,8 @@ def test_add_cabinet_marks_color_usage(service, template_service, session):
         handle_type="Standardowy",
         quantity=1,
     )
+    # usage is queued in memory and written in one batch
+    palette.flush_usage()
 
     session.expire_all()
     after_body = session.query(CabinetColor).filter_by(normalized_name="biały").one()
@@ -252,6 +259,7 @@ def test_update_cabinet_marks_only_changed_colors(service, template_service, ses
         handle_type="Standardowy",
         quantity=1,
     )
+    palette.flush_usage()
 
     before_front = session.query(CabinetColor).filter_by(normalized_name="czarny").one()
     before_body_target = (
@@ -261,6 +269,7 @@ def test_update_cabinet_marks_only_changed_colors(service, template_service, ses
     before_body_target_count = before_body_target.usage_count
 
     service.update_cabinet(cabinet.id, body_color="Zielony", front_color="Czarny")
+    palette.flush_usage()
 
     session.expire_all()
     after_front = session.query(CabinetColor).filter_by(normalized_name="czarny").one()
@@ -428,3 +437,617 @@ class TestProjectEdgeCases:
         # THEN: Notes should be preserved
         fetched = service.get_project(proj.id)
         assert len(fetched.blaty_note) == 10000
+
+
+# ==============================================================================
+# Aggregation Tests
+# ==============================================================================
+
+
+def _add_custom_cabinet_for_aggregation(service, project_id, sequence, quantity):
+    return service.add_custom_cabinet(
+        project_id,
+        sequence_number=sequence,
+        body_color="Biały",
+        front_color="Dąb",
+        handle_type="Gola",
+        quantity=quantity,
+        custom_parts=[
+            {
+                "part_name": "bok",
+                "width_mm": 560,
+                "height_mm": 720,
+                "pieces": 2,
+                "material": "PLYTA 18",
+                "wrapping": "D",
+            },
+            {"part_name": "front drzwi", "width_mm": 596, "height_mm": 716},
+            {
+                "part_name": "plecy",
+                "width_mm": 590,
+                "height_mm": 710,
+                "material": "HDF",
+            },
+            {"part_name": "półka szklana", "width_mm": 500, "height_mm": 300},
+        ],
+        custom_accessories=[{"name": "Zawias", "count": 2}],
+    )
+
+
+def test_aggregated_batches_classify_and_multiply(service):
+    # GIVEN a project with two custom cabinets of different quantities
+    proj = service.create_project(
+        name="AggBatches", kitchen_type="LOFT", order_number="AGG-001"
+    )
+    _add_custom_cabinet_for_aggregation(service, proj.id, 1, quantity=1)
+    _add_custom_cabinet_for_aggregation(service, proj.id, 2, quantity=3)
+
+    # WHEN aggregating into columnar batches
+    batches = service.get_aggregated_project_batches(proj.id)
+
+    # THEN parts are classified per category with multiplied quantities
+    formatki = batches.parts["formatki"]
+    assert formatki.sequence == [1, 2]
+    assert formatki.quantity == [2, 6]
+    assert formatki.color == ["Biały", "Biały"]
+    assert formatki.material == ["PLYTA 18", "PLYTA 18"]
+
+    fronty = batches.parts["fronty"]
+    assert fronty.color == ["Dąb", "Dąb"]
+    assert fronty.notes == ["Handle: Gola", "Handle: Gola"]
+
+    assert batches.parts["hdf"].color == ["", ""]
+    assert len(batches.parts["polki_szklane"]) == 2
+    assert len(batches.parts["witryny"]) == 0
+    assert batches.accessories.quantity == [2, 6]
+
+
+def test_aggregated_elements_adapter_matches_batches(service):
+    # GIVEN a project with one custom cabinet
+    proj = service.create_project(
+        name="AggAdapter", kitchen_type="LOFT", order_number="AGG-002"
+    )
+    _add_custom_cabinet_for_aggregation(service, proj.id, 4, quantity=2)
+
+    # WHEN requesting the legacy dict-list output
+    elements = service.get_aggregated_project_elements(proj.id)
+
+    # THEN the shape matches historical report input
+    assert elements["formatki"] == [
+        {
+            "seq": "④",
+            "sequence": 4,
+            "name": "bok",
+            "quantity": 4,
+            "width": 560,
+            "height": 720,
+            "color": "Biały",
+            "material": "PLYTA 18",
+            "wrapping": "D",
+            "notes": "",
+        }
+    ]
+    assert "material" not in elements["fronty"][0]
+    assert elements["akcesoria"] == [
+        {"name": "Zawias", "source_accessory_id": None, "quantity": 4, "notes": ""}
+    ]
+
+
+def test_aggregated_elements_unknown_project_is_empty(service):
+    # WHEN aggregating a project that does not exist
+    elements = service.get_aggregated_project_elements(-1)
+
+    # THEN every category is present and empty
+    assert set(elements) == {
+        "formatki",
+        "fronty",
+        "witryny",
+        "polki_szklane",
+        "hdf",
+        "akcesoria",
+    }
+    assert all(rows == [] for rows in elements.values())
+
+
+def test_aggregation_cache_recomputes_only_changed_cabinets(service, session):
+    # GIVEN a project with two cabinets aggregated once
+    proj = service.create_project(
+        name="AggCache", kitchen_type="LOFT", order_number="AGG-003"
+    )
+    cab1 = _add_custom_cabinet_for_aggregation(service, proj.id, 1, quantity=1)
+    cab2 = _add_custom_cabinet_for_aggregation(service, proj.id, 2, quantity=1)
+    service.get_aggregated_project_batches(proj.id)
+
+    # WHEN one cabinet quantity changes
+    service.update_cabinet(cab2.id, quantity=5)
+    recomputed = []
+    original = service._aggregate_cabinets
+
+    def _spy(scope):
+        result = original(scope)
+        recomputed.extend(result)
+        return result
+
+    service._aggregate_cabinets = _spy
+    batches = service.get_aggregated_project_batches(proj.id)
+
+    # THEN only that cabinet is re-aggregated and totals reflect the change
+    assert recomputed == [cab2.id]
+    assert batches.parts["formatki"].quantity == [2, 10]
+
+    # AND a repeated call hits the cache entirely
+    recomputed.clear()
+    service.get_aggregated_project_batches(proj.id)
+    assert recomputed == []
+    assert cab1.id in session.info["project_aggregation_cache"].cabinet_ids(proj.id)
+
+
+def test_aggregation_cache_keeps_only_recent_projects(service, session):
+    # GIVEN more aggregated projects than the cache holds
+    project_ids = []
+    for index in range(AGGREGATION_CACHE_PROJECTS + 2):
+        proj = service.create_project(
+            name=f"AggLru {index}", kitchen_type="LOFT", order_number=f"LRU-{index}"
+        )
+        _add_custom_cabinet_for_aggregation(service, proj.id, 1, quantity=1)
+        service.get_aggregated_project_batches(proj.id)
+        project_ids.append(proj.id)
+
+    # WHEN the oldest project is aggregated again
+    service.get_aggregated_project_batches(project_ids[0])
+
+    # THEN the cache stays bounded and evicts the least recently used projects
+    cache = session.info["project_aggregation_cache"]
+    assert len(cache) == AGGREGATION_CACHE_PROJECTS
+    assert cache.cabinet_ids(project_ids[0])
+    assert not cache.cabinet_ids(project_ids[1])
+    assert not cache.cabinet_ids(project_ids[2])
+    assert cache.cabinet_ids(project_ids[-1])
+
+
+def test_aggregation_cache_drops_deleted_cabinets(service):
+    # GIVEN an aggregated project with two cabinets
+    proj = service.create_project(
+        name="AggCacheDel", kitchen_type="LOFT", order_number="AGG-004"
+    )
+    _add_custom_cabinet_for_aggregation(service, proj.id, 1, quantity=1)
+    cab2 = _add_custom_cabinet_for_aggregation(service, proj.id, 2, quantity=1)
+    service.get_aggregated_project_batches(proj.id)
+
+    # WHEN a cabinet is deleted
+    service.delete_cabinet(cab2.id)
+
+    # THEN it no longer contributes rows
+    elements = service.get_aggregated_project_elements(proj.id)
+    assert [row["sequence"] for row in elements["formatki"]] == [1]
+
+
+def test_unit_of_work_commits_once(service, session, engine):
+    # GIVEN a project with two cabinets
+    proj = service.create_project(
+        name="UnitOfWork", kitchen_type="LOFT", order_number="UOW-001"
+    )
+    cab1 = _add_custom_cabinet_for_aggregation(service, proj.id, 1, quantity=1)
+    cab2 = _add_custom_cabinet_for_aggregation(service, proj.id, 2, quantity=1)
+    commits = []
+
+    def _on_commit(connection):
+        commits.append(connection)
+
+    event.listen(engine, "commit", _on_commit)
+
+    # WHEN several mutations run inside a unit of work
+    try:
+        with service.unit_of_work():
+            for quantity in range(2, 7):
+                service.update_cabinet(cab1.id, quantity=quantity)
+            service.update_cabinet(cab2.id, sequence_number=5)
+            assert commits == []
+    finally:
+        event.remove(engine, "commit", _on_commit)
+
+    # THEN they are written with a single commit
+    assert len(commits) == 1
+    session.expire_all()
+    assert service.get_cabinet(cab1.id).quantity == 6
+    assert service.get_cabinet(cab2.id).sequence_number == 5
+
+
+def test_unit_of_work_undoes_only_failing_call(service, session):
+    # GIVEN a project with two cabinets and an open unit of work
+    proj = service.create_project(
+        name="UnitOfWorkFail", kitchen_type="LOFT", order_number="UOW-002"
+    )
+    cab1 = _add_custom_cabinet_for_aggregation(service, proj.id, 1, quantity=1)
+    cab2 = _add_custom_cabinet_for_aggregation(service, proj.id, 2, quantity=1)
+
+    with service.unit_of_work():
+        service.update_cabinet(cab1.id, quantity=3)
+        # WHEN a call violates the sequence uniqueness constraint
+        with pytest.raises(IntegrityError):
+            service.update_cabinet(cab2.id, sequence_number=1)
+        assert service.update_part(cab2.parts[0].id, {"pieces": 4})
+
+    # THEN only that call is undone
+    session.expire_all()
+    assert service.get_cabinet(cab1.id).quantity == 3
+    assert service.get_cabinet(cab2.id).sequence_number == 2
+    assert service.get_cabinet(cab2.id).parts[0].pieces == 4
+
+
+def test_unit_of_work_rolls_back_on_error(service, session):
+    # GIVEN a cabinet
+    proj = service.create_project(
+        name="UnitOfWorkRollback", kitchen_type="LOFT", order_number="UOW-003"
+    )
+    cab = _add_custom_cabinet_for_aggregation(service, proj.id, 1, quantity=1)
+
+    # WHEN the unit of work body raises
+    with pytest.raises(RuntimeError):
+        with service.unit_of_work():
+            service.update_cabinet(cab.id, quantity=9)
+            raise RuntimeError("boom")
+
+    # THEN nothing is written
+    session.expire_all()
+    assert service.get_cabinet(cab.id).quantity == 1
+    assert not service.in_unit_of_work()
+
+
+def test_unit_of_work_ends_when_session_is_rolled_back_outside_it(service, session):
+    # GIVEN an open unit of work with a pending edit and a listener
+    proj = service.create_project(
+        name="UnitOfWorkRollback", kitchen_type="LOFT", order_number="UOW-005"
+    )
+    cab = _add_custom_cabinet_for_aggregation(service, proj.id, 1, quantity=1)
+    interrupted = []
+    service.on_unit_of_work_interrupted(lambda: interrupted.append(True))
+    service.begin_unit_of_work()
+    service.update_cabinet(cab.id, quantity=5)
+
+    # WHEN another service sharing the session rolls back
+    session.rollback()
+
+    # THEN the unit of work is over and the listener was told
+    assert not service.in_unit_of_work()
+    assert interrupted == [True]
+    session.expire_all()
+    assert service.get_cabinet(cab.id).quantity == 1
+    # a stray commit_unit_of_work() afterwards is harmless
+    service.commit_unit_of_work()
+
+
+def test_unit_of_work_defers_color_usage(service, session):
+    # GIVEN a seeded palette
+    palette = ColorPaletteService(session)
+    palette.ensure_seeded()
+    proj = service.create_project(
+        name="UnitOfWorkColors", kitchen_type="LOFT", order_number="UOW-004"
+    )
+    cab = _add_custom_cabinet_for_aggregation(service, proj.id, 1, quantity=1)
+    palette.flush_usage()
+    before = session.query(CabinetColor).filter_by(normalized_name="czarny").one()
+    before_count = before.usage_count
+
+    # WHEN a color change is made inside a unit of work
+    service.begin_unit_of_work()
+    service.update_cabinet(cab.id, front_color="Czarny")
+    assert palette.flush_usage() == 0
+    session.expire_all()
+    during = session.query(CabinetColor).filter_by(normalized_name="czarny").one()
+    assert during.usage_count == before_count
+    service.commit_unit_of_work()
+    palette.flush_usage()
+
+    # THEN usage is tracked once the unit of work commits
+    session.expire_all()
+    after = session.query(CabinetColor).filter_by(normalized_name="czarny").one()
+    assert after.usage_count == before_count + 1
+
+
+def _create_template_with_parts(template_service, name):
+    template = template_service.create_template(kitchen_type="LOFT", name=name)
+    template_service.add_part(
+        cabinet_type_id=template.id,
+        part_name="Bok",
+        height_mm=720,
+        width_mm=560,
+        pieces=2,
+        wrapping="DKK",
+    )
+    template_service.add_part(
+        cabinet_type_id=template.id, part_name="Wieniec", height_mm=564, width_mm=560
+    )
+    template_service.add_accessory_by_name(
+        cabinet_type_id=template.id, name="Zawias", count=2
+    )
+    return template
+
+
+def test_add_cabinet_materializes_template_snapshots(service, template_service):
+    # GIVEN a template with parts and an accessory
+    template = _create_template_with_parts(template_service, "BulkSnapshot")
+    proj = service.create_project(
+        name="Snapshots", kitchen_type="LOFT", order_number="BULK-001"
+    )
+
+    # WHEN adding a cabinet of that type
+    cab = service.add_cabinet(
+        proj.id,
+        sequence_number=1,
+        type_id=template.id,
+        body_color="Biały",
+        front_color="Biały",
+        handle_type="Gola",
+    )
+
+    # THEN parts and accessories are copied with their template references
+    parts = sorted(cab.parts, key=lambda part: part.part_name)
+    assert [(p.part_name, p.pieces, p.wrapping) for p in parts] == [
+        ("Bok", 2, "DKK"),
+        ("Wieniec", 1, None),
+    ]
+    assert {p.source_template_id for p in parts} == {template.id}
+    assert [(a.name, a.count) for a in cab.accessory_snapshots] == [("Zawias", 2)]
+
+
+def test_add_cabinets_of_type_writes_consecutive_cabinets(
+    service, template_service, session, engine
+):
+    # GIVEN a template and a project with one cabinet
+    template = _create_template_with_parts(template_service, "BulkMany")
+    proj = service.create_project(
+        name="BulkMany", kitchen_type="LOFT", order_number="BULK-002"
+    )
+    _add_custom_cabinet_for_aggregation(service, proj.id, 1, quantity=1)
+    statements = []
+
+    def _on_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _on_execute)
+
+    # WHEN adding 50 cabinets of that type at once
+    try:
+        cabinets = service.add_cabinets_of_type(
+            proj.id,
+            template.id,
+            50,
+            body_color="Biały",
+            front_color="Dąb",
+            handle_type="Gola",
+            quantity=2,
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", _on_execute)
+
+    # THEN they follow the existing numbering and each gets the template parts
+    assert [cab.sequence_number for cab in cabinets] == list(range(2, 52))
+    session.expire_all()
+    assert len(service.list_cabinets(proj.id)) == 51
+    assert all(len(cab.parts) == 2 for cab in cabinets)
+    assert all(len(cab.accessory_snapshots) == 1 for cab in cabinets)
+    # AND each table is written with a single statement
+    for table in ("project_cabinets", "project_cabinet_parts"):
+        inserts = [s for s in statements if s.startswith(f"INSERT INTO {table} ")]
+        assert len(inserts) == 1
+
+
+def test_add_cabinets_batch_commits_once(service, template_service, session, engine):
+    # GIVEN two templates and a seeded palette
+    palette = ColorPaletteService(session)
+    palette.ensure_seeded()
+    lower = _create_template_with_parts(template_service, "BatchLower")
+    upper = template_service.create_template(kitchen_type="LOFT", name="BatchUpper")
+    proj = service.create_project(
+        name="Batch", kitchen_type="LOFT", order_number="BULK-003"
+    )
+    before = session.query(CabinetColor).filter_by(normalized_name="czarny").one()
+    before_count = before.usage_count
+    specs = [
+        CabinetSpec(lower.id, "Czarny", "Czarny", "Gola", quantity=2),
+        CabinetSpec(upper.id, "Czarny", "Biały", "Gola"),
+        CabinetSpec(None, "Czarny", "Czarny", "Brak"),
+        CabinetSpec(lower.id, "Czarny", "Biały", "Gola"),
+    ]
+    commits = []
+
+    def _on_commit(connection):
+        commits.append(connection)
+
+    event.listen(engine, "commit", _on_commit)
+
+    # WHEN adding them as one batch
+    try:
+        cabinets = service.add_cabinets(proj.id, specs, sequence_number=3)
+    finally:
+        event.remove(engine, "commit", _on_commit)
+
+    # THEN cabinets get a contiguous block of numbers in spec order
+    assert [cab.sequence_number for cab in cabinets] == [3, 4, 5, 6]
+    assert [cab.type_id for cab in cabinets] == [lower.id, upper.id, None, lower.id]
+    assert cabinets[0].quantity == 2
+    # AND only cabinets of the template with parts get snapshots
+    assert [len(cab.parts) for cab in cabinets] == [2, 0, 0, 2]
+    # AND data is committed once; usage is queued, not committed per color
+    assert len(commits) == 1
+    palette.flush_usage()
+    session.expire_all()
+    after = session.query(CabinetColor).filter_by(normalized_name="czarny").one()
+    assert after.usage_count == before_count + 1
+
+
+def test_search_project_ids_ranks_and_folds_diacritics(service, session):
+    # GIVEN projects with Polish client data and notes
+    bialy = service.create_project(
+        name="Kuchnia Białołęka",
+        kitchen_type="LOFT",
+        order_number="FTS-001",
+        client_name="Paweł Żółkiewski",
+    )
+    note = service.create_project(
+        name="Zabudowa",
+        kitchen_type="PARIS",
+        order_number="FTS-002",
+        client_name="Anna Nowak",
+        flag_notes="front jak w Białołęce",
+    )
+    service.create_project(name="Inna", kitchen_type="LOFT", order_number="FTS-003")
+
+    # WHEN searching without diacritics and with word prefixes
+    # THEN name hits rank above note hits
+    assert service.search_project_ids("bialol") == [bialy.id, note.id]
+    assert service.search_project_ids("pawel zolk") == [bialy.id]
+    assert service.search_project_ids("FTS-002") == [note.id]
+    assert service.search_project_ids('"(') == []
+
+    # AND the index follows updates and deletes
+    service.update_project(note.id, client_name="Anna Kowalska")
+    assert service.search_project_ids("kowal") == [note.id]
+    service.delete_project(bialy.id)
+    assert service.search_project_ids("bialol") == [note.id]
+
+
+def test_list_project_rows_pages_with_keyset(service):
+    # GIVEN a separate kitchen type with seven projects
+    created = [
+        service.create_project(
+            name=f"Page {i}", kitchen_type="PAGED", order_number=f"PG-{i}"
+        )
+        for i in range(7)
+    ]
+    expected = [p.id for p in reversed(created)]
+
+    # WHEN reading them three at a time, continuing after the last row
+    pages, after_id = [], None
+    while True:
+        rows = service.list_project_rows(
+            after_id=after_id, limit=3, kitchen_type="PAGED"
+        )
+        if not rows:
+            break
+        pages.append([row.id for row in rows])
+        after_id = rows[-1].id
+
+    # THEN pages follow list_projects() order without gaps or repeats
+    assert pages == [expected[:3], expected[3:6], expected[6:]]
+    assert service.count_projects(kitchen_type="PAGED") == 7
+    # AND rows can be fetched by id in a given (e.g. search rank) order
+    ids = [expected[4], expected[0], expected[2]]
+    assert [row.id for row in service.get_project_rows(ids)] == ids
+
+
+def test_list_cabinet_rows_projects_display_columns(service, template_service):
+    # GIVEN a catalog cabinet, a modified template cabinet and an empty one
+    template = _create_template_with_parts(template_service, "RowProjection")
+    proj = service.create_project(
+        name="Rows", kitchen_type="LOFT", order_number="ROWS-001"
+    )
+    catalog = service.add_cabinet(
+        proj.id,
+        sequence_number=2,
+        type_id=template.id,
+        body_color="Biały",
+        front_color="Dąb",
+        handle_type="Gola",
+        quantity=3,
+    )
+    custom = service.add_custom_cabinet(
+        proj.id,
+        sequence_number=1,
+        body_color="Szary",
+        front_color="Szary",
+        handle_type="Gola",
+        custom_parts=[
+            {"part_name": "bok", "width_mm": 560, "height_mm": 720},
+            {"part_name": "front", "width_mm": 600, "height_mm": 0},
+        ],
+        calc_context={"template_name": "D60"},
+    )
+    empty = service.add_custom_cabinet(
+        proj.id,
+        sequence_number=3,
+        body_color="Biały",
+        front_color="Biały",
+        handle_type="Gola",
+        custom_parts=[],
+    )
+    project_id, ids = proj.id, (custom.id, catalog.id, empty.id)
+    service.db.expunge_all()
+
+    # WHEN listing display rows
+    rows = service.list_cabinet_rows(project_id)
+
+    # THEN names, dimensions and part counts come from SQL, in sequence order
+    assert [
+        (r.id, r.name, r.kitchen_type, r.width_mm, r.height_mm, r.part_count)
+        for r in rows
+    ] == [
+        (ids[0], "D60 + niestandardowa", "CUSTOM", 600, 720, 2),
+        (ids[1], "RowProjection", "LOFT", 560, 720, 2),
+        (ids[2], "Niestandardowy", "CUSTOM", None, None, 0),
+    ]
+    assert (rows[1].quantity, rows[1].front_color) == (3, "Dąb")
+    assert service.get_cabinet_row(ids[1]) == rows[1]
+    # AND no ORM entities were loaded into the session
+    assert len(service.db.identity_map) == 0
+
+
+def test_part_mutators_keep_display_columns_current(service):
+    # GIVEN a custom cabinet with one part
+    proj = service.create_project(
+        name="Display", kitchen_type="LOFT", order_number="DISP-001"
+    )
+    cab = service.add_custom_cabinet(
+        proj.id,
+        sequence_number=1,
+        body_color="Biały",
+        front_color="Biały",
+        handle_type="Gola",
+        custom_parts=[{"part_name": "bok", "width_mm": 560, "height_mm": 720}],
+    )
+    assert (cab.display_width_mm, cab.display_height_mm, cab.part_count) == (
+        560,
+        720,
+        1,
+    )
+
+    # WHEN adding a wider part
+    service.add_part_to_cabinet(cab.id, "wieniec", width_mm=600, height_mm=300)
+
+    # THEN the cached summary follows, also on the loaded entity
+    assert (cab.display_width_mm, cab.part_count) == (600, 2)
+
+    # WHEN the snapshot is replaced by parts from a calculated template
+    service.update_cabinet_parts(
+        cab.id,
+        [
+            {
+                "part_name": "front",
+                "width_mm": 400,
+                "height_mm": 500,
+                "calc_context_json": {"template_name": "G40"},
+            }
+        ],
+    )
+
+    # THEN width, height and the derived name are recomputed
+    row = service.get_cabinet_row(cab.id)
+    assert (row.name, row.width_mm, row.height_mm, row.part_count) == (
+        "G40 + niestandardowa",
+        400,
+        500,
+        1,
+    )
+
+    # WHEN the last part is removed
+    service.remove_part_from_cabinet(service.get_cabinet(cab.id).parts[0].id)
+
+    # THEN no dimensions are shown
+    row = service.get_cabinet_row(cab.id)
+    assert (row.name, row.width_mm, row.height_mm, row.part_count) == (
+        "Niestandardowy",
+        None,
+        None,
+        0,
+    )
@@ -0,0 +1,125 @@
+"""
+EXPLAIN QUERY PLAN regression tests for hot service queries.
+
+Each query is captured while the service runs against a schema built both
+from the ORM models and from the Alembic migrations, so an index dropped or
+forgotten on either side shows up as a full table scan or a temporary
+B-tree used for sorting.
+"""
+
+import re
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from src.db_migration import upgrade_database
+from src.db_schema.orm_models import Base
+from src.services.color_palette_service import ColorPaletteService
+from src.services.project_service import ProjectService
+
+# "SCAN <table>" without "USING ... INDEX" is a full table scan.
+FULL_SCAN = re.compile(r"^SCAN \w+$")
+
+
+@pytest.fixture(params=["orm", "migrations"])
+def engine(request, tmp_path):
+    db_path = tmp_path / "plans.db"
+    if request.param == "orm":
+        engine = create_engine(f"sqlite:///{db_path}")
+        Base.metadata.create_all(engine)
+    else:
+        upgrade_database(db_path)
+        engine = create_engine(f"sqlite:///{db_path}")
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session(engine):
+    session = sessionmaker(bind=engine)()
+    project_service = ProjectService(session)
+    for index in range(3):
+        project = project_service.create_project(
+            name=f"Plan {index}", kitchen_type="LOFT", order_number=f"PLAN-{index}"
+        )
+        project_service.add_custom_cabinet(
+            project.id,
+            sequence_number=1,
+            body_color="Biały",
+            front_color="Dąb",
+            handle_type="Gola",
+            custom_parts=[{"part_name": "bok", "width_mm": 560, "height_mm": 720}],
+            custom_accessories=[{"name": "Zawias", "count": 2}],
+        )
+    yield session
+    session.close()
+
+
+def _query_plans(engine, run):
+    """Run `run` and return {sql: plan lines} for every SELECT it executed."""
+    statements = []
+
+    def _on_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", _on_execute)
+    try:
+        run()
+    finally:
+        event.remove(engine, "before_cursor_execute", _on_execute)
+
+    assert statements, "no queries were captured"
+    with engine.connect() as connection:
+        return {
+            statement: [
+                row[-1]
+                for row in connection.exec_driver_sql(
+                    f"EXPLAIN QUERY PLAN {statement}", parameters
+                )
+            ]
+            for statement, parameters in statements
+        }
+
+
+def _assert_indexed(plans):
+    for statement, plan in plans.items():
+        problems = [
+            line for line in plan if FULL_SCAN.match(line) or "TEMP B-TREE" in line
+        ]
+        assert not problems, f"{problems} in plan of:\n{statement}"
+
+
+def test_project_queries_use_indexes(engine, session):
+    service = ProjectService(session)
+    project_id = service.list_projects()[0].id
+    session.expire_all()
+    service.invalidate_aggregation_cache()
+
+    plans = _query_plans(
+        engine,
+        lambda: (
+            service.list_projects(),
+            service.list_project_rows(after_id=project_id, limit=2),
+            service.list_cabinets(project_id),
+            service.list_cabinet_rows(project_id),
+            service.get_next_cabinet_sequence(project_id),
+            service.get_aggregated_project_batches(project_id),
+        ),
+    )
+
+    _assert_indexed(plans)
+
+
+def test_color_queries_use_covering_indexes(engine, session):
+    palette = ColorPaletteService(session)
+    palette.ensure_seeded()
+    # write the usage queued by the fixture's cabinets before measuring
+    palette.flush_usage()
+
+    plans = _query_plans(engine, lambda: (palette.list_recent(),))
+
+    _assert_indexed(plans)
+    for plan in plans.values():
+        assert any("COVERING INDEX ix_cabinet_colors_" in line for line in plan)
@@ -0,0 +1,69 @@
+from pathlib import Path
+
+import pytest
+
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from src.db_schema.orm_models import Base
+from src.services.project_service import ProjectService
+from src.services.report_batch import ReportBatchRunner, create_read_only_engine
+
+
+def _create_file_db(db_path: Path, project_count: int):
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    service = ProjectService(session)
+    project_ids = [
+        service.create_project(
+            name=f"Batch {i}", kitchen_type="LOFT", order_number=f"B{i:03d}"
+        ).id
+        for i in range(project_count)
+    ]
+    session.close()
+    engine.dispose()
+    return project_ids
+
+
+def test_batch_runner_generates_report_per_project(tmp_path):
+    """
+    Given: a database file with two projects and an unknown project ID
+    When: reports are generated on a two-process pool
+    Then: each existing project gets a .docx and the unknown one reports an error
+    """
+    db_path = tmp_path / "batch.db"
+    project_ids = _create_file_db(db_path, 2)
+    output_dir = tmp_path / "reports"
+    progress = []
+
+    results = ReportBatchRunner(db_path, max_workers=2).run(
+        project_ids + [9999],
+        str(output_dir),
+        progress_callback=lambda done, total, r: progress.append((done, total)),
+    )
+
+    by_id = {r.project_id: r for r in results}
+    assert set(by_id) == {*project_ids, 9999}
+    for project_id in project_ids:
+        assert by_id[project_id].ok
+        assert Path(by_id[project_id].path).is_file()
+    assert not by_id[9999].ok
+    assert "9999" in by_id[9999].error
+    assert [done for done, _ in progress] == [1, 2, 3]
+    assert all(total == 3 for _, total in progress)
+
+
+def test_read_only_engine_rejects_writes(tmp_path):
+    """
+    Given: a read-only engine on an existing database file
+    When: a write is attempted
+    Then: SQLite refuses it
+    """
+    db_path = tmp_path / "ro.db"
+    _create_file_db(db_path, 1)
+    engine = create_read_only_engine(db_path)
+
+    with engine.connect() as conn, pytest.raises(OperationalError, match="readonly"):
+        conn.exec_driver_sql("DELETE FROM projects")
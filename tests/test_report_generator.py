@@ -3,8 +3,9 @@ from pathlib import Path
 import pytest
 from datetime import date
 from docx import Document
-from src.services.report_generator import ReportGenerator
-from src.services.project_service import get_circled_number
+from src.services.report_generator import ReportCancelledError, ReportGenerator
+from src.services.project_aggregation import get_circled_number
+from src.services.report_pagination import ReportPagination
 from src.db_schema.orm_models import (
     Project,
     CabinetTemplate,
@@ -181,6 +182,68 @@ def test_header_contains_orm_metadata(tmp_path, sample_project_orm):
     assert date.today().isoformat() in text
 
 
+def test_report_template_is_reused_until_logo_settings_change(
+    tmp_path, sample_project_orm
+):
+    """
+    Given: repeated reports with unchanged settings
+    When: the company logo setting changes
+    Then: the cached template is reused until then and rebuilt afterwards
+    """
+
+    class _FakeSettingsService:
+        company_logo = ""
+
+        def get_setting_value(self, key: str, default=None):
+            if key == "company_logo_path":
+                return self.company_logo
+            return default
+
+    rg = ReportGenerator()
+    rg.settings_service = _FakeSettingsService()
+
+    first = rg._get_report_template()
+    assert rg._get_report_template() is first
+
+    company_logo = tmp_path / "company.png"
+    company_logo.write_bytes(rg._get_program_logo_path().read_bytes())
+    rg.settings_service.company_logo = str(company_logo)
+    second = rg._get_report_template()
+    assert second is not first
+
+    output = rg.generate(
+        sample_project_orm, output_dir=str(tmp_path / "out"), auto_open=False
+    )
+    header = Document(output).sections[0].header
+    assert len(header.tables[0].cell(0, 1)._tc.xpath(".//w:drawing")) == 2
+    assert "Klient: ORM Client" in header.tables[0].cell(0, 0).text
+
+
+def test_logo_setting_change_drops_cached_templates(session):
+    """
+    Given: a report generator on a session and a cached template
+    When: a logo setting changes, then an unrelated setting changes
+    Then: only the logo change drops the cached templates
+    """
+    from src.services.report_template import _cached_template, on_setting_changed
+    from src.services.settings_service import SettingsService
+
+    rg = ReportGenerator(db_session=session)
+    ReportGenerator(db_session=session)  # a second generator subscribes once
+    rg._get_report_template()
+    assert _cached_template.cache_info().currsize > 0
+
+    settings = SettingsService(session)
+    settings.set_setting("report_program_logo_variant", "Kolorowe")
+    assert _cached_template.cache_info().currsize == 0
+
+    rg._get_report_template()
+    settings.set_setting("dark_mode", True)
+    assert _cached_template.cache_info().currsize > 0
+    listeners = [ref() for ref in settings._cache().listeners]
+    assert listeners.count(on_setting_changed) == 1
+
+
 def test_body_tables_count_and_headers(tmp_path, sample_project_orm):
     """
     Given: a report with derived parts
@@ -533,7 +596,7 @@ def test_should_break_page_respects_strictness_setting():
             return default
 
     doc = Document()
-    for _ in range(20):
+    for _ in range(15):
         doc.add_paragraph("x")
 
     rg = ReportGenerator()
@@ -548,6 +611,52 @@ def test_should_break_page_respects_strictness_setting():
     assert rg._should_break_page_for_section(doc, items_count=5) is True
 
 
+def test_pagination_estimate_matches_generated_document(tmp_path, sample_project_orm):
+    """
+    Given: a report long enough to span several pages
+    When: it is generated
+    Then: the running page estimate matches a fresh scan of the saved document
+    """
+    sample_project_orm.cabinets[0].cabinet_type.parts = [
+        CabinetPart(
+            part_name=f"panel {i}",
+            height_mm=100 + i,
+            width_mm=200,
+            pieces=1,
+            material="PLYTA 18",
+            comments="uwagi " * (i % 4),
+        )
+        for i in range(80)
+    ]
+    rg = ReportGenerator()
+
+    output = rg.generate(
+        sample_project_orm,
+        output_dir=str(tmp_path),
+        auto_open=False,
+        writer=ReportGenerator.WRITER_DOCX,
+    )
+
+    assert rg.last_page_estimate > 2
+    scanned = ReportPagination.from_document(Document(output))
+    assert scanned.page_count == rg.last_page_estimate
+
+
+def test_pagination_wraps_long_cell_text():
+    """
+    Given: two table rows, one with text wider than its column
+    When: estimating row heights
+    Then: the wrapped row is taller by whole lines
+    """
+    pagination = ReportPagination.for_document(Document())
+    widths = pagination.table_column_widths([60.0, 60.0])
+
+    short_row = pagination.row_height(["a", "b"], widths)
+    long_row = pagination.row_height(["a", "x" * 30], widths)
+
+    assert long_row == pytest.approx(short_row + 3 * pagination.body.line_height)
+
+
 def test_constructor_accepts_legacy_positional_session(session):
     """
     Given: legacy constructor call with Session as first positional argument
@@ -939,3 +1048,284 @@ def test_custom_cabinet_sequence_numbers(tmp_path, project_with_custom_cabinets)
         f"Sequence number {seq1} not found (catalog cabinet)"
     )
     assert seq2 in found_sequences, f"Sequence number {seq2} not found (custom cabinet)"
+
+
+def _table_texts(doc):
+    return [
+        [[cell.text for cell in row.cells] for row in table.rows]
+        for table in doc.tables
+    ]
+
+
+def test_streaming_writer_matches_python_docx_output(tmp_path, sample_project_orm):
+    """
+    Given: the same project rendered with both writers
+    When: reading both documents back
+    Then: headings, tables, alignment, header and footer are equivalent
+    """
+    sample_project_orm.cabinets[0].cabinet_type.parts[0].comments = "a\tb\nc & <d>"
+    rg = ReportGenerator()
+
+    docx_out = rg.generate(
+        sample_project_orm,
+        output_dir=str(tmp_path / "docx"),
+        auto_open=False,
+        writer=ReportGenerator.WRITER_DOCX,
+    )
+    stream_out = rg.generate(
+        sample_project_orm,
+        output_dir=str(tmp_path / "stream"),
+        auto_open=False,
+        writer=ReportGenerator.WRITER_STREAMING,
+    )
+
+    docx_doc = Document(docx_out)
+    stream_doc = Document(stream_out)
+
+    assert _table_texts(stream_doc) == _table_texts(docx_doc)
+    assert [p.text for p in stream_doc.paragraphs] == [
+        p.text for p in docx_doc.paragraphs
+    ]
+    assert any("a\tb\nc & <d>" in row for row in _table_texts(stream_doc)[0])
+    qty_paragraph = stream_doc.tables[0].rows[1].cells[3].paragraphs[0]
+    assert (
+        qty_paragraph.alignment
+        == docx_doc.tables[0].rows[1].cells[3].paragraphs[0].alignment
+    )
+    assert (
+        stream_doc.sections[0].header.tables[0].cell(0, 0).text
+        == docx_doc.sections[0].header.tables[0].cell(0, 0).text
+    )
+    assert len(stream_doc.inline_shapes) == len(docx_doc.inline_shapes)
+
+
+def test_auto_writer_streams_large_reports(tmp_path, sample_project_orm, monkeypatch):
+    """
+    Given: a report above the streaming row threshold
+    When: generate is called with the default writer
+    Then: all rows are written lazily (never collected into a list) and the
+          document opens
+    """
+    from src.services.report_stream_writer import StreamingDocxWriter
+
+    deferred = []
+    defer_rows = StreamingDocxWriter.defer_rows
+
+    def _spy(self, table, rows, row_count, centered_columns=()):
+        deferred.append(rows)
+        return defer_rows(self, table, rows, row_count, centered_columns)
+
+    monkeypatch.setattr(StreamingDocxWriter, "defer_rows", _spy)
+
+    template = sample_project_orm.cabinets[0].cabinet_type
+    template.parts = [
+        CabinetPart(
+            part_name=f"panel {i}",
+            height_mm=100 + i,
+            width_mm=200,
+            pieces=1,
+            material="PLYTA 18",
+        )
+        for i in range(40)
+    ]
+    rg = ReportGenerator()
+    rg.STREAMING_ROW_THRESHOLD = 10
+
+    output = rg.generate(sample_project_orm, output_dir=str(tmp_path), auto_open=False)
+
+    doc = Document(output)
+    panel_rows = [
+        row
+        for table in doc.tables
+        for row in table.rows
+        if row.cells[1].text.startswith("panel ")
+    ]
+    assert len(panel_rows) == 40
+    assert rg._stream_writer is None
+    assert deferred and not any(isinstance(rows, list) for rows in deferred)
+
+
+def test_snapshot_report_matches_direct_generation(tmp_path, sample_project_orm):
+    """
+    Given: a detached snapshot of a project
+    When: the report is rendered from the snapshot
+    Then: it matches the report generated from the ORM project
+    """
+    rg = ReportGenerator()
+    snapshot = rg.create_snapshot(sample_project_orm)
+
+    direct_out = rg.generate(
+        sample_project_orm, output_dir=str(tmp_path / "direct"), auto_open=False
+    )
+    snapshot_out = ReportGenerator().generate_from_snapshot(
+        snapshot, output_dir=str(tmp_path / "snapshot")
+    )
+
+    direct_doc = Document(direct_out)
+    snapshot_doc = Document(snapshot_out)
+    assert _table_texts(snapshot_doc) == _table_texts(direct_doc)
+    assert [p.text for p in snapshot_doc.paragraphs] == [
+        p.text for p in direct_doc.paragraphs
+    ]
+    assert snapshot.project.order_number == "ORM001"
+
+
+def test_generate_reports_section_progress(tmp_path, sample_project_orm):
+    """
+    Given: a progress callback
+    When: generate is called
+    Then: every section is reported in order and progress ends at 100
+    """
+    progress = []
+    rg = ReportGenerator()
+
+    rg.generate(
+        sample_project_orm,
+        output_dir=str(tmp_path),
+        auto_open=False,
+        progress_callback=lambda percent, section: progress.append((percent, section)),
+    )
+
+    sections = [section for _, section in progress]
+    assert sections.index("HDF") < sections.index("AKCESORIA")
+    assert any(section.startswith("FRONTY") for section in sections)
+    percents = [percent for percent, _ in progress]
+    assert percents == sorted(percents)
+    assert progress[-1] == (100, "Zapisywanie")
+
+
+def test_generate_can_be_cancelled(tmp_path, sample_project_orm):
+    """
+    Given: a cancellation flag that is already set
+    When: generate is called
+    Then: ReportCancelledError is raised and no file is written
+    """
+    rg = ReportGenerator()
+
+    with pytest.raises(ReportCancelledError):
+        rg.generate(
+            sample_project_orm,
+            output_dir=str(tmp_path),
+            auto_open=False,
+            is_cancelled=lambda: True,
+        )
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_sheet_summary_section_is_optional(tmp_path, sample_project_orm):
+    """
+    Given: the sheet summary setting disabled, then enabled
+    When: generating reports
+    Then: the sheet requirement section appears only when enabled
+    """
+
+    class _FakeSettingsService:
+        enabled = False
+
+        def get_setting_value(self, key: str, default=None):
+            if key == "report_include_sheet_summary":
+                return self.enabled
+            return default
+
+    rg = ReportGenerator()
+    rg.settings_service = _FakeSettingsService()
+
+    without = rg.generate(
+        sample_project_orm, output_dir=str(tmp_path / "off"), auto_open=False
+    )
+    rg.settings_service.enabled = True
+    with_summary = rg.generate(
+        sample_project_orm, output_dir=str(tmp_path / "on"), auto_open=False
+    )
+
+    def headings(path):
+        return [
+            p.text for p in Document(path).paragraphs if p.style.name == "Heading 2"
+        ]
+
+    assert "ZAPOTRZEBOWANIE NA PŁYTY" not in headings(without)
+    assert "ZAPOTRZEBOWANIE NA PŁYTY" in headings(with_summary)
+    summary = Document(with_summary).tables[-1]
+    assert [c.text for c in summary.rows[0].cells][:3] == [
+        "Materiał",
+        "Kolor",
+        "Arkusze",
+    ]
+    assert all(row.cells[2].text == "1" for row in summary.rows[1:])
+
+
+def test_sheet_summary_uses_deep_nesting_when_enabled(
+    tmp_path, sample_project_orm, monkeypatch
+):
+    """
+    Given: the sheet summary with the deep nesting setting enabled
+    When: generating a report
+    Then: the nesting engine runs in deep mode within the time budget
+    """
+    from src.services import report_generator
+    from src.services.nesting import MODE_DEEP, NestingEngine
+
+    calls = []
+    nest_groups = NestingEngine.nest_groups
+
+    def _spy(self, rows, mode="fast", time_budget=2.0):
+        calls.append((mode, time_budget))
+        return nest_groups(self, rows, mode=mode, time_budget=0.05)
+
+    monkeypatch.setattr(NestingEngine, "nest_groups", _spy)
+
+    class _FakeSettingsService:
+        def get_setting_value(self, key: str, default=None):
+            if key in ("report_include_sheet_summary", "report_sheet_nesting_deep"):
+                return True
+            return default
+
+    rg = ReportGenerator()
+    rg.settings_service = _FakeSettingsService()
+    rg.generate(sample_project_orm, output_dir=str(tmp_path), auto_open=False)
+
+    assert calls == [(MODE_DEEP, report_generator.SHEET_NESTING_TIME_BUDGET)]
+
+
+def test_edge_banding_section_is_optional(tmp_path, sample_project_orm):
+    """
+    Given: the edge-banding setting disabled, then enabled
+    When: generating reports
+    Then: the OKLEINA section appears only when enabled
+    """
+
+    class _FakeSettingsService:
+        enabled = False
+
+        def get_setting_value(self, key: str, default=None):
+            if key == "report_include_edge_banding":
+                return self.enabled
+            return default
+
+    rg = ReportGenerator()
+    rg.settings_service = _FakeSettingsService()
+
+    without = rg.generate(
+        sample_project_orm, output_dir=str(tmp_path / "off"), auto_open=False
+    )
+    rg.settings_service.enabled = True
+    with_section = rg.generate(
+        sample_project_orm, output_dir=str(tmp_path / "on"), auto_open=False
+    )
+
+    def headings(path):
+        return [
+            p.text for p in Document(path).paragraphs if p.style.name == "Heading 2"
+        ]
+
+    assert "OKLEINA" not in headings(without)
+    assert "OKLEINA" in headings(with_section)
+    table = Document(with_section).tables[-1]
+    assert [c.text for c in table.rows[0].cells][:4] == [
+        "Kolor",
+        "D [m]",
+        "K [m]",
+        "Razem [m]",
+    ]
+    assert len(table.rows) > 1
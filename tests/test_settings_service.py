@@ -226,3 +226,76 @@ class TestSettingsService:
             settings_service.get_setting_value("nonexistent_project_setting", "default")
             == "default"
         )
+
+    def test_reads_are_served_from_snapshot(self, settings_service, sample_settings):
+        """Test that settings are loaded once and then read from memory."""
+        from sqlalchemy import event
+
+        from src.services.settings_service import SettingsService
+
+        # GIVEN
+        engine = settings_service.db.get_bind()
+        statements = []
+        settings_service.reload()
+
+        def _on_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", _on_execute)
+        try:
+            # WHEN
+            for _ in range(10):
+                settings_service.get_setting_value("max_cabinets")
+                SettingsService(settings_service.db).get_setting_value("debug_mode")
+            snapshot = settings_service.snapshot()
+        finally:
+            event.remove(engine, "before_cursor_execute", _on_execute)
+
+        # THEN
+        assert len(statements) == 1
+        assert snapshot["max_cabinets"] == 100
+        assert snapshot["default_thickness"] == 18.0
+
+    def test_changes_are_written_through_and_notified(self, settings_service):
+        """Test that listeners see changes made by any service instance."""
+        from src.services.settings_service import SettingsService
+
+        # GIVEN
+        changes = []
+        settings_service.subscribe(lambda key, value: changes.append((key, value)))
+        other = SettingsService(settings_service.db)
+
+        # WHEN
+        other.set_setting("dark_mode", True)
+        other.set_setting("dark_mode", True)
+        other.set_setting("dark_mode", False)
+        other.delete_setting("dark_mode")
+
+        # THEN
+        assert changes == [
+            ("dark_mode", True),
+            ("dark_mode", False),
+            ("dark_mode", None),
+        ]
+        assert settings_service.get_setting_value("dark_mode", "default") == "default"
+
+    def test_bound_method_listeners_are_held_weakly(self, settings_service):
+        """Test that a subscribed object can be garbage collected."""
+        import gc
+
+        class _Consumer:
+            def __init__(self):
+                self.values = []
+
+            def on_change(self, key, value):
+                self.values.append(value)
+
+        consumer = _Consumer()
+        settings_service.subscribe(consumer.on_change)
+        settings_service.set_setting("company_name", "Stolarnia")
+        assert consumer.values == ["Stolarnia"]
+
+        del consumer
+        gc.collect()
+        settings_service.set_setting("company_name", "Stolarnia 2")
+        assert settings_service.get_setting_value("company_name") == "Stolarnia 2"
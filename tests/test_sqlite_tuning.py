@@ -0,0 +1,113 @@
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.app.database import create_session
+from src.app.sqlite_tuning import (
+    PRESET_FAST,
+    PRESET_SAFE,
+    PRESET_SETTING_KEY,
+    PRESETS,
+    SqlitePragmas,
+    check_active_pragmas,
+    create_sqlite_engine,
+    pragma_mismatches,
+    resolve_pragmas,
+)
+from src.db_schema.orm_models import Base
+from src.services.settings_service import SettingsService
+
+
+def _create_file_db(db_path: Path, preset: str = None) -> None:
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(engine)
+    if preset:
+        session = sessionmaker(bind=engine)()
+        SettingsService(session).set_setting(PRESET_SETTING_KEY, preset)
+        session.close()
+    engine.dispose()
+
+
+def test_create_session_applies_default_preset(tmp_path):
+    """
+    Given: a database without a preset setting
+    When: creating the application session
+    Then: every connection runs in WAL mode with the balanced pragmas
+    """
+    db_path = tmp_path / "tuned.db"
+    _create_file_db(db_path)
+
+    session = create_session(db_path)
+    try:
+        active = session.info["sqlite_pragmas"]
+        assert active["journal_mode"] == "WAL"
+        assert active["synchronous"] == "NORMAL"
+        assert active["temp_store"] == "MEMORY"
+        assert active["cache_size"] == SqlitePragmas().cache_size
+    finally:
+        session.close()
+        session.get_bind().dispose()
+
+
+def test_create_session_uses_preset_from_settings(tmp_path, monkeypatch):
+    """
+    Given: the "Bezpieczny" preset stored in settings
+    When: creating the application session
+    Then: the rollback journal and full sync are used, and the preset is
+    read through the application engine instead of a second one
+    """
+    import src.app.sqlite_tuning as sqlite_tuning
+
+    db_path = tmp_path / "safe.db"
+    _create_file_db(db_path, preset=PRESET_SAFE)
+    engines = []
+    create = sqlite_tuning.create_engine
+
+    def _counting_create_engine(*args, **kwargs):
+        engines.append(args)
+        return create(*args, **kwargs)
+
+    monkeypatch.setattr(sqlite_tuning, "create_engine", _counting_create_engine)
+
+    session = create_session(db_path)
+    try:
+        active = session.info["sqlite_pragmas"]
+        assert active["journal_mode"] == "DELETE"
+        assert active["synchronous"] == "FULL"
+        assert active["mmap_size"] == 0
+        assert len(engines) == 1
+    finally:
+        session.close()
+        session.get_bind().dispose()
+
+
+def test_network_share_disables_wal_and_mmap():
+    pragmas = resolve_pragmas(
+        Path("//server/share/cabplanner.db"), PRESETS[PRESET_FAST]
+    )
+
+    assert pragmas.journal_mode == "TRUNCATE"
+    assert pragmas.mmap_size == 0
+    assert pragmas.synchronous == PRESETS[PRESET_FAST].synchronous
+
+
+def test_startup_check_reports_pragmas_not_applied(tmp_path):
+    """
+    Given: an engine whose actual pragmas differ from the expected ones
+    When: running the startup check
+    Then: the mismatching settings are reported
+    """
+    db_path = tmp_path / "check.db"
+    _create_file_db(db_path)
+    engine = create_sqlite_engine(db_path, PRESETS[PRESET_SAFE])
+
+    active = check_active_pragmas(engine, SqlitePragmas())
+    engine.dispose()
+
+    assert pragma_mismatches(active, SqlitePragmas()) == {
+        "journal_mode": ("DELETE", "WAL"),
+        "synchronous": ("FULL", "NORMAL"),
+        "temp_store": ("DEFAULT", "MEMORY"),
+    }
+    assert pragma_mismatches(active, PRESETS[PRESET_SAFE]) == {}